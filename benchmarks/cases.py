@@ -0,0 +1,135 @@
+"""Benchmark cases for the hot paths of the client.
+
+Inputs come from the seeded synthetic dataset, so numbers are comparable
+between runs and machines differ only in speed, not in workload.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from functools import partial
+from http import HTTPMethod
+from typing import Any, Callable, Iterable
+
+import httpx
+
+from harness import Benchmark
+
+from otrs_gi_core.clients.generic_interface_client import GenericInterfaceClient
+from otrs_gi_core.clients.hooks import RequestHook
+from otrs_gi_core.domain_models.basic_auth_model import BasicAuth
+from otrs_gi_core.domain_models.client_config import ClientConfig
+from otrs_gi_core.domain_models.ticket_models import IdName, TicketSearch
+from otrs_gi_core.domain_models.ticket_operation import TicketOperation
+from otrs_gi_core.mappers import from_ws_ticket_detail, to_ws_ticket_search
+from otrs_gi_core.models.response_models import WsTicketGetResponse
+from otrs_gi_core.models.ticket_models import WsTicketOutput
+from otrs_gi_core.setup.webservices.builder import WebserviceBuilder
+from otrs_gi_core.testing import FakeGenericInterface
+from otrs_gi_core.testing.dataset import DatasetConfig, generate_raw_tickets
+from otrs_gi_core.testing.fake_server import DEFAULT_OPERATION_URL_MAP
+
+DATASET = DatasetConfig(tickets=20, seed=47, attachment_rate=0.0)
+FAN_OUT = 20
+CLI_STARTUP_TARGET_US = 100_000
+
+
+def _raw_tickets() -> list[dict[str, Any]]:
+    return list(generate_raw_tickets(DATASET))
+
+
+def make_client(
+        transport: httpx.AsyncBaseTransport,
+        base_url: str = "https://bench.invalid/otrs",
+        hooks: Iterable[RequestHook] = (),
+) -> GenericInterfaceClient:
+    config = ClientConfig(
+        base_url=base_url,
+        webservice_name="FakeWebservice",
+        operation_url_map=DEFAULT_OPERATION_URL_MAP,
+    )
+    client = GenericInterfaceClient(config, client=httpx.AsyncClient(transport=transport), hooks=hooks)
+    client.login(BasicAuth(user_login="bench", password="bench"))
+    return client
+
+
+def setup_from_ws_ticket_detail() -> Callable[[], Any]:
+    tickets = [WsTicketOutput.model_validate(raw) for raw in _raw_tickets()]
+    return lambda: [from_ws_ticket_detail(t) for t in tickets]
+
+
+def setup_to_ws_ticket_search() -> Callable[[], Any]:
+    search = TicketSearch(
+        titles=["%printer%"],
+        queues=[IdName(name="Raw"), IdName(id=3)],
+        states=[IdName(name="new"), IdName(name="open")],
+        priorities=[IdName(id=3)],
+        customer_users=["customer-1@example.org"],
+        limit=100,
+    )
+    return lambda: to_ws_ticket_search(search)
+
+
+def setup_validate_ticket_get_response() -> Callable[[], Any]:
+    body = json.dumps({"Ticket": _raw_tickets()}).encode()
+    return lambda: WsTicketGetResponse.model_validate_json(body)
+
+
+def setup_send(hooks: Iterable[RequestHook] = ()) -> Callable[[], Any]:
+    body = json.dumps({"Ticket": _raw_tickets()[:1]}).encode()
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+    )
+    client = make_client(transport, hooks=hooks)
+    request = {"TicketID": 1, "AllArticles": 1}
+
+    async def send() -> WsTicketGetResponse:
+        return await client._send(HTTPMethod.POST, TicketOperation.GET, WsTicketGetResponse, request)
+
+    return send
+
+
+def setup_search_and_get(hooks: Iterable[RequestHook] = ()) -> Callable[[], Any]:
+    server = FakeGenericInterface()
+    server.store.insert_many(generate_raw_tickets(DATASET))
+    client = make_client(server.mock_transport(), server.base_url(), hooks)
+    search = TicketSearch(limit=FAN_OUT)
+    return lambda: client.search_and_get(search)
+
+
+def setup_webservice_build_dump_yaml() -> Callable[[], Any]:
+    def build() -> str:
+        builder = WebserviceBuilder("Bench").enable_operations(*TicketOperation)
+        return builder.dump_yaml(builder.build())
+
+    return build
+
+
+def setup_cli_help(package: str) -> Callable[[], Any]:
+    """``<package>-cli --help`` in a fresh interpreter, i.e. the start-up time a shell user waits for."""
+    command = [
+        sys.executable, "-c", f"from {package}.cli import app; app(['--help'], prog_name='{package}-cli')",
+    ]
+    return lambda: subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+
+
+BENCHMARKS = [
+    Benchmark("mappers.from_ws_ticket_detail", setup_from_ws_ticket_detail,
+              description=f"map {DATASET.tickets} validated tickets to domain tickets"),
+    Benchmark("mappers.to_ws_ticket_search", setup_to_ws_ticket_search,
+              description="map a search with several filters"),
+    Benchmark("models.WsTicketGetResponse", setup_validate_ticket_get_response,
+              description=f"validate a TicketGet response body with {DATASET.tickets} tickets"),
+    Benchmark("client._send", setup_send, is_async=True, accepts_hooks=True,
+              description="one TicketGet round trip through httpx.MockTransport"),
+    Benchmark("client.search_and_get", setup_search_and_get, is_async=True, accepts_hooks=True,
+              description=f"search plus {FAN_OUT} concurrent gets against the fake GenericInterface"),
+    Benchmark("setup.WebserviceBuilder", setup_webservice_build_dump_yaml,
+              description="build a webservice with all operations and dump it as YAML"),
+    Benchmark("cli.otobo_help", partial(setup_cli_help, "otobo"), target_us=CLI_STARTUP_TARGET_US,
+              trace_allocations=False, description="otobo-cli --help in a new interpreter"),
+    Benchmark("cli.znuny_help", partial(setup_cli_help, "znuny"), target_us=CLI_STARTUP_TARGET_US,
+              trace_allocations=False, description="znuny-cli --help in a new interpreter"),
+]
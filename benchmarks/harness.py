@@ -0,0 +1,243 @@
+"""Minimal benchmark harness: calibrated timing, tracemalloc allocations, peak RSS and baselines."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import json
+import math
+import platform
+import resource
+import statistics
+import sys
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Optional, Union
+
+Operation = Union[Callable[[], Any], Callable[[], Awaitable[Any]]]
+
+RETAINED_SLACK_BYTES = 1024
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """One benchmark case; ``setup`` returns the operation to measure.
+
+    ``is_async`` operations are awaited inside a single event loop, so the
+    loop start-up is not part of the measurement. ``accepts_hooks`` marks
+    client cases whose ``setup`` takes ``hooks``, which memory profiling uses.
+    ``target_us`` is an absolute budget for the mean time per op, and
+    ``trace_allocations=False`` skips the tracemalloc pass for cases whose work
+    happens in another process.
+    """
+
+    name: str
+    setup: Callable[..., Operation]
+    is_async: bool = False
+    description: str = ""
+    accepts_hooks: bool = False
+    target_us: Optional[float] = None
+    trace_allocations: bool = True
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    ops_per_sec: float
+    mean_us: float
+    stdev_us: float
+    rounds: int
+    iterations: int
+    retained_bytes_per_op: float
+    retained_blocks_per_op: float
+    peak_alloc_bytes: int
+    peak_rss_bytes: int
+    extra: dict[str, Any] = field(default_factory=dict)
+
+
+def peak_rss_bytes() -> int:
+    """Peak resident set size of this process so far."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class _Runner:
+    def __init__(self, benchmark: Benchmark, operation: Operation):
+        self.benchmark = benchmark
+        self.operation = operation
+        self.loop = asyncio.new_event_loop() if benchmark.is_async else None
+
+    def run(self, iterations: int) -> float:
+        """Run ``iterations`` operations and return the elapsed seconds."""
+        if self.loop is not None:
+            return self.loop.run_until_complete(self._run_async(iterations))
+        operation = self.operation
+        started = perf_counter()
+        for _ in range(iterations):
+            operation()
+        return perf_counter() - started
+
+    async def _run_async(self, iterations: int) -> float:
+        operation = self.operation
+        started = perf_counter()
+        for _ in range(iterations):
+            await operation()
+        return perf_counter() - started
+
+    def close(self) -> None:
+        if self.loop is not None:
+            self.loop.close()
+
+
+def _calibrate(runner: _Runner, min_time: float) -> int:
+    iterations = 1
+    while True:
+        elapsed = runner.run(iterations)
+        if elapsed >= min_time / 10 or iterations >= 1 << 24:
+            break
+        iterations *= 10 if elapsed < min_time / 100 else 2
+    return max(1, int(iterations * (min_time / max(elapsed, 1e-9))))
+
+
+def _allocations(runner: _Runner, iterations: int) -> tuple[float, float, int]:
+    """Bytes and blocks still alive per op after ``iterations`` ops, and the peak traced size above the start."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        runner.run(iterations)
+        peak = tracemalloc.get_traced_memory()[1] - base
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    stats = after.compare_to(before, "lineno")
+    grown = [s for s in stats if s.size_diff > 0]
+    size = sum(s.size_diff for s in grown)
+    blocks = sum(s.count_diff for s in grown)
+    return size / iterations, blocks / iterations, peak
+
+
+def run_benchmark(benchmark: Benchmark, *, rounds: int = 5, min_time: float = 0.2,
+                  alloc_iterations: int = 50) -> BenchmarkResult:
+    """Time ``rounds`` calibrated rounds, then trace allocations over ``alloc_iterations`` ops.
+
+    The allocation pass uses a fixed op count so that results stay comparable
+    with a baseline even when calibration picks a different iteration count.
+
+    ``retained_bytes_per_op`` is memory still alive after the traced ops (caches,
+    leaks); short-lived garbage only shows up in ``peak_alloc_bytes``.
+    """
+    runner = _Runner(benchmark, benchmark.setup())
+    try:
+        runner.run(1)  # warm-up: imports, caches, pydantic schema compilation
+        iterations = _calibrate(runner, min_time)
+        per_op = [runner.run(iterations) / iterations for _ in range(rounds)]
+        retained_bytes, retained_blocks, peak = (
+            _allocations(runner, alloc_iterations) if benchmark.trace_allocations else (0.0, 0.0, 0)
+        )
+    finally:
+        runner.close()
+    best = min(per_op)
+    extra: dict[str, Any] = {} if benchmark.target_us is None else {"target_us": benchmark.target_us}
+    return BenchmarkResult(
+        name=benchmark.name,
+        ops_per_sec=1 / best,
+        mean_us=statistics.fmean(per_op) * 1e6,
+        stdev_us=(statistics.stdev(per_op) if len(per_op) > 1 else 0.0) * 1e6,
+        rounds=rounds,
+        iterations=iterations,
+        retained_bytes_per_op=retained_bytes,
+        retained_blocks_per_op=retained_blocks,
+        peak_alloc_bytes=peak,
+        peak_rss_bytes=peak_rss_bytes(),
+        extra=extra,
+    )
+
+
+def profile_memory_stages(benchmark: Benchmark, iterations: int = 50) -> dict[str, dict[str, float]]:
+    """Bytes per call and client stage (see ``MemoryProfiler``) over ``iterations`` ops of a client case."""
+    from otrs_gi_core.clients.memory_profiling import STAGES, MemoryProfiler
+
+    profiler = MemoryProfiler()
+    runner = _Runner(benchmark, benchmark.setup(hooks=[profiler]))
+    try:
+        runner.run(1)
+        profiler.reset()
+        with profiler:
+            runner.run(iterations)
+    finally:
+        runner.close()
+    return {
+        operation: {stage: stats.per_call(stage) for stage in STAGES} | {"peak": stats.peak}
+        for operation, stats in profiler.report().operations.items()
+    }
+
+
+def environment() -> dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+    }
+
+
+def save_results(path: Path, results: list[BenchmarkResult]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"environment": environment(), "results": {r.name: asdict(r) for r in results}}
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def load_results(path: Path) -> dict[str, dict[str, Any]]:
+    return json.loads(path.read_text(encoding="utf-8"))["results"]
+
+
+@dataclass(frozen=True)
+class Comparison:
+    name: str
+    metric: str
+    baseline: float
+    current: float
+    change: float
+    regressed: bool
+
+
+def compare(results: list[BenchmarkResult], baseline: dict[str, dict[str, Any]], threshold: float = 0.1,
+            retained_threshold: Optional[float] = None) -> list[Comparison]:
+    """Compare throughput (higher is better) and retained bytes per op (lower is better) with a baseline.
+
+    ``change`` is relative to the baseline; a throughput drop or retained
+    memory growth of more than 1 KiB beyond the threshold is a regression. A case
+    whose baseline retains nothing regresses once it retains more than 1 KiB per op.
+    Cases missing from the baseline are skipped.
+    """
+    retained_threshold = threshold if retained_threshold is None else retained_threshold
+    comparisons = []
+    for result in results:
+        old = baseline.get(result.name)
+        if old is None:
+            continue
+        throughput_change = result.ops_per_sec / old["ops_per_sec"] - 1
+        comparisons.append(Comparison(
+            result.name, "ops_per_sec", old["ops_per_sec"], result.ops_per_sec, throughput_change,
+            throughput_change < -threshold,
+        ))
+        old_retained = old["retained_bytes_per_op"]
+        retained = result.retained_bytes_per_op
+        grown = retained - old_retained > RETAINED_SLACK_BYTES
+        if old_retained > 0:
+            retained_change = retained / old_retained - 1
+            regressed = retained_change > retained_threshold and grown
+        elif retained > 0:
+            retained_change, regressed = math.inf, grown
+        else:
+            continue
+        comparisons.append(Comparison(
+            result.name, "retained_bytes_per_op", old_retained, retained, retained_change, regressed,
+        ))
+    return comparisons
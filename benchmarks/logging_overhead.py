@@ -0,0 +1,93 @@
+"""Measure what client logging costs per request at different log levels.
+
+Runs ``get_ticket`` against an in-memory ``httpx.MockTransport`` and compares
+the per-request time with logging disabled against INFO (the default
+production level), DEBUG and sampled DEBUG. At 1,000 req/s each request has a
+1 ms budget; the report shows the share of it spent on logging.
+
+    python benchmarks/logging_overhead.py --requests 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+from time import perf_counter
+
+import httpx
+
+from otrs_gi_core.clients.generic_interface_client import GenericInterfaceClient
+from otrs_gi_core.domain_models.basic_auth_model import BasicAuth
+from otrs_gi_core.domain_models.client_config import ClientConfig
+from otrs_gi_core.domain_models.ticket_operation import TicketOperation
+
+BUDGET_PER_REQUEST = 1e-3  # 1,000 req/s
+
+RESPONSE = json.dumps({"Ticket": [{"TicketID": 1, "Title": "benchmark"}]}).encode()
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, content=RESPONSE, headers={"Content-Type": "application/json"})
+
+
+def make_client(sample_rate: float) -> GenericInterfaceClient:
+    config = ClientConfig(
+        base_url="https://example.org/otrs",
+        webservice_name="Bench",
+        operation_url_map={TicketOperation.GET: "get"},
+    )
+    client = GenericInterfaceClient(
+        config,
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        debug_log_sample_rate=sample_rate,
+    )
+    client.login(BasicAuth(user_login="bench", password="bench"))
+    return client
+
+
+async def seconds_per_request(client: GenericInterfaceClient, requests: int) -> float:
+    for _ in range(min(requests, 200)):
+        await client.get_ticket(1)
+    started = perf_counter()
+    for _ in range(requests):
+        await client.get_ticket(1)
+    return (perf_counter() - started) / requests
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=10_000)
+    parser.add_argument("--rounds", type=int, default=5, help="best of N interleaved rounds per level")
+    args = parser.parse_args()
+
+    logger = logging.getLogger("otrs_gi_core.clients.generic_interface_client")
+    logger.propagate = False
+    logger.addHandler(logging.NullHandler())
+    scenarios = [
+        ("disabled", logging.CRITICAL + 1, 1.0),
+        ("INFO", logging.INFO, 1.0),
+        ("DEBUG sampled 1%", logging.DEBUG, 0.01),
+        ("DEBUG", logging.DEBUG, 1.0),
+    ]
+
+    best = {name: float("inf") for name, _, _ in scenarios}
+    for _ in range(args.rounds):
+        for name, level, sample_rate in scenarios:
+            logger.setLevel(level)
+            async with make_client(sample_rate) as client:
+                best[name] = min(best[name], await seconds_per_request(client, args.requests))
+
+    baseline = best["disabled"]
+    print(f"{'level':<18} {'us/request':>11} {'overhead us':>12} {'of 1 ms budget':>15}")
+    for name, per_request in best.items():
+        overhead = per_request - baseline
+        print(
+            f"{name:<18} {per_request * 1e6:>11.1f} {overhead * 1e6:>12.2f} "
+            f"{overhead / BUDGET_PER_REQUEST:>14.2%}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
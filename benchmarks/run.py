@@ -0,0 +1,117 @@
+"""Run the benchmark suite, optionally saving a baseline or comparing against one.
+
+    python benchmarks/run.py                                  # run and print
+    python benchmarks/run.py --save benchmarks/baseline.json  # record a baseline
+    python benchmarks/run.py --compare benchmarks/baseline.json --threshold 0.15
+
+With ``--compare`` the exit status is 1 when any case lost more than
+``--threshold`` of its throughput or grew its retained allocations by more
+than that share, so the command can gate CI. Baselines are only meaningful
+on the machine they were recorded on. Cases with an absolute target (CLI
+start-up) are reported against it; ``--check-targets`` fails on a miss.
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+from cases import BENCHMARKS
+from harness import BenchmarkResult, compare, load_results, profile_memory_stages, run_benchmark, save_results
+
+
+def _format_bytes(value: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(value) < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
+
+
+def _misses_target(result: BenchmarkResult) -> bool:
+    return "target_us" in result.extra and result.mean_us > result.extra["target_us"]
+
+
+def print_results(results: list[BenchmarkResult]) -> None:
+    print(f"{'benchmark':<32} {'ops/s':>10} {'mean us':>10} {'+-':>7} {'retained/op':>10} {'peak alloc':>11}")
+    for r in results:
+        print(
+            f"{r.name:<32} {r.ops_per_sec:>10,.0f} {r.mean_us:>10.1f} {r.stdev_us:>7.1f} "
+            f"{_format_bytes(r.retained_bytes_per_op):>10} {_format_bytes(r.peak_alloc_bytes):>11}"
+        )
+    if results:
+        print(f"peak RSS: {_format_bytes(max(r.peak_rss_bytes for r in results))}")
+    targeted = [r for r in results if "target_us" in r.extra]
+    if targeted:
+        print(f"\n{'benchmark':<32} {'mean ms':>10} {'target ms':>10}")
+    for r in targeted:
+        flag = "  OVER TARGET" if _misses_target(r) else ""
+        print(f"{r.name:<32} {r.mean_us / 1000:>10.1f} {r.extra['target_us'] / 1000:>10.1f}{flag}")
+    profiled = [r for r in results if "memory_stages" in r.extra]
+    if profiled:
+        print(f"\n{'bytes per call':<32} {'operation':<13} {'raw_json':>9} {'ws_models':>10} {'domain':>9} "
+              f"{'articles':>9} {'peak':>9}")
+    for r in profiled:
+        for operation, stages in r.extra["memory_stages"].items():
+            print(
+                f"{r.name:<32} {operation:<13} {stages['raw_json']:>9,.0f} {stages['ws_models']:>10,.0f} "
+                f"{stages['domain_models']:>9,.0f} {stages['articles']:>9,.0f} {stages['peak']:>9,}"
+            )
+    if profiled:
+        print("stages are net bytes and can be negative; articles is the getsizeof size of the mapped articles")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", "--filter", default="*", help="glob on benchmark names, e.g. 'mappers.*'")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per round")
+    parser.add_argument("--save", type=Path, help="write results as a baseline JSON file")
+    parser.add_argument("--compare", type=Path, help="compare with a baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=0.1, help="allowed relative regression")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--list", action="store_true", help="list benchmarks and exit")
+    parser.add_argument("--memory-stages", action="store_true",
+                        help="also profile client cases per stage (raw JSON, Ws models, domain models, articles)")
+    parser.add_argument("--check-targets", action="store_true",
+                        help="exit with 1 when a case misses its absolute target, e.g. CLI start-up")
+    args = parser.parse_args(argv)
+
+    selected = [b for b in BENCHMARKS if fnmatch.fnmatch(b.name, args.filter)]
+    if args.list:
+        for benchmark in selected:
+            print(f"{benchmark.name:<32} {benchmark.description}")
+        return 0
+
+    results = []
+    for benchmark in selected:
+        result = run_benchmark(benchmark, rounds=args.rounds, min_time=args.min_time)
+        if args.memory_stages and benchmark.accepts_hooks:
+            result.extra["memory_stages"] = profile_memory_stages(benchmark)
+        results.append(result)
+        if not args.json:
+            print(f"ran {benchmark.name}", file=sys.stderr)
+    if args.json:
+        print(json.dumps([asdict(r) for r in results], indent=2))
+    else:
+        print_results(results)
+    if args.save:
+        save_results(args.save, results)
+    missed_target = args.check_targets and any(_misses_target(r) for r in results)
+    if not args.compare:
+        return 1 if missed_target else 0
+
+    comparisons = compare(results, load_results(args.compare), args.threshold)
+    print(f"\n{'benchmark':<32} {'metric':<20} {'baseline':>12} {'current':>12} {'change':>8}")
+    for c in comparisons:
+        flag = "  REGRESSION" if c.regressed else ""
+        print(f"{c.name:<32} {c.metric:<20} {c.baseline:>12,.1f} {c.current:>12,.1f} {c.change:>+8.1%}{flag}")
+    return 1 if missed_target or any(c.regressed for c in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
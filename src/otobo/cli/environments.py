@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from otrs_gi_core.cli.environments import HostSystem, detect_system
+if TYPE_CHECKING:
+    from otrs_gi_core.cli.environments import HostSystem
 
 DEFAULT_CONSOLE_PATHS = (Path("/opt/otobo/bin/otobo.Console.pl"),)
 DEFAULT_WEBSERVICE_PATHS = (Path("/opt/otobo/var/webservices"),)
@@ -14,6 +16,8 @@ DEFAULT_DOCKER_WEBSERVICES_PATH = Path(
 
 
 def detect_otobo_system() -> HostSystem | None:
+    from otrs_gi_core.cli.environments import detect_system
+
     return detect_system(
         console_paths=DEFAULT_CONSOLE_PATHS,
         webservice_paths=DEFAULT_WEBSERVICE_PATHS,
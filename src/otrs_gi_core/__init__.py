@@ -1,46 +1,165 @@
 """Shared OTRS GenericInterface core for OTOBO and Znuny Python SDKs."""
 
-from otrs_gi_core.clients.generic_interface_client import GenericInterfaceClient
-from otrs_gi_core.cli.command_runner import ConsoleCommandRunner
-from otrs_gi_core.cli.system_console import SystemConsole
-from otrs_gi_core.domain_models.basic_auth_model import BasicAuth
-from otrs_gi_core.domain_models.client_config import ClientConfig, OperationUrlMap
-from otrs_gi_core.domain_models.ticket_models import (
-    Article,
-    IdName,
-    Ticket,
-    TicketBase,
-    TicketCreate,
-    TicketSearch,
-    TicketUpdate,
-)
-from otrs_gi_core.domain_models.ticket_operation import TicketOperation
-from otrs_gi_core.setup.bootstrap import generate_random_password, setup_host_system
-from otrs_gi_core.setup.webservices import (
-    SUPPORTED_OPERATION_SPECS,
-    SUPPORTED_OPERATIONS_DOC,
-    WebserviceBuilder,
-)
-from otrs_gi_core.util.errors import GenericInterfaceError
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from otrs_gi_core.util.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from otrs_gi_core.clients.generic_interface_client import GenericInterfaceClient
+    from otrs_gi_core.cli.async_system_console import AsyncSystemConsole
+    from otrs_gi_core.cli.command_runner import ConsoleCommandRunner
+    from otrs_gi_core.cli.system_console import SystemConsole
+    from otrs_gi_core.clients.article_cursor import (
+        ArticleCursorStore,
+        InMemoryArticleCursorStore,
+        JsonFileArticleCursorStore,
+    )
+    from otrs_gi_core.clients.hooks import (
+        RequestEvent,
+        RequestHook,
+        RequestMemory,
+        RequestTimings,
+    )
+    from otrs_gi_core.clients.memory_profiling import (
+        MemoryProfiler,
+        MemoryReport,
+        StageMemory,
+    )
+    from otrs_gi_core.clients.metrics import (
+        ClientMetrics,
+        MetricsSnapshot,
+        OperationStats,
+    )
+    from otrs_gi_core.clients.tracing import (
+        JsonLinesSpanExporter,
+        OpenTelemetrySpanExporter,
+        Span,
+        SpanExporter,
+        Tracer,
+    )
+    from otrs_gi_core.domain_models.basic_auth_model import BasicAuth
+    from otrs_gi_core.domain_models.client_config import ClientConfig, OperationUrlMap
+    from otrs_gi_core.domain_models.dynamic_fields import DynamicFieldSchema, DynamicFieldType
+    from otrs_gi_core.domain_models.ticket_models import (
+        Article,
+        Attachment,
+        IdName,
+        Ticket,
+        TicketBase,
+        TicketCreate,
+        TicketSearch,
+        TicketUpdate,
+    )
+    from otrs_gi_core.domain_models.ticket_operation import TicketOperation
+    from otrs_gi_core.domain_models.ticket_record import TicketRecord
+    from otrs_gi_core.setup.bootstrap import generate_random_password, setup_host_system
+    from otrs_gi_core.setup.webservices import (
+        SUPPORTED_OPERATION_SPECS,
+        SUPPORTED_OPERATIONS_DOC,
+        WebserviceBuilder,
+    )
+    from otrs_gi_core.util.attachments import AttachmentSink, DirectoryAttachmentSink, SpillingAttachmentSink
+    from otrs_gi_core.util.errors import GenericInterfaceError, ResponseTooLargeError
+
+_EXPORTS: dict[str, tuple[str, str]] = {
+    "Article": ("otrs_gi_core.domain_models.ticket_models", "Article"),
+    "ArticleCursorStore": ("otrs_gi_core.clients.article_cursor", "ArticleCursorStore"),
+    "AsyncSystemConsole": ("otrs_gi_core.cli.async_system_console", "AsyncSystemConsole"),
+    "Attachment": ("otrs_gi_core.domain_models.ticket_models", "Attachment"),
+    "AttachmentSink": ("otrs_gi_core.util.attachments", "AttachmentSink"),
+    "BasicAuth": ("otrs_gi_core.domain_models.basic_auth_model", "BasicAuth"),
+    "ClientConfig": ("otrs_gi_core.domain_models.client_config", "ClientConfig"),
+    "ClientMetrics": ("otrs_gi_core.clients.metrics", "ClientMetrics"),
+    "DirectoryAttachmentSink": ("otrs_gi_core.util.attachments", "DirectoryAttachmentSink"),
+    "DynamicFieldSchema": ("otrs_gi_core.domain_models.dynamic_fields", "DynamicFieldSchema"),
+    "DynamicFieldType": ("otrs_gi_core.domain_models.dynamic_fields", "DynamicFieldType"),
+    "ConsoleCommandRunner": ("otrs_gi_core.cli.command_runner", "ConsoleCommandRunner"),
+    "GenericInterfaceClient": ("otrs_gi_core.clients.generic_interface_client", "GenericInterfaceClient"),
+    "GenericInterfaceError": ("otrs_gi_core.util.errors", "GenericInterfaceError"),
+    "IdName": ("otrs_gi_core.domain_models.ticket_models", "IdName"),
+    "InMemoryArticleCursorStore": ("otrs_gi_core.clients.article_cursor", "InMemoryArticleCursorStore"),
+    "JsonFileArticleCursorStore": ("otrs_gi_core.clients.article_cursor", "JsonFileArticleCursorStore"),
+    "JsonLinesSpanExporter": ("otrs_gi_core.clients.tracing", "JsonLinesSpanExporter"),
+    "MemoryProfiler": ("otrs_gi_core.clients.memory_profiling", "MemoryProfiler"),
+    "MemoryReport": ("otrs_gi_core.clients.memory_profiling", "MemoryReport"),
+    "MetricsSnapshot": ("otrs_gi_core.clients.metrics", "MetricsSnapshot"),
+    "OpenTelemetrySpanExporter": ("otrs_gi_core.clients.tracing", "OpenTelemetrySpanExporter"),
+    "OperationStats": ("otrs_gi_core.clients.metrics", "OperationStats"),
+    "OperationUrlMap": ("otrs_gi_core.domain_models.client_config", "OperationUrlMap"),
+    "RequestEvent": ("otrs_gi_core.clients.hooks", "RequestEvent"),
+    "RequestHook": ("otrs_gi_core.clients.hooks", "RequestHook"),
+    "RequestMemory": ("otrs_gi_core.clients.hooks", "RequestMemory"),
+    "RequestTimings": ("otrs_gi_core.clients.hooks", "RequestTimings"),
+    "ResponseTooLargeError": ("otrs_gi_core.util.errors", "ResponseTooLargeError"),
+    "SUPPORTED_OPERATION_SPECS": ("otrs_gi_core.setup.webservices", "SUPPORTED_OPERATION_SPECS"),
+    "SUPPORTED_OPERATIONS_DOC": ("otrs_gi_core.setup.webservices", "SUPPORTED_OPERATIONS_DOC"),
+    "Span": ("otrs_gi_core.clients.tracing", "Span"),
+    "SpanExporter": ("otrs_gi_core.clients.tracing", "SpanExporter"),
+    "SpillingAttachmentSink": ("otrs_gi_core.util.attachments", "SpillingAttachmentSink"),
+    "StageMemory": ("otrs_gi_core.clients.memory_profiling", "StageMemory"),
+    "SystemConsole": ("otrs_gi_core.cli.system_console", "SystemConsole"),
+    "Ticket": ("otrs_gi_core.domain_models.ticket_models", "Ticket"),
+    "TicketBase": ("otrs_gi_core.domain_models.ticket_models", "TicketBase"),
+    "TicketCreate": ("otrs_gi_core.domain_models.ticket_models", "TicketCreate"),
+    "TicketOperation": ("otrs_gi_core.domain_models.ticket_operation", "TicketOperation"),
+    "TicketRecord": ("otrs_gi_core.domain_models.ticket_record", "TicketRecord"),
+    "TicketSearch": ("otrs_gi_core.domain_models.ticket_models", "TicketSearch"),
+    "TicketUpdate": ("otrs_gi_core.domain_models.ticket_models", "TicketUpdate"),
+    "Tracer": ("otrs_gi_core.clients.tracing", "Tracer"),
+    "WebserviceBuilder": ("otrs_gi_core.setup.webservices", "WebserviceBuilder"),
+    "generate_random_password": ("otrs_gi_core.setup.bootstrap", "generate_random_password"),
+    "setup_host_system": ("otrs_gi_core.setup.bootstrap", "setup_host_system"),
+}
+
+__getattr__, __dir__ = lazy_exports(globals(), _EXPORTS)
 
 __all__ = [
     "Article",
+    "ArticleCursorStore",
+    "AsyncSystemConsole",
+    "Attachment",
+    "AttachmentSink",
     "BasicAuth",
     "ClientConfig",
+    "ClientMetrics",
+    "DirectoryAttachmentSink",
+    "DynamicFieldSchema",
+    "DynamicFieldType",
     "ConsoleCommandRunner",
     "GenericInterfaceClient",
     "GenericInterfaceError",
     "IdName",
+    "InMemoryArticleCursorStore",
+    "JsonFileArticleCursorStore",
+    "JsonLinesSpanExporter",
+    "MemoryProfiler",
+    "MemoryReport",
+    "MetricsSnapshot",
+    "OpenTelemetrySpanExporter",
+    "OperationStats",
     "OperationUrlMap",
+    "RequestEvent",
+    "RequestHook",
+    "RequestMemory",
+    "RequestTimings",
+    "ResponseTooLargeError",
     "SUPPORTED_OPERATION_SPECS",
     "SUPPORTED_OPERATIONS_DOC",
+    "Span",
+    "SpanExporter",
+    "SpillingAttachmentSink",
+    "StageMemory",
     "SystemConsole",
     "Ticket",
     "TicketBase",
     "TicketCreate",
     "TicketOperation",
+    "TicketRecord",
     "TicketSearch",
     "TicketUpdate",
+    "Tracer",
     "WebserviceBuilder",
     "generate_random_password",
     "setup_host_system",
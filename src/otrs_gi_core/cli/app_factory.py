@@ -1,16 +1,27 @@
 from __future__ import annotations
 
-from typing import Callable, Iterable, List, Optional
+import os
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional
 
 import typer
 
-from otrs_gi_core.cli.environments import HostSystem
-from otrs_gi_core.cli.system_console import SystemConsole
-from otrs_gi_core.cli.command_models import Permission
 from otrs_gi_core.domain_models.ticket_operation import TicketOperation
-from otrs_gi_core.models.base_models import GroupConfig, QueueConfig, UserModel
-from otrs_gi_core.setup.bootstrap import generate_random_password, setup_host_system
-from otrs_gi_core.setup.config import SetupConfig
+
+# Only typer and the standard library are imported at module level so that
+# `--help` stays fast; each command imports the setup stack, pydantic models
+# and the HTTP client it needs inside its body.
+if TYPE_CHECKING:
+    from otrs_gi_core.cli.command_models import Permission
+    from otrs_gi_core.cli.environments import HostSystem
+    from otrs_gi_core.cli.system_console import SystemConsole
+    from otrs_gi_core.clients.generic_interface_client import GenericInterfaceClient
+    from otrs_gi_core.ticket_import import ImportFormat
+
+DEFAULT_EXPORT_CONCURRENCY = 8
+DEFAULT_IMPORT_CONCURRENCY = 4
+DEFAULT_PROVISION_WORKERS = 4
 
 
 def create_cli_app(
@@ -20,11 +31,35 @@ def create_cli_app(
 ) -> typer.Typer:
     app = typer.Typer(help=f"Command line utilities for interacting with {product_label} systems.")
     env_cache: HostSystem | None = None
+    env_prefix = product_label.upper()
+    refresh_environment = False
+
+    @app.callback()
+    def main(
+        refresh: bool = typer.Option(
+            False,
+            "--refresh-environment",
+            help="Ignore the cached environment detection result and probe the host again.",
+        ),
+    ) -> None:
+        nonlocal env_cache, refresh_environment
+        refresh_environment = refresh
+        if refresh:
+            env_cache = None
+
+    def detect_environment_cached() -> HostSystem | None:
+        cache_setting = os.environ.get(f"{env_prefix}_ENVIRONMENT_CACHE")
+        if cache_setting is not None and cache_setting.lower() in ("", "0", "off", "false", "no"):
+            return detect_environment()
+        from otrs_gi_core.cli.environment_cache import EnvironmentCache, detect_with_cache
+
+        cache = EnvironmentCache(cache_setting or None)
+        return detect_with_cache(detect_environment, product_label, cache, refresh=refresh_environment)
 
     def require_environment() -> HostSystem:
         nonlocal env_cache
         if env_cache is None:
-            env = detect_environment()
+            env = detect_environment_cached()
             if env is None:
                 typer.echo(
                     f"Could not automatically detect a {product_label} environment. "
@@ -36,6 +71,8 @@ def create_cli_app(
         return env_cache
 
     def build_console() -> SystemConsole:
+        from otrs_gi_core.cli.system_console import SystemConsole
+
         return SystemConsole(require_environment().build_command_runner())
 
     def resolve_operations(operation_names: Iterable[str]) -> list[TicketOperation]:
@@ -50,6 +87,25 @@ def create_cli_app(
                 ) from exc
         return operations
 
+    def build_client(base_url: str, webservice: str, user: str, password: Optional[str]) -> GenericInterfaceClient:
+        from pydantic import SecretStr
+
+        from otrs_gi_core.clients.generic_interface_client import GenericInterfaceClient
+        from otrs_gi_core.domain_models.basic_auth_model import BasicAuth
+        from otrs_gi_core.domain_models.client_config import ClientConfig
+        from otrs_gi_core.setup.webservices.operations import SUPPORTED_OPERATION_SPECS
+
+        client = GenericInterfaceClient(
+            ClientConfig(
+                base_url=base_url,
+                webservice_name=webservice,
+                operation_url_map={op: spec.operation_name for op, spec in SUPPORTED_OPERATION_SPECS.items()},
+            )
+        )
+        secret = SecretStr(password or typer.prompt("Password", hide_input=True))
+        client.login(BasicAuth(user_login=user, password=secret))
+        return client
+
     def handle_result(result, success_message: str) -> None:
         if result.ok:
             typer.echo(success_message)
@@ -66,6 +122,8 @@ def create_cli_app(
         password: Optional[str] = typer.Option(None, "--password", "-p", help="Password for the new user."),
         groups: Optional[List[str]] = typer.Option(None, "--group", help="Group(s) to assign to the user."),
     ) -> None:
+        from otrs_gi_core.models.base_models import UserModel
+
         console = build_console()
         final_password = password or typer.prompt("Password", hide_input=True, confirmation_prompt=True)
         user = UserModel(
@@ -84,6 +142,8 @@ def create_cli_app(
         group_name: str = typer.Argument(..., help="Name of the group."),
         comment: Optional[str] = typer.Option(None, "--comment", help="Optional comment for the group."),
     ) -> None:
+        from otrs_gi_core.models.base_models import GroupConfig
+
         console = build_console()
         group = GroupConfig(name=group_name, comment=comment)
         result = console.add_group(group)
@@ -115,6 +175,8 @@ def create_cli_app(
         solution_time: Optional[int] = typer.Option(None, "--solution-time"),
         calendar: Optional[int] = typer.Option(None, "--calendar"),
     ) -> None:
+        from otrs_gi_core.models.base_models import QueueConfig
+
         console = build_console()
         queue = QueueConfig(
             name=name,
@@ -131,6 +193,48 @@ def create_cli_app(
         result = console.add_queue(queue)
         handle_result(result, f"Queue '{name}' created successfully.")
 
+    @app.command("provision")
+    def provision(
+        manifest_path: Path = typer.Argument(..., exists=True, dir_okay=False, help="YAML provisioning manifest."),
+        max_workers: int = typer.Option(
+            DEFAULT_PROVISION_WORKERS, "--max-workers", min=1, help="Console commands run at the same time.",
+        ),
+        force: bool = typer.Option(False, "--force", help="Issue every command, even for objects that already exist."),
+        dry_run: bool = typer.Option(False, "--dry-run", help="Only print what would be created."),
+    ) -> None:
+        from otrs_gi_core.setup.provisioning import (
+            ProvisioningManifest,
+            ProvisioningPlan,
+            StepOutcome,
+            build_steps,
+            execute_manifest,
+            fetch_existing,
+            plan_provisioning,
+        )
+
+        manifest = ProvisioningManifest.from_yaml(manifest_path)
+        console = build_console()
+        plan = ProvisioningPlan(manifest) if force else plan_provisioning(manifest, fetch_existing(console))
+        for key in plan.existing:
+            typer.echo(f"{'exists':8} {key}")
+        if dry_run:
+            for key in build_steps(plan.manifest):
+                typer.echo(f"{'create':8} {key}")
+            return
+
+        def report_outcome(outcome: StepOutcome) -> None:
+            detail = f" ({outcome.result.err})" if outcome.result is not None and outcome.result.err else ""
+            typer.echo(f"{outcome.status:8} {outcome.step.key}{detail}", err=outcome.status != "ok")
+
+        report = execute_manifest(console, plan.manifest, max_workers=max_workers, on_outcome=report_outcome)
+        counts = {status: len(report.with_status(status)) for status in ("ok", "failed", "skipped")}
+        typer.echo(
+            f"{counts['ok']} succeeded, {counts['failed']} failed, {counts['skipped']} skipped, "
+            f"{len(plan.existing)} already existed."
+        )
+        if not report.ok:
+            raise typer.Exit(code=1)
+
     @app.command("list-queues")
     def list_queues() -> None:
         console = build_console()
@@ -141,6 +245,166 @@ def create_cli_app(
             typer.echo(f"Failed to list queues: {result.err}", err=True)
             raise typer.Exit(code=1)
 
+    @app.command("export-tickets")
+    def export_tickets(
+        base_url: str = typer.Option(..., "--base-url", envvar=f"{env_prefix}_BASE_URL",
+                                     help="GenericInterface base URL, e.g. https://host/otobo/nph-genericinterface.pl"),
+        webservice: str = typer.Option(..., "--webservice", envvar=f"{env_prefix}_WEBSERVICE"),
+        user: str = typer.Option(..., "--user", envvar=f"{env_prefix}_USER"),
+        password: Optional[str] = typer.Option(None, "--password", envvar=f"{env_prefix}_PASSWORD"),
+        output: Optional[Path] = typer.Option(None, "--output", "-o", help="NDJSON file to write (default: stdout)."),
+        resume: bool = typer.Option(False, "--resume", help="Skip tickets already present in --output and append."),
+        concurrency: int = typer.Option(DEFAULT_EXPORT_CONCURRENCY, "--concurrency", min=1),
+        queues: Optional[List[str]] = typer.Option(None, "--queue"),
+        states: Optional[List[str]] = typer.Option(None, "--state"),
+        priorities: Optional[List[str]] = typer.Option(None, "--priority"),
+        types: Optional[List[str]] = typer.Option(None, "--type"),
+        titles: Optional[List[str]] = typer.Option(None, "--title"),
+        numbers: Optional[List[str]] = typer.Option(None, "--number"),
+        use_subqueues: bool = typer.Option(False, "--use-subqueues"),
+        limit: int = typer.Option(10000, "--limit", help="Maximum number of tickets returned by the search."),
+    ) -> None:
+        import asyncio
+
+        from otrs_gi_core.domain_models.ticket_models import IdName, TicketSearch
+        from otrs_gi_core.export.ndjson import export_ndjson, prepare_resume
+
+        if resume and output is None:
+            raise typer.BadParameter("--resume requires --output")
+
+        def to_id_names(names: Optional[List[str]]) -> Optional[list[IdName]]:
+            return [IdName(name=n) for n in names] if names else None
+
+        search = TicketSearch(
+            numbers=numbers or None,
+            titles=titles or None,
+            queues=to_id_names(queues),
+            states=to_id_names(states),
+            priorities=to_id_names(priorities),
+            types=to_id_names(types),
+            use_subqueues=use_subqueues,
+            limit=limit,
+        )
+        skip_ids = prepare_resume(output) if resume and output is not None else set()
+        if skip_ids:
+            typer.echo(f"Resuming export, skipping {len(skip_ids)} tickets already written.", err=True)
+
+        def report_error(ticket_id: int, exc: Exception) -> None:
+            typer.echo(f"Failed to export ticket {ticket_id}: {exc}", err=True)
+
+        async def run_export() -> int:
+            async with build_client(base_url, webservice, user, password) as client:
+                if output is None:
+                    return await export_ndjson(
+                        client, search, sys.stdout,
+                        concurrency=concurrency, skip_ids=skip_ids, on_error=report_error,
+                    )
+                with output.open("a" if resume else "w", encoding="utf-8") as fh:
+                    return await export_ndjson(
+                        client, search, fh,
+                        concurrency=concurrency, skip_ids=skip_ids, on_error=report_error,
+                    )
+
+        written = asyncio.run(run_export())
+        typer.echo(f"Exported {written} tickets.", err=True)
+
+    @app.command("import-tickets")
+    def import_tickets(
+        source: Path = typer.Argument(..., exists=True, dir_okay=False, help="CSV or NDJSON file with tickets."),
+        results: Path = typer.Option(..., "--results", "-r", help="NDJSON file mapping input rows to ticket ids."),
+        base_url: str = typer.Option(..., "--base-url", envvar=f"{env_prefix}_BASE_URL"),
+        webservice: str = typer.Option(..., "--webservice", envvar=f"{env_prefix}_WEBSERVICE"),
+        user: str = typer.Option(..., "--user", envvar=f"{env_prefix}_USER"),
+        password: Optional[str] = typer.Option(None, "--password", envvar=f"{env_prefix}_PASSWORD"),
+        input_format: Optional[str] = typer.Option(None, "--format", help="csv or ndjson (default: from extension)."),
+        resume: bool = typer.Option(False, "--resume", help="Skip rows already imported according to --results."),
+        concurrency: int = typer.Option(DEFAULT_IMPORT_CONCURRENCY, "--concurrency", min=1),
+    ) -> None:
+        import asyncio
+
+        from otrs_gi_core.ticket_import import completed_rows, import_tickets as run_ticket_import, iter_rows, open_rows
+
+        if input_format is not None and input_format not in ("csv", "ndjson"):
+            raise typer.BadParameter("--format must be 'csv' or 'ndjson'")
+        try:
+            rows_file, fmt = open_rows(source, input_format)  # type: ignore[arg-type]
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc)) from exc
+        skip_rows = completed_rows(results) if resume else set()
+        if skip_rows:
+            typer.echo(f"Resuming import, skipping {len(skip_rows)} rows already imported.", err=True)
+
+        async def run_import(import_format: ImportFormat) -> tuple[int, int]:
+            async with build_client(base_url, webservice, user, password) as client:
+                with rows_file, results.open("a" if resume else "w", encoding="utf-8") as results_fh:
+                    return await run_ticket_import(
+                        client,
+                        iter_rows(rows_file, import_format),
+                        import_format,
+                        results_fh,
+                        concurrency=concurrency,
+                        skip_rows=skip_rows,
+                    )
+
+        created, failed = asyncio.run(run_import(fmt))
+        typer.echo(f"Created {created} tickets, {failed} rows failed. Results written to {results}.", err=True)
+        if failed:
+            raise typer.Exit(code=1)
+
+    @app.command("bench")
+    def bench(
+        base_url: Optional[str] = typer.Option(None, "--base-url", envvar=f"{env_prefix}_BASE_URL"),
+        webservice: Optional[str] = typer.Option(None, "--webservice", envvar=f"{env_prefix}_WEBSERVICE"),
+        user: Optional[str] = typer.Option(None, "--user", envvar=f"{env_prefix}_USER"),
+        password: Optional[str] = typer.Option(None, "--password", envvar=f"{env_prefix}_PASSWORD"),
+        fake: bool = typer.Option(False, "--fake", help="Run against an in-process fake webservice."),
+        mix: str = typer.Option("get=70,search=20,create=5,update=5", "--mix", help="Weighted operation mix."),
+        concurrency: str = typer.Option("1,2,4,8,16,32", "--concurrency", help="Comma separated levels to sweep."),
+        duration: float = typer.Option(10.0, "--duration", min=0.1, help="Seconds per level."),
+        warmup: float = typer.Option(1.0, "--warmup", min=0.0, help="Seconds per level before measuring."),
+        queue: str = typer.Option("Raw", "--queue", help="Queue for created tickets."),
+        search_limit: int = typer.Option(50, "--search-limit", min=1),
+        seed: int = typer.Option(0, "--seed"),
+        tickets: int = typer.Option(1000, "--tickets", min=0, help="Tickets pre-loaded into the fake webservice."),
+        json_output: bool = typer.Option(False, "--json", help="Print one JSON object per level."),
+    ) -> None:
+        """Load-test a webservice with a get/search/create/update mix over several concurrency levels."""
+        import asyncio
+        import json
+
+        from otrs_gi_core.loadtest import (
+            LevelReport,
+            LoadTestConfig,
+            build_fake_client,
+            format_header,
+            format_level,
+            parse_levels,
+            parse_mix,
+            run_load_test,
+            silence_client_logging,
+        )
+
+        try:
+            config = LoadTestConfig(mix=parse_mix(mix), duration=duration, warmup=warmup, queue=queue,
+                                    search_limit=search_limit, seed=seed)
+            levels = parse_levels(concurrency)
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc)) from exc
+        if fake:
+            client = build_fake_client(tickets, seed=seed)
+        elif base_url and webservice and user:
+            client = build_client(base_url, webservice, user, password)
+        else:
+            raise typer.BadParameter("Pass --fake or --base-url, --webservice and --user")
+
+        def report_level(report: LevelReport) -> None:
+            typer.echo(json.dumps(report.to_dict()) if json_output else format_level(report))
+
+        silence_client_logging()
+        if not json_output:
+            typer.echo(format_header())
+        asyncio.run(run_load_test(client, levels, config, report_level))
+
     def prompt_operations(default: Iterable[TicketOperation]) -> list[TicketOperation]:
         default_str = ",".join(op.name for op in default)
         raw = typer.prompt("Enabled webservice operations (comma separated)", default=default_str)
@@ -149,6 +413,11 @@ def create_cli_app(
 
     @app.command("setup-system")
     def interactive_setup() -> None:
+        from otrs_gi_core.cli.system_console import SystemConsole
+        from otrs_gi_core.models.base_models import UserModel
+        from otrs_gi_core.setup.bootstrap import generate_random_password, setup_host_system
+        from otrs_gi_core.setup.config import SetupConfig
+
         env = require_environment()
         console = SystemConsole(env.build_command_runner())
 
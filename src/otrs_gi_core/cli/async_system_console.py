@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+from .command_models import CmdResult, Permission
+from .command_runner import BatchingCommandRunner, ConsoleCommandRunner, DEFAULT_CONSOLE_WORKERS, OutputCallback
+from .system_console import SystemConsole
+
+if TYPE_CHECKING:
+    from otrs_gi_core.models.base_models import GroupConfig, QueueConfig, UserModel
+
+
+class AsyncSystemConsole:
+    """``SystemConsole`` for asyncio code.
+
+    Each method builds its console commands with ``SystemConsole`` and runs them
+    through ``ConsoleCommandRunner.run_many_async``, so the event loop is never
+    blocked on a console process.
+    """
+
+    def __init__(
+            self,
+            runner: ConsoleCommandRunner,
+            no_ansi_default: bool = True,
+            quiet_default: bool = False,
+            max_workers: int = DEFAULT_CONSOLE_WORKERS,
+            *,
+            timeout: float | None = None,
+            on_output: OutputCallback | None = None,
+    ):
+        self.runner = runner
+        self.no_ansi_default = no_ansi_default
+        self.quiet_default = quiet_default
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.on_output = on_output
+
+    async def _call(self, method: Callable[..., CmdResult], *args: Any) -> CmdResult:
+        queued = BatchingCommandRunner(self.runner)
+        result = method(SystemConsole(queued, self.no_ansi_default, self.quiet_default, self.max_workers), *args)
+        await queued.flush_async(partial(
+            self.runner.run_many_async,
+            max_workers=self.max_workers,
+            timeout=self.timeout,
+            on_output=self.on_output,
+        ))
+        return result
+
+    async def add_user(self, user: UserModel, quiet: bool | None = None, no_ansi: bool | None = None) -> CmdResult:
+        return await self._call(SystemConsole.add_user, user, quiet, no_ansi)
+
+    async def add_group(
+            self,
+            group: GroupConfig,
+            quiet: bool | None = None,
+            no_ansi: bool | None = None,
+    ) -> CmdResult:
+        return await self._call(SystemConsole.add_group, group, quiet, no_ansi)
+
+    async def link_user_to_group(
+            self,
+            user_name: str,
+            group_name: str,
+            permission: Permission | str,
+            quiet: bool | None = None,
+            no_ansi: bool | None = None,
+    ) -> CmdResult:
+        return await self._call(SystemConsole.link_user_to_group, user_name, group_name, permission, quiet, no_ansi)
+
+    async def link_user_to_group_with_permissions(
+            self,
+            user_name: str,
+            group_name: str,
+            permissions: list[Permission],
+            quiet: bool | None = None,
+            no_ansi: bool | None = None,
+    ) -> CmdResult:
+        return await self._call(
+            SystemConsole.link_user_to_group_with_permissions, user_name, group_name, permissions, quiet, no_ansi,
+        )
+
+    async def add_users(self, users: Iterable[UserModel]) -> CmdResult:
+        return await self._call(SystemConsole.add_users, users)
+
+    async def add_groups(self, groups: Iterable[GroupConfig]) -> CmdResult:
+        return await self._call(SystemConsole.add_groups, groups)
+
+    async def add_queues(self, queues: Iterable[QueueConfig]) -> CmdResult:
+        return await self._call(SystemConsole.add_queues, queues)
+
+    async def link_users_to_groups(self, links: Iterable[tuple[str, str, Permission | str]]) -> CmdResult:
+        return await self._call(SystemConsole.link_users_to_groups, links)
+
+    async def add_queue(
+            self,
+            queue: QueueConfig,
+            quiet: bool | None = None,
+            no_ansi: bool | None = None,
+    ) -> CmdResult:
+        return await self._call(SystemConsole.add_queue, queue, quiet, no_ansi)
+
+    async def add_webservice(
+            self,
+            name: str,
+            source_path: str,
+            quiet: bool | None = None,
+            no_ansi: bool | None = None,
+    ) -> CmdResult:
+        return await self._call(SystemConsole.add_webservice, name, source_path, quiet, no_ansi)
+
+    async def list_all_queues(self, quiet: bool | None = None, no_ansi: bool | None = None) -> CmdResult:
+        return await self._call(SystemConsole.list_all_queues, quiet, no_ansi)
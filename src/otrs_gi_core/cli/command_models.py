@@ -13,9 +13,16 @@ CONSOLE_COMMANDS = {
     "AddWebservice": "Admin::WebService::Add",
     "LinkUserToGroup": "Admin::Group::UserLink",
     "ListQueues": "Admin::Queue::List",
+    "ListUsers": "Admin::User::List",
+    "ListGroups": "Admin::Group::List",
+    "ListWebservices": "Admin::WebService::List",
 }
 
 PASSWORD_TO_WEAK_CODE = 2
+BATCH_PENDING_CODE = -1
+TIMEOUT_CODE = 124
+
+ConsoleCommand = tuple[str, list[str]]
 
 
 @dataclass
@@ -35,7 +42,7 @@ class CmdResult:
     def union(cls, results: list[CmdResult]) -> CmdResult:
         combined_out = "\n".join(r.out for r in results if r.out)
         combined_err = "\n".join(r.err for r in results if r.err)
-        combined_code = max(r.code for r in results)
+        combined_code = max((r.code for r in results), default=0)
         return CmdResult(
             code=combined_code,
             out=combined_out,
@@ -1,9 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import shlex
 import subprocess
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Awaitable, Callable, Iterable, Literal, Sequence
 
-from otrs_gi_core.cli.command_models import CmdResult
+from otrs_gi_core.cli.command_models import BATCH_PENDING_CODE, TIMEOUT_CODE, CmdResult, ConsoleCommand
+
+# A single argv entry is limited to 128 KiB on Linux; batch scripts are split below that.
+MAX_BATCH_SCRIPT_LENGTH = 100_000
+DEFAULT_CONSOLE_WORKERS = 4
+STREAM_LINE_LIMIT = 1024 * 1024
+
+OutputCallback = Callable[[Literal["stdout", "stderr"], str], None]
 
 
 class ConsoleCommandRunner:
@@ -28,3 +40,225 @@ class ConsoleCommandRunner:
         if self.log_commands:
             pass
         return cmd_result
+
+    def run_batch(self, commands: Iterable[ConsoleCommand]) -> list[CmdResult]:
+        """Run console commands one after another inside a single shell session.
+
+        For Docker systems this costs one ``docker exec`` per batch instead of one
+        per command. Every command still runs, independent of earlier failures, and
+        gets its own ``CmdResult`` in input order.
+        """
+        results: list[CmdResult] = []
+        for chunk in self._chunk_scripts(list(commands)):
+            results.extend(self._run_script(chunk))
+        return results
+
+    def run_many(
+            self,
+            commands: Iterable[ConsoleCommand],
+            max_workers: int = DEFAULT_CONSOLE_WORKERS,
+    ) -> list[CmdResult]:
+        """Run independent console commands with at most ``max_workers`` processes at a time.
+
+        Results are returned in input order.
+        """
+        commands = list(commands)
+        if max_workers <= 1 or len(commands) <= 1:
+            return [self.run(operation, args) for operation, args in commands]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(commands))) as pool:
+            return list(pool.map(lambda command: self.run(*command), commands))
+
+    async def run_async(
+            self,
+            operation: str,
+            args: list[str],
+            *,
+            timeout: float | None = None,
+            on_output: OutputCallback | None = None,
+    ) -> CmdResult:
+        """Run a console command without blocking the event loop.
+
+        ``on_output`` receives every stdout/stderr line as it is produced. When
+        ``timeout`` expires the process is killed and a result with ``TIMEOUT_CODE``
+        is returned; on cancellation it is killed and the cancellation propagates.
+        For Docker systems this kills the ``docker exec`` client; the console process
+        inside the container may run to completion.
+        """
+        cmd = [*self.prefix, self.executable, operation, *args]
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=STREAM_LINE_LIMIT,
+        )
+        assert proc.stdout is not None and proc.stderr is not None
+        out: list[str] = []
+        err: list[str] = []
+
+        async def pump(stream: asyncio.StreamReader, name: Literal["stdout", "stderr"], sink: list[str]) -> None:
+            async for raw in stream:
+                line = raw.decode(errors="replace")
+                sink.append(line)
+                if on_output is not None:
+                    on_output(name, line.rstrip("\n"))
+
+        try:
+            async with asyncio.timeout(timeout):
+                await asyncio.gather(pump(proc.stdout, "stdout", out), pump(proc.stderr, "stderr", err))
+                code = await proc.wait()
+        except TimeoutError:
+            await _kill(proc)
+            stderr = "\n".join(filter(None, ["".join(err).strip(), f"{operation} timed out after {timeout}s"]))
+            return CmdResult(TIMEOUT_CODE, "".join(out).strip(), stderr)
+        except asyncio.CancelledError:
+            await _kill(proc)
+            raise
+        return CmdResult(code, "".join(out).strip(), "".join(err).strip())
+
+    async def run_many_async(
+            self,
+            commands: Iterable[ConsoleCommand],
+            max_workers: int = DEFAULT_CONSOLE_WORKERS,
+            *,
+            timeout: float | None = None,
+            on_output: OutputCallback | None = None,
+    ) -> list[CmdResult]:
+        """Async counterpart of ``run_many``; ``timeout`` applies to each command."""
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+
+        async def run_one(operation: str, args: list[str]) -> CmdResult:
+            async with semaphore:
+                return await self.run_async(operation, args, timeout=timeout, on_output=on_output)
+
+        return list(await asyncio.gather(*(run_one(operation, args) for operation, args in commands)))
+
+    def _command_line(self, operation: str, args: list[str]) -> str:
+        return shlex.join([self.executable, operation, *args])
+
+    def _chunk_scripts(self, commands: Sequence[ConsoleCommand]) -> Iterable[list[ConsoleCommand]]:
+        chunk: list[ConsoleCommand] = []
+        length = 0
+        for operation, args in commands:
+            line_length = len(self._command_line(operation, args)) + 200
+            if chunk and length + line_length > MAX_BATCH_SCRIPT_LENGTH:
+                yield chunk
+                chunk, length = [], 0
+            chunk.append((operation, args))
+            length += line_length
+        if chunk:
+            yield chunk
+
+    def _run_script(self, commands: Sequence[ConsoleCommand]) -> list[CmdResult]:
+        marker = f"__console_batch_{uuid.uuid4().hex}__"
+        lines = []
+        for index, (operation, args) in enumerate(commands):
+            lines.append(
+                f"{self._command_line(operation, args)}; rc=$?; "
+                f"printf '\\n{marker} {index} %s\\n' \"$rc\"; printf '\\n{marker} {index}\\n' >&2"
+            )
+        proc = subprocess.run(
+            [*self.prefix, "sh", "-c", "\n".join(lines)],
+            capture_output=True,
+            text=True,
+            stdin=subprocess.DEVNULL,
+        )
+        outputs = _split_marked_output(proc.stdout, marker)
+        errors = _split_marked_output(proc.stderr, marker)
+
+        results: list[CmdResult] = []
+        for index in range(len(commands)):
+            if index not in outputs:
+                # The session died before this command finished.
+                results.append(CmdResult(proc.returncode or 1, "", proc.stderr.strip()))
+                continue
+            out, code = outputs[index]
+            results.append(CmdResult(code, out, errors.get(index, ("", 0))[0]))
+        return results
+
+
+async def _kill(proc: asyncio.subprocess.Process) -> None:
+    if proc.returncode is None:
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+    await proc.wait()
+
+
+def _split_marked_output(stream: str, marker: str) -> dict[int, tuple[str, int]]:
+    """Map command index to ``(output, exit_code)`` using the end markers written by the batch script."""
+    sections: dict[int, tuple[str, int]] = {}
+    buffer: list[str] = []
+    for line in stream.split("\n"):
+        if line.startswith(marker):
+            parts = line.split()
+            code = int(parts[2]) if len(parts) > 2 else 0
+            sections[int(parts[1])] = ("\n".join(buffer).strip(), code)
+            buffer = []
+        else:
+            buffer.append(line)
+    return sections
+
+
+class BatchingCommandRunner:
+    """Collects commands issued through ``run`` and executes them together on ``flush``.
+
+    ``run`` returns a placeholder ``CmdResult`` (code ``BATCH_PENDING_CODE``) that is
+    filled in place by ``flush``. ``execute`` defaults to ``runner.run_batch``.
+    """
+
+    def __init__(
+            self,
+            runner: ConsoleCommandRunner,
+            execute: Callable[[Iterable[ConsoleCommand]], list[CmdResult]] | None = None,
+    ):
+        self.runner = runner
+        self.execute = execute or runner.run_batch
+        self.pending: list[tuple[ConsoleCommand, CmdResult]] = []
+        self.pending_unions: list[tuple[list[CmdResult], CmdResult]] = []
+
+    def run(self, operation: str, args: list[str]) -> CmdResult:
+        placeholder = CmdResult(code=BATCH_PENDING_CODE)
+        self.pending.append(((operation, list(args)), placeholder))
+        return placeholder
+
+    def union(self, results: list[CmdResult]) -> CmdResult:
+        """``CmdResult.union`` of queued results, computed once they have run."""
+        placeholder = CmdResult(code=BATCH_PENDING_CODE)
+        self.pending_unions.append((results, placeholder))
+        return placeholder
+
+    def flush(self) -> list[CmdResult]:
+        pending, unions = self._take()
+        executed = self.execute([command for command, _ in pending]) if pending else []
+        return self._complete(pending, unions, executed)
+
+    async def flush_async(
+            self,
+            execute: Callable[[list[ConsoleCommand]], Awaitable[list[CmdResult]]],
+    ) -> list[CmdResult]:
+        pending, unions = self._take()
+        executed = await execute([command for command, _ in pending]) if pending else []
+        return self._complete(pending, unions, executed)
+
+    def _take(self) -> tuple[list[tuple[ConsoleCommand, CmdResult]], list[tuple[list[CmdResult], CmdResult]]]:
+        pending, self.pending = self.pending, []
+        unions, self.pending_unions = self.pending_unions, []
+        return pending, unions
+
+    @staticmethod
+    def _complete(
+            pending: list[tuple[ConsoleCommand, CmdResult]],
+            unions: list[tuple[list[CmdResult], CmdResult]],
+            executed: list[CmdResult],
+    ) -> list[CmdResult]:
+        for (_, placeholder), result in zip(pending, executed):
+            _fill(placeholder, result)
+        for results, placeholder in unions:
+            _fill(placeholder, CmdResult.union(results))
+        return [placeholder for _, placeholder in pending]
+
+
+def _fill(placeholder: CmdResult, result: CmdResult) -> None:
+    placeholder.code, placeholder.out, placeholder.err = result.code, result.out, result.err
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import subprocess
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from otrs_gi_core.cli.environments import DockerSystem, HostSystem, LocalSystem
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 1
+
+
+def default_cache_path() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "otrs-gi-core" / "environments.json"
+
+
+def _inspect_container(container: str) -> tuple[str, bool] | None:
+    """Return ``(container_id, running)`` for ``container`` or ``None`` if Docker does not know it."""
+    try:
+        result = subprocess.run(
+            ["docker", "inspect", "--format", "{{.Id}} {{.State.Running}}", container],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except Exception as e:
+        logger.debug(f"docker inspect {container} failed: {e}")
+        return None
+    if result.returncode != 0:
+        return None
+    container_id, _, running = result.stdout.strip().partition(" ")
+    return container_id, running == "true"
+
+
+class EnvironmentCache:
+    """Detected host systems persisted per host and product.
+
+    A cached Docker system stays valid while the same container ID is running,
+    a local system while its console and webservice paths exist.
+    """
+
+    def __init__(self, path: str | Path | None = None, host: str | None = None) -> None:
+        self.path = Path(path) if path is not None else default_cache_path()
+        self.host = host or socket.gethostname()
+
+    def _key(self, product: str) -> str:
+        return f"{self.host}/{product.lower()}"
+
+    def _read(self) -> dict[str, Any]:
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(raw, dict) or raw.get("version") != CACHE_FORMAT_VERSION:
+            return {}
+        entries = raw.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    def _write(self, entries: dict[str, Any]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps({"version": CACHE_FORMAT_VERSION, "entries": entries}), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+    def load(self, product: str) -> HostSystem | None:
+        entry = self._read().get(self._key(product))
+        if entry is None:
+            return None
+        try:
+            if entry["kind"] == "docker":
+                docker = DockerSystem.model_validate(entry["system"])
+                inspected = _inspect_container(docker.container_name)
+                if inspected != (entry.get("container_id"), True):
+                    return None
+                return docker
+            system = LocalSystem.model_validate(entry["system"])
+        except (KeyError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable environment cache entry: {e}")
+            return None
+        if not (Path(system.console_path).exists() and system.webservices_dir.exists()):
+            return None
+        return system
+
+    def store(self, product: str, system: HostSystem) -> None:
+        entry: dict[str, Any] = {"system": system.model_dump(mode="json"), "detected_at": time.time()}
+        if isinstance(system, DockerSystem):
+            inspected = _inspect_container(system.container_name)
+            if inspected is None:
+                return
+            entry["kind"] = "docker"
+            entry["container_id"] = inspected[0]
+        elif isinstance(system, LocalSystem):
+            entry["kind"] = "local"
+        else:
+            return
+        entries = self._read()
+        entries[self._key(product)] = entry
+        try:
+            self._write(entries)
+        except OSError as e:
+            logger.warning(f"Could not write environment cache {self.path}: {e}")
+
+    def invalidate(self, product: str) -> None:
+        entries = self._read()
+        if entries.pop(self._key(product), None) is not None:
+            self._write(entries)
+
+
+def detect_with_cache(
+    detect: Callable[[], HostSystem | None],
+    product: str,
+    cache: EnvironmentCache,
+    *,
+    refresh: bool = False,
+) -> HostSystem | None:
+    """Return the cached system for ``product`` or run ``detect`` and remember its result."""
+    if not refresh:
+        cached = cache.load(product)
+        if cached is not None:
+            return cached
+    system = detect()
+    if system is None:
+        cache.invalidate(product)
+    else:
+        cache.store(product, system)
+    return system
@@ -1,17 +1,23 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
-
-from zxcvbn import zxcvbn
+import re
+from contextlib import contextmanager
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, TypeVar
 
 from .command_models import ArgsBuilder, CmdResult, CONSOLE_COMMANDS, Permission, PasswordToWeak
-from .command_runner import ConsoleCommandRunner
+from .command_runner import BatchingCommandRunner, ConsoleCommandRunner, DEFAULT_CONSOLE_WORKERS
 
 if TYPE_CHECKING:
     from otrs_gi_core.models.base_models import UserModel, GroupConfig, QueueConfig
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+_ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*m")
+_LIST_NOISE = re.compile(r"^(Listing\b|Done\b|<\w+>|[+\-=|\s]*$)", re.IGNORECASE)
+
 PERMISSION_MAP = {
     "owner": "owner",
     "move": "move_into",
@@ -23,10 +29,17 @@ PERMISSION_MAP = {
 
 
 class SystemConsole:
-    def __init__(self, runner: ConsoleCommandRunner, no_ansi_default: bool = True, quiet_default: bool = False):
+    def __init__(
+            self,
+            runner: ConsoleCommandRunner | BatchingCommandRunner,
+            no_ansi_default: bool = True,
+            quiet_default: bool = False,
+            max_workers: int = DEFAULT_CONSOLE_WORKERS,
+    ):
         self.runner = runner
         self.no_ansi_default = no_ansi_default
         self.quiet_default = quiet_default
+        self.max_workers = max_workers
 
     def _common(self, quiet: bool | None, no_ansi: bool | None) -> ArgsBuilder:
         return (ArgsBuilder()
@@ -34,7 +47,48 @@ class SystemConsole:
                 .flag("--quiet", enabled=self.quiet_default if quiet is None else quiet)
                 )
 
+    @contextmanager
+    def batch(self) -> Iterator[SystemConsole]:
+        """Queue the commands issued on the yielded console and run them in one shell session on exit.
+
+        The ``CmdResult`` objects returned inside the block are filled in once the
+        block completes; nothing runs if the block raises.
+        """
+        batching = BatchingCommandRunner(self.runner)
+        yield SystemConsole(batching, self.no_ansi_default, self.quiet_default, self.max_workers)
+        results = batching.flush()
+        logger.info(f"Ran {len(results)} console commands in batch, {sum(not r.ok for r in results)} failed")
+
+    @contextmanager
+    def parallel(self, max_workers: int | None = None) -> Iterator[SystemConsole]:
+        """Like ``batch``, but the queued commands run as separate processes, ``max_workers`` at a time.
+
+        Only queue commands that do not depend on each other. Inside ``batch`` the
+        commands simply join the enclosing batch, keeping their order.
+        """
+        if isinstance(self.runner, BatchingCommandRunner):
+            yield self
+            return
+        workers = self.max_workers if max_workers is None else max_workers
+        queued = BatchingCommandRunner(self.runner, execute=partial(self.runner.run_many, max_workers=workers))
+        yield SystemConsole(queued, self.no_ansi_default, self.quiet_default, workers)
+        queued.flush()
+
+    def _run_each(
+            self,
+            items: Iterable[T],
+            command: Callable[[SystemConsole, T], CmdResult],
+            max_workers: int | None,
+    ) -> CmdResult:
+        with self.parallel(max_workers) as console:
+            results = [command(console, item) for item in items]
+        if isinstance(self.runner, BatchingCommandRunner):
+            return self.runner.union(results)
+        return CmdResult.union(results)
+
     def is_strong_password(self, password: str) -> bool:
+        from zxcvbn import zxcvbn  # loads large frequency lists, only needed here
+
         password_strength = zxcvbn(password)
         return password_strength['guesses_log10'] >= 9
 
@@ -101,6 +155,7 @@ class SystemConsole:
             permissions: list[Permission],
             quiet: bool | None = None,
             no_ansi: bool | None = None,
+            max_workers: int | None = None,
     ) -> CmdResult:
         """
         Link a user to a group with multiple permissions.
@@ -111,17 +166,36 @@ class SystemConsole:
             permissions: List of permissions (can use friendly names like 'read', 'full', etc.)
             quiet: Suppress output
             no_ansi: Disable ANSI colors
+            max_workers: Console processes at a time (default: the console's ``max_workers``)
 
         Returns:
             Dictionary mapping permission to CmdResult
         """
         logger.info(f"Linking user '{user_name}' to group '{group_name}' with permissions: {permissions}")
-        results = []
-        for permission in permissions:
-            mapped_permission = PERMISSION_MAP.get(permission, permission)
-            result = self.link_user_to_group(user_name, group_name, mapped_permission, quiet, no_ansi)
-            results.append(result)
-        return CmdResult.union(results)
+        return self._run_each(
+            permissions,
+            lambda console, permission: console.link_user_to_group(
+                user_name, group_name, PERMISSION_MAP.get(permission, permission), quiet, no_ansi,
+            ),
+            max_workers,
+        )
+
+    def add_users(self, users: Iterable[UserModel], max_workers: int | None = None) -> CmdResult:
+        return self._run_each(users, SystemConsole.add_user, max_workers)
+
+    def add_groups(self, groups: Iterable[GroupConfig], max_workers: int | None = None) -> CmdResult:
+        return self._run_each(groups, SystemConsole.add_group, max_workers)
+
+    def add_queues(self, queues: Iterable[QueueConfig], max_workers: int | None = None) -> CmdResult:
+        return self._run_each(queues, SystemConsole.add_queue, max_workers)
+
+    def link_users_to_groups(
+            self,
+            links: Iterable[tuple[str, str, Permission | str]],
+            max_workers: int | None = None,
+    ) -> CmdResult:
+        """Run ``link_user_to_group`` for each ``(user_name, group_name, permission)``."""
+        return self._run_each(links, lambda console, link: console.link_user_to_group(*link), max_workers)
 
     def add_queue(
             self,
@@ -179,3 +253,43 @@ class SystemConsole:
             CONSOLE_COMMANDS["ListQueues"],
             self._common(quiet, no_ansi).to_list(),
         )
+
+    def list_all_users(self, quiet: bool | None = None, no_ansi: bool | None = None) -> CmdResult:
+        logger.info("Listing all users")
+        return self.runner.run(CONSOLE_COMMANDS["ListUsers"], self._common(quiet, no_ansi).to_list())
+
+    def list_all_groups(self, quiet: bool | None = None, no_ansi: bool | None = None) -> CmdResult:
+        logger.info("Listing all groups")
+        return self.runner.run(CONSOLE_COMMANDS["ListGroups"], self._common(quiet, no_ansi).to_list())
+
+    def list_all_webservices(self, quiet: bool | None = None, no_ansi: bool | None = None) -> CmdResult:
+        logger.info("Listing all webservices")
+        return self.runner.run(CONSOLE_COMMANDS["ListWebservices"], self._common(quiet, no_ansi).to_list())
+
+
+def parse_list_output(output: str) -> set[str]:
+    """Extract object names from the output of an ``Admin::*::List`` command.
+
+    Handles plain one-name-per-line listings as well as ASCII tables, where the
+    ``Name`` column (or the first column) is used. Progress lines such as
+    ``Listing all queues...`` and ``Done.`` are ignored.
+    """
+    names: set[str] = set()
+    name_column: int | None = None
+    for raw in _ANSI_ESCAPE.sub("", output).splitlines():
+        line = raw.strip()
+        if _LIST_NOISE.match(line):
+            continue
+        if line.startswith("|"):
+            cells = [cell.strip() for cell in line.strip("|").split("|")]
+            if name_column is None:
+                lowered = [cell.lower() for cell in cells]
+                if "name" in lowered:
+                    name_column = lowered.index("name")
+                    continue
+                name_column = 0
+            if name_column < len(cells) and cells[name_column]:
+                names.add(cells[name_column])
+            continue
+        names.add(line.lstrip("-* ").strip())
+    return names
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional, Protocol, runtime_checkable
+
+
+@runtime_checkable
+class ArticleCursorStore(Protocol):
+    """Remembers the highest ArticleID seen per ticket."""
+
+    def get(self, ticket_id: int) -> Optional[int]:
+        ...
+
+    def set(self, ticket_id: int, article_id: int) -> None:
+        ...
+
+
+class InMemoryArticleCursorStore:
+    def __init__(self) -> None:
+        self._cursors: dict[int, int] = {}
+
+    def get(self, ticket_id: int) -> Optional[int]:
+        return self._cursors.get(ticket_id)
+
+    def set(self, ticket_id: int, article_id: int) -> None:
+        current = self._cursors.get(ticket_id)
+        if current is None or article_id > current:
+            self._cursors[ticket_id] = article_id
+
+
+class JsonFileArticleCursorStore(InMemoryArticleCursorStore):
+    """Cursor store persisted to a JSON file so polling survives restarts.
+
+    The file is rewritten atomically on every advance.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        super().__init__()
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        if self.path.exists():
+            raw = json.loads(self.path.read_text(encoding="utf-8") or "{}")
+            self._cursors = {int(k): int(v) for k, v in raw.items()}
+
+    def set(self, ticket_id: int, article_id: int) -> None:
+        with self._lock:
+            before = self._cursors.get(ticket_id)
+            super().set(ticket_id, article_id)
+            if self._cursors.get(ticket_id) != before:
+                self._flush()
+
+    def _flush(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps({str(k): v for k, v in self._cursors.items()}), encoding="utf-8")
+        os.replace(tmp_path, self.path)
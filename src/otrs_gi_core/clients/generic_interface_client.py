@@ -1,34 +1,115 @@
 import asyncio
 import json
 import logging
+import random
 import uuid
+from contextlib import nullcontext
+from dataclasses import dataclass
 from http import HTTPMethod
+from time import perf_counter
 from types import TracebackType
-from typing import Any, Optional, Self, TypeVar, Union
+from typing import Any, AsyncIterator, Callable, ContextManager, Iterable, Optional, Self, TypeVar, Union
 
-from httpx import AsyncClient
+from httpx import AsyncClient, Response
 from pydantic import BaseModel
 
+from otrs_gi_core.clients.article_cursor import ArticleCursorStore
+from otrs_gi_core.clients.hooks import ACTIVE_EVENT, RequestEvent, RequestHook
+from otrs_gi_core.clients.tracing import REQUEST_ID_HEADER, TRACEPARENT_HEADER, Span, Tracer
 from otrs_gi_core.domain_models.basic_auth_model import BasicAuth
+from otrs_gi_core.domain_models.dynamic_fields import DynamicFieldSchema
 from otrs_gi_core.mappers import to_ws_ticket_create, from_ws_ticket_detail, to_ws_auth, to_ws_ticket_get, \
     to_ws_ticket_update, \
-    to_ws_ticket_search
+    to_ws_ticket_search, from_ws_article, from_ws_ticket_record
 from otrs_gi_core.domain_models.client_config import ClientConfig
-from otrs_gi_core.domain_models.ticket_models import TicketSearch, TicketUpdate, TicketCreate, Ticket
+from otrs_gi_core.domain_models.ticket_models import Article, TicketSearch, TicketUpdate, TicketCreate, Ticket
 from otrs_gi_core.domain_models.ticket_operation import TicketOperation
-from otrs_gi_core.models.request_models import (
-    WsTicketMutationRequest,
-)
+from otrs_gi_core.domain_models.ticket_record import TicketRecord
 from otrs_gi_core.models.response_models import (
     WsTicketSearchResponse,
     WsTicketGetResponse,
     WsTicketResponse,
 )
-from otrs_gi_core.util.errors import GenericInterfaceError
+from otrs_gi_core.models.ticket_models import WsTicketOutput
+from otrs_gi_core.util.attachments import AttachmentSink
+from otrs_gi_core.util.errors import GenericInterfaceError, ResponseTooLargeError
+from otrs_gi_core.util.json_stream import JsonArrayItemSplitter
+
+R = TypeVar("R")
+
+# Reusable stand-in for ``RequestMemory.stage`` when the call is not memory profiled.
+_NO_STAGE = nullcontext()
+
+# Dropped when a size-limited body is re-wrapped: it is already decoded and its length changed.
+_BODY_ENCODING_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+def _request_size(resp: Any) -> int:
+    try:
+        return len(resp.request.content)
+    except (AttributeError, RuntimeError, TypeError):
+        return 0
+
+
+def _response_size(resp: Any) -> int:
+    try:
+        return len(resp.content)
+    except (AttributeError, TypeError):
+        return len(resp.text)
+
+
+@dataclass(slots=True)
+class _Call:
+    """One GenericInterface request in flight, shared by the buffered and the streaming path."""
+
+    url: str
+    request_id: str
+    payload: dict[str, Any]
+    headers: dict[str, str]
+    event: Optional[RequestEvent]
+    owns_event: bool
+    started: float
+    log_debug: bool
+    pending: str = "network"
+
+    def lap(self) -> float:
+        """Seconds since the previous lap (or the start); phases are timed back to back."""
+        now = perf_counter()
+        elapsed, self.started = now - self.started, now
+        return elapsed
+
+    def charge(self, phase: str, then: str) -> None:
+        """Add the time since the previous lap to ``phase``; ``then`` is the phase that runs next."""
+        if self.event is not None:
+            timings = self.event.timings
+            setattr(timings, phase, getattr(timings, phase) + self.lap())
+        self.pending = then
+
+    def stage(self, name: str) -> ContextManager[None]:
+        memory = self.event.memory if self.event is not None else None
+        return memory.stage(name) if memory is not None else _NO_STAGE
+
+
+class _LogFields:
+    """Renders ``key=value`` pairs only when a handler actually formats the record."""
+
+    __slots__ = ("fields",)
+
+    def __init__(self, fields: dict[str, Any]):
+        self.fields = fields
+
+    def __str__(self) -> str:
+        return " ".join(f"{key}={value}" for key, value in self.fields.items())
 
 
 class GenericInterfaceClient:
-    def __init__(self, config: ClientConfig, client: Optional[AsyncClient] = None, max_retries: int = 2):
+    def __init__(self, config: ClientConfig, client: Optional[AsyncClient] = None, max_retries: int = 2,
+                 dynamic_field_schema: Optional[DynamicFieldSchema] = None,
+                 attachment_sink: Optional[AttachmentSink] = None,
+                 hooks: Optional[Iterable[RequestHook]] = None,
+                 tracer: Optional[Tracer] = None,
+                 debug_log_sample_rate: float = 1.0,
+                 max_response_bytes: Optional[int] = None):
         self.config = config
         self._client: AsyncClient = client or AsyncClient()
         self.base_url = config.base_url.rstrip("/")
@@ -36,8 +117,42 @@ class GenericInterfaceClient:
         self._auth: Optional[BasicAuth] = None
         self.operation_map = config.operation_url_map
         self.max_retries = max_retries
+        self.dynamic_field_schema = dynamic_field_schema
+        self.attachment_sink = attachment_sink
+        self._hooks: list[RequestHook] = list(hooks or [])
+        self.tracer = tracer
+        self.debug_log_sample_rate = debug_log_sample_rate
+        self.max_response_bytes = max_response_bytes
         self._logger = logging.getLogger(__name__)
 
+    def add_hook(self, hook: RequestHook) -> None:
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: RequestHook) -> None:
+        self._hooks.remove(hook)
+
+    def _notify(self, callback: str, event: RequestEvent) -> None:
+        for hook in self._hooks:
+            try:
+                getattr(hook, callback)(event)
+            except Exception:
+                self._logger.exception(f"[{event.request_id}] request hook {callback} failed")
+
+    def _span(self, name: str) -> ContextManager[Optional[Span]]:
+        """Parent span for calls fanning out into several requests; a no-op without tracer."""
+        if self.tracer is None:
+            return nullcontext()
+        return self.tracer.start_span(name, {"otrs_gi.webservice": self.webservice_name})
+
+    def _log(self, level: int, msg: str, **fields: Any) -> None:
+        """Log ``msg`` with ``fields`` attached to the record as ``otrs_gi``; callers check the level first."""
+        self._logger.log(level, "%s %s", msg, _LogFields(fields), extra={"otrs_gi": fields})
+
+    def _sample_debug(self) -> bool:
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return False
+        return self.debug_log_sample_rate >= 1.0 or random.random() < self.debug_log_sample_rate
+
     def _build_url(self, endpoint_name: str) -> str:
         return f"{self.base_url}/Webservice/{self.webservice_name}/{endpoint_name}"
 
@@ -49,6 +164,14 @@ class GenericInterfaceClient:
 
     T = TypeVar('T', bound=BaseModel)
 
+    def _span_args(self, method: HTTPMethod, operation: TicketOperation) -> tuple[str, dict[str, Any]]:
+        """Name and attributes of the span of a single request."""
+        return f"{self.webservice_name} {operation.name}", {
+            "http.method": method.value,
+            "otrs_gi.operation": operation.name,
+            "otrs_gi.webservice": self.webservice_name,
+        }
+
     async def _send(
             self,
             method: HTTPMethod,
@@ -56,37 +179,214 @@ class GenericInterfaceClient:
             response_model: type[T],
             data: Optional[dict[str, Any]] = None,
     ) -> T:
+        if self.tracer is None:
+            return await self._request(method, operation, response_model, data)
+        with self.tracer.start_span(*self._span_args(method, operation)) as span:
+            return await self._request(method, operation, response_model, data, span)
+
+    def _begin(
+            self,
+            method: HTTPMethod,
+            operation: TicketOperation,
+            data: Optional[dict[str, Any]],
+            span: Optional[Span],
+    ) -> _Call:
+        """Build payload and headers, tag ``span`` and notify ``before_send``; shared by all request paths."""
         if not self._auth:
             raise RuntimeError("Client is not authenticated")
-        ws_auth = to_ws_auth(self._auth)
-        endpoint_name = self.operation_map[operation]
-        url = self._build_url(endpoint_name)
+        # Timing is only recorded while hooks are registered; ``event`` stays None otherwise.
+        event: Optional[RequestEvent] = None
+        owns_event = False
+        if self._hooks:
+            event = ACTIVE_EVENT.get()
+            if event is None:
+                event = RequestEvent(operation=operation, method=method.value)
+                owns_event = True
+        started = perf_counter()
+        url = self._build_url(self.operation_map[operation])
         request_id = uuid.uuid4().hex
-        payload = ws_auth.model_dump(by_alias=True, exclude_none=True, with_secrets=True) | (data or {})
-
-        self._logger.debug(f"[{request_id}] {method.value} {url} payload_keys={list(payload.keys())}")
-        resp = await self._client.request(
-            str(method.value),
-            url,
-            json=payload,
-            headers={"Content-Type": "application/json", "Accept": "application/json"},
-        )
-        text = resp.text
-        self._logger.debug(f"[{request_id}] status={resp.status_code} length={len(text)}")
+        payload = to_ws_auth(self._auth).model_dump(by_alias=True, exclude_none=True, with_secrets=True) | (data or {})
+        headers = {"Content-Type": "application/json", "Accept": "application/json"}
+        if span is not None:
+            headers[TRACEPARENT_HEADER] = span.traceparent
+            headers[REQUEST_ID_HEADER] = request_id
+            span.attributes["otrs_gi.request_id"] = request_id
+            span.attributes["http.url"] = url
+        call = _Call(url, request_id, payload, headers, event, owns_event, started, self._sample_debug())
+        if event is not None:
+            event.request_id, event.url, event.webservice = request_id, url, self.webservice_name
+            event.timings.serialize += call.lap()
+            self._notify("before_send", event)
+            call.lap()
+        if call.log_debug:
+            self._log(
+                logging.DEBUG, "request",
+                request_id=request_id, method=method.value, url=url, payload_keys=list(payload),
+            )
+        return call
 
+    def _received(self, call: _Call, resp: Response, span: Optional[Span], streamed: bool = False) -> None:
+        """Record status, sizes and network time once the response (or, ``streamed``, its headers) arrived."""
+        if span is not None:
+            span.attributes["http.status_code"] = resp.status_code
+        if call.log_debug:
+            length = "streamed" if streamed else _response_size(resp)
+            self._log(logging.DEBUG, "response", request_id=call.request_id, status=resp.status_code, length=length)
+        event = call.event
+        if event is not None:
+            call.charge("network", "decode")
+            event.status_code = resp.status_code
+            event.request_bytes = _request_size(resp)
+            if not streamed:
+                event.response_bytes = _response_size(resp)
+
+    def _decode(self, call: _Call, resp: Response) -> Any:
         try:
-            body = resp.json()
+            with call.stage("raw_json"):
+                body = resp.json()
         except json.JSONDecodeError as e:
-            self._logger.error(f"[{request_id}] invalid JSON response: {text[:500]}")
+            if self._logger.isEnabledFor(logging.ERROR):
+                self._log(
+                    logging.ERROR, "invalid JSON response",
+                    request_id=call.request_id, status=resp.status_code, body=resp.text[:500],
+                )
             raise e
+        call.charge("decode", "validate")
+        return body
 
+    def _raise_api_error(self, call: _Call, body: Any) -> None:
         api_err = self._extract_error(body)
         if api_err:
-            self._logger.error(f"[{request_id}] OTOBO error {api_err.code}: {api_err.message}")
+            if self._logger.isEnabledFor(logging.ERROR):
+                self._log(
+                    logging.ERROR, "GenericInterface error",
+                    request_id=call.request_id, code=api_err.code, message=api_err.message,
+                )
             raise api_err
 
-        resp.raise_for_status()
-        return response_model.model_validate(body, strict=False)
+    def _finish(self, call: _Call, error: Optional[BaseException] = None) -> None:
+        """Notify ``on_error`` or ``after_response`` unless an enclosing ``_execute`` owns the event."""
+        event = call.event
+        if event is not None and error is not None:
+            call.charge(call.pending, call.pending)  # a failed call still took the time up to the failure
+        if event is None or not call.owns_event:
+            return
+        if error is None:
+            self._notify("after_response", event)
+        else:
+            event.error = error
+            self._notify("on_error", event)
+
+    async def _request(
+            self,
+            method: HTTPMethod,
+            operation: TicketOperation,
+            response_model: type[T],
+            data: Optional[dict[str, Any]] = None,
+            span: Optional[Span] = None,
+    ) -> T:
+        call = self._begin(method, operation, data, span)
+        try:
+            if self.max_response_bytes is None:
+                resp = await self._client.request(
+                    str(method.value),
+                    call.url,
+                    json=call.payload,
+                    headers=call.headers,
+                )
+            else:
+                resp = await self._request_limited(
+                    str(method.value), call.url, call.payload, call.headers, call.request_id
+                )
+            self._received(call, resp, span)
+            body = self._decode(call, resp)
+            self._raise_api_error(call, body)
+            resp.raise_for_status()
+            if call.event is None:
+                return response_model.model_validate(body, strict=False)
+            with call.stage("ws_models"):
+                result = response_model.model_validate(body, strict=False)
+            call.charge("validate", "map")
+        except Exception as exc:
+            self._finish(call, exc)
+            raise
+        self._finish(call)
+        return result
+
+    def _check_size(self, size: int, request_id: str) -> None:
+        limit = self.max_response_bytes
+        if limit is not None and size > limit:
+            if self._logger.isEnabledFor(logging.ERROR):
+                self._log(logging.ERROR, "response too large", request_id=request_id, limit=limit, size=size)
+            raise ResponseTooLargeError(limit, size)
+
+    async def _request_limited(
+            self,
+            method: str,
+            url: str,
+            payload: dict[str, Any],
+            headers: dict[str, str],
+            request_id: str,
+    ) -> Response:
+        """Like ``AsyncClient.request``, but stops reading once the body exceeds ``max_response_bytes``.
+
+        A ``Content-Length`` above the limit aborts before any of the body is read.
+        """
+        request = self._client.build_request(method, url, json=payload, headers=headers)
+        resp = await self._client.send(request, stream=True)
+        chunks = []
+        try:
+            declared = resp.headers.get("Content-Length", "")
+            if declared.isdigit():
+                self._check_size(int(declared), request_id)
+            size = 0
+            async for chunk in resp.aiter_bytes():
+                size += len(chunk)
+                self._check_size(size, request_id)
+                chunks.append(chunk)
+        finally:
+            await resp.aclose()
+        return Response(
+            resp.status_code,
+            headers=[(k, v) for k, v in resp.headers.multi_items() if k.lower() not in _BODY_ENCODING_HEADERS],
+            content=b"".join(chunks),
+            request=request,
+        )
+
+    async def _execute(
+            self,
+            method: HTTPMethod,
+            operation: TicketOperation,
+            response_model: type[T],
+            build: Callable[[], BaseModel],
+            parse: Callable[[T], R],
+    ) -> R:
+        """Serialize the request from ``build``, send it and map the response with ``parse``."""
+        if not self._hooks:
+            data = build().model_dump(exclude_none=True, by_alias=True)
+            return parse(await self._send(method, operation, response_model, data=data))
+
+        event = RequestEvent(operation=operation, method=method.value)
+        token = ACTIVE_EVENT.set(event)
+        try:
+            started = perf_counter()
+            data = build().model_dump(exclude_none=True, by_alias=True)
+            event.timings.serialize = perf_counter() - started
+            response = await self._send(method, operation, response_model, data=data)
+            started = perf_counter()
+            with event.memory.stage("domain_models") if event.memory is not None else _NO_STAGE:
+                result = parse(response)
+            if event.memory is not None:
+                event.memory.add_articles(result)
+            event.timings.map = perf_counter() - started
+        except Exception as exc:
+            event.error = exc
+            self._notify("on_error", event)
+            raise
+        finally:
+            ACTIVE_EVENT.reset(token)
+        self._notify("after_response", event)
+        return result
 
     def login(self, auth: BasicAuth):
         self._auth = auth
@@ -94,59 +394,229 @@ class GenericInterfaceClient:
     def logout(self):
         self._auth = None
 
+    def _parse_mutation(self, response: WsTicketResponse, action: str) -> Ticket:
+        if response.Ticket is None:
+            raise RuntimeError(f"{action} returned no Ticket")
+        return from_ws_ticket_detail(response.Ticket, self.dynamic_field_schema)
+
+    @staticmethod
+    def _single_ticket(response: WsTicketGetResponse) -> WsTicketOutput:
+        tickets = response.Ticket or []
+        if len(tickets) != 1:
+            raise RuntimeError(f"expected exactly one ticket, got {len(tickets)}")
+        return tickets[0]
+
     async def create_ticket(self, ticket: TicketCreate) -> Ticket:
-        request: WsTicketMutationRequest = to_ws_ticket_create(ticket)
-        response: WsTicketResponse = await self._send(
+        return await self._execute(
             HTTPMethod.POST,
             TicketOperation.CREATE,
             WsTicketResponse,
-            data=request.model_dump(exclude_none=True, by_alias=True),
+            lambda: to_ws_ticket_create(ticket, self.dynamic_field_schema),
+            lambda response: self._parse_mutation(response, "create"),
         )
-        if response.Ticket is None:
-            raise RuntimeError("create returned no Ticket")
-        return from_ws_ticket_detail(response.Ticket)
 
-    async def get_ticket(self, ticket_id: Union[int, str]) -> Ticket:
-        request = to_ws_ticket_get(int(ticket_id))
-        response: WsTicketGetResponse = await self._send(
+    async def get_ticket(self, ticket_id: Union[int, str], article_limit: Optional[int] = 5) -> Ticket:
+        return await self._execute(
             HTTPMethod.POST,
             TicketOperation.GET,
             WsTicketGetResponse,
-            data=request.model_dump(exclude_none=True, by_alias=True),
-        )
-        tickets = response.Ticket or []
-        if len(tickets) != 1:
-            raise RuntimeError(f"expected exactly one ticket, got {len(tickets)}")
-        return from_ws_ticket_detail(
-            tickets[0]
+            lambda: to_ws_ticket_get(
+                int(ticket_id), article_limit=article_limit, include_attachments=self.attachment_sink is not None
+            ),
+            lambda response: from_ws_ticket_detail(
+                self._single_ticket(response),
+                self.dynamic_field_schema,
+                attachment_sink=self.attachment_sink,
+            ),
         )
 
+    async def iter_tickets(
+            self,
+            ticket_ids: Iterable[Union[int, str]],
+            include_articles: bool = True,
+            article_limit: Optional[int] = 5,
+    ) -> AsyncIterator[Ticket]:
+        """Get several tickets with one TicketGet and yield each as soon as it has been received.
+
+        The response is parsed incrementally, so memory is bounded by the largest
+        ticket instead of the whole response; ``max_response_bytes`` limits each
+        ticket here, not the response. An ``Error`` payload is raised after the
+        tickets that preceded it. Hooks and the tracer see one TicketGet whose
+        timings leave out the time the caller spends between tickets; stopping
+        early reports the call as completed.
+        """
+        ids = [int(i) for i in ticket_ids]
+        if not ids:
+            return
+        data = to_ws_ticket_get(
+            ids[0],
+            article_limit=article_limit,
+            include_articles=include_articles,
+            include_attachments=self.attachment_sink is not None,
+        ).model_dump(exclude_none=True, by_alias=True)
+        data["TicketID"] = ",".join(map(str, ids))
+        span: Optional[Span] = None
+        if self.tracer is not None:
+            # Not made current: the caller's code runs between the yields and must not become a child.
+            span = self.tracer.open_span(*self._span_args(HTTPMethod.POST, TicketOperation.GET))
+            span.attributes["otrs_gi.tickets"] = len(ids)
+        call: Optional[_Call] = None
+        error: Optional[BaseException] = None
+        try:
+            call = self._begin(HTTPMethod.POST, TicketOperation.GET, data, span)
+            event = call.event
+            splitter = JsonArrayItemSplitter("Ticket", self.max_response_bytes)
+            request = self._client.build_request(
+                HTTPMethod.POST.value, call.url, json=call.payload, headers=call.headers
+            )
+            resp = await self._client.send(request, stream=True)
+            try:
+                self._received(call, resp, span, streamed=True)
+                if resp.is_error:
+                    await resp.aread()
+                    self._raise_api_error(call, self._decode(call, resp))
+                    resp.raise_for_status()
+                async for chunk in resp.aiter_bytes():
+                    if event is not None:
+                        event.response_bytes += len(chunk)
+                    call.charge("network", "decode")
+                    with call.stage("raw_json"):
+                        items = splitter.feed(chunk)
+                    call.charge("decode", "validate")
+                    for raw in items:
+                        with call.stage("ws_models"):
+                            ws_ticket = WsTicketOutput.model_validate_json(raw)
+                        call.charge("validate", "map")
+                        with call.stage("domain_models"):
+                            ticket = from_ws_ticket_detail(
+                                ws_ticket, self.dynamic_field_schema, attachment_sink=self.attachment_sink
+                            )
+                        if event is not None and event.memory is not None:
+                            event.memory.add_articles(ticket)
+                        call.charge("map", "validate")
+                        yield ticket
+                        call.lap()  # time spent by the caller is not part of the request
+                    call.pending = "network"
+                splitter.close()
+            finally:
+                await resp.aclose()
+            self._raise_api_error(call, splitter.members)
+        except Exception as exc:
+            error = exc
+            raise
+        finally:
+            if call is not None:
+                self._finish(call, error)
+            if span is not None and self.tracer is not None:
+                self.tracer.end_span(span, error)
+
+    async def get_new_articles(
+            self,
+            ticket_id: Union[int, str],
+            after_article_id: Optional[int] = None,
+            page_size: int = 1,
+    ) -> list[Article]:
+        """Return the articles of a ticket with an ArticleID above ``after_article_id``.
+
+        Articles are requested newest first in pages of ``page_size``; the page
+        doubles only while every returned article is still new, so polling a
+        ticket without new content costs a single request for one article. Without
+        ``after_article_id`` all articles are returned. The result is sorted
+        oldest first.
+        """
+        limit: Optional[int] = page_size if after_article_id is not None else None
+        while True:
+            request = to_ws_ticket_get(
+                int(ticket_id),
+                article_order="DESC",
+                article_limit=limit,
+                include_dynamic_fields=False,
+                include_attachments=self.attachment_sink is not None,
+            )
+            response: WsTicketGetResponse = await self._send(
+                HTTPMethod.POST,
+                TicketOperation.GET,
+                WsTicketGetResponse,
+                data=request.model_dump(exclude_none=True, by_alias=True),
+            )
+            ws_articles = self._single_ticket(response).get_articles()
+            new_articles = [
+                a for a in ws_articles
+                if after_article_id is None or (a.ArticleID is not None and a.ArticleID > after_article_id)
+            ]
+            if limit is None or len(ws_articles) < limit or len(new_articles) < len(ws_articles):
+                break
+            limit *= 2
+        new_articles.sort(key=lambda a: a.ArticleID or 0)
+        return [from_ws_article(a, self.attachment_sink) for a in new_articles]
+
+    async def poll_new_articles(self, ticket_id: Union[int, str], cursor_store: ArticleCursorStore) -> list[Article]:
+        ticket_id = int(ticket_id)
+        articles = await self.get_new_articles(ticket_id, cursor_store.get(ticket_id))
+        article_ids = [a.article_id for a in articles if a.article_id is not None]
+        if article_ids:
+            cursor_store.set(ticket_id, max(article_ids))
+        return articles
+
     async def update_ticket(self, ticket: TicketUpdate) -> Ticket:
-        request = to_ws_ticket_update(ticket)
-        response: WsTicketResponse = await self._send(
+        return await self._execute(
             HTTPMethod.PUT,
             TicketOperation.UPDATE,
             WsTicketResponse,
-            data=request.model_dump(exclude_none=True, by_alias=True),
+            lambda: to_ws_ticket_update(ticket, self.dynamic_field_schema),
+            lambda response: self._parse_mutation(response, "update"),
         )
-        if response.Ticket is None:
-            raise RuntimeError("update returned no Ticket")
-        return from_ws_ticket_detail(response.Ticket)
 
     async def search_tickets(self, ticket_search: TicketSearch) -> list[int]:
-        request = to_ws_ticket_search(ticket_search)
-        response: WsTicketSearchResponse = await self._send(
+        return await self._execute(
             HTTPMethod.POST,
             TicketOperation.SEARCH,
             WsTicketSearchResponse,
-            data=request.model_dump(exclude_none=True, by_alias=True),
+            lambda: to_ws_ticket_search(ticket_search),
+            lambda response: response.TicketID or [],
         )
-        return response.TicketID or []
 
     async def search_and_get(self, ticket_search: TicketSearch) -> list[Ticket]:
-        ids = await self.search_tickets(ticket_search)
-        tasks = [self.get_ticket(i) for i in ids]
-        return await asyncio.gather(*tasks)
+        with self._span("search_and_get") as span:
+            ids = await self.search_tickets(ticket_search)
+            if span is not None:
+                span.attributes["otrs_gi.ticket_count"] = len(ids)
+            tasks = [self.get_ticket(i) for i in ids]
+            return await asyncio.gather(*tasks)
+
+    async def get_ticket_record(
+            self,
+            ticket_id: Union[int, str],
+            include_articles: bool = False,
+            article_limit: Optional[int] = 5,
+    ) -> TicketRecord:
+        return await self._execute(
+            HTTPMethod.POST,
+            TicketOperation.GET,
+            WsTicketGetResponse,
+            lambda: to_ws_ticket_get(int(ticket_id), include_articles=include_articles, article_limit=article_limit),
+            lambda response: from_ws_ticket_record(
+                self._single_ticket(response),
+                self.dynamic_field_schema,
+                include_articles=include_articles,
+            ),
+        )
+
+    async def search_and_get_records(
+            self,
+            ticket_search: TicketSearch,
+            include_articles: bool = False,
+    ) -> list[TicketRecord]:
+        """Bulk variant of :meth:`search_and_get` returning compact :class:`TicketRecord` tuples.
+
+        Articles are neither requested nor kept unless ``include_articles`` is set.
+        """
+        with self._span("search_and_get_records") as span:
+            ids = await self.search_tickets(ticket_search)
+            if span is not None:
+                span.attributes["otrs_gi.ticket_count"] = len(ids)
+            tasks = [self.get_ticket_record(i, include_articles=include_articles) for i in ids]
+            return await asyncio.gather(*tasks)
 
     async def aclose(self) -> None:
         await self._client.aclose()
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
+
+from otrs_gi_core.domain_models.ticket_operation import TicketOperation
+
+
+@dataclass(slots=True)
+class RequestTimings:
+    """Seconds spent per phase of a GenericInterface call.
+
+    ``serialize`` covers mapping to the request model and ``model_dump``; JSON
+    encoding happens inside httpx and is part of ``network``. ``decode`` is
+    ``response.json()``, ``validate`` the pydantic response validation and
+    ``map`` the conversion to domain models.
+    """
+
+    serialize: float = 0.0
+    network: float = 0.0
+    decode: float = 0.0
+    validate: float = 0.0
+    map: float = 0.0
+
+    @property
+    def total(self) -> float:
+        return self.serialize + self.network + self.decode + self.validate + self.map
+
+
+def _deep_size(root: Any) -> int:
+    """``sys.getsizeof`` of ``root`` plus everything reachable through containers and attributes, each once."""
+    seen: set[int] = set()
+    stack = [root]
+    size = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, (str, bytes, bytearray, int, float, bool)) or obj is None:
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__"):
+            stack.append(obj.__dict__)
+    return size
+
+
+@dataclass(slots=True)
+class RequestMemory:
+    """Bytes allocated and still referenced at the end of each stage of a profiled call.
+
+    Only filled in while :mod:`tracemalloc` is tracing. ``raw_json`` is the
+    decoded response (the buffered body is ``response_bytes``), ``ws_models``
+    the validated response models and ``domain_models`` the mapped result.
+    Stage values are net bytes (allocated minus freed during the stage), so
+    they can be negative, e.g. when mapping frees more than the domain models
+    add because these share their strings with the Ws models. ``articles`` is
+    not part of that sum: it is the ``sys.getsizeof`` size of the mapped
+    articles, shared strings included, computed when ``article_breakdown``
+    is set (attributing tracemalloc snapshots costs time proportional to the
+    whole heap). ``peak`` is the highest transient allocation of a single
+    stage and ``traced_peak`` the highest traced heap seen by any stage.
+    """
+
+    raw_json: int = 0
+    ws_models: int = 0
+    domain_models: int = 0
+    articles: int = 0
+    peak: int = 0
+    traced_peak: int = 0
+    article_breakdown: bool = False
+
+    @property
+    def total(self) -> int:
+        return self.raw_json + self.ws_models + self.domain_models
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Add the bytes the body allocates and keeps to the ``name`` counter."""
+        if not tracemalloc.is_tracing():
+            yield
+            return
+        before, earlier_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        yield
+        current, peak = tracemalloc.get_traced_memory()
+        setattr(self, name, getattr(self, name) + current - before)
+        self.peak = max(self.peak, peak - before)
+        self.traced_peak = max(self.traced_peak, earlier_peak, peak)
+
+    def add_articles(self, result: Any) -> None:
+        """Count the articles of a mapped ``Ticket`` or ``TicketRecord`` when ``article_breakdown`` is set."""
+        articles = getattr(result, "articles", None)
+        if self.article_breakdown and articles:
+            self.articles += _deep_size(articles)
+
+
+@dataclass(slots=True)
+class RequestEvent:
+    operation: TicketOperation
+    method: str
+    request_id: str = ""
+    url: str = ""
+    webservice: str = ""
+    status_code: Optional[int] = None
+    request_bytes: int = 0
+    response_bytes: int = 0
+    timings: RequestTimings = field(default_factory=RequestTimings)
+    error: Optional[BaseException] = None
+    # Set by a hook in ``before_send`` (see ``MemoryProfiler``) to profile this call's memory.
+    memory: Optional[RequestMemory] = None
+
+
+class RequestHook:
+    """Observer for client requests; override the callbacks you need.
+
+    ``before_send`` runs right before the HTTP request, ``after_response`` once
+    the result has been mapped and ``on_error`` when the call raised. Exceptions
+    raised by hooks are logged and otherwise ignored.
+    """
+
+    def before_send(self, event: RequestEvent) -> None:
+        pass
+
+    def after_response(self, event: RequestEvent) -> None:
+        pass
+
+    def on_error(self, event: RequestEvent) -> None:
+        pass
+
+
+# Event of the public client call currently in progress, shared with ``_send``.
+ACTIVE_EVENT: ContextVar[Optional[RequestEvent]] = ContextVar("otrs_gi_active_request_event", default=None)
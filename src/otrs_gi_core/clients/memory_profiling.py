@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import random
+import tracemalloc
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Optional
+
+from otrs_gi_core.clients.hooks import RequestEvent, RequestHook, RequestMemory
+
+STAGES = ("raw_json", "ws_models", "domain_models", "articles")
+
+
+@dataclass
+class _Totals:
+    calls: int = 0
+    raw_json: int = 0
+    ws_models: int = 0
+    domain_models: int = 0
+    articles: int = 0
+    peak: int = 0
+
+
+@dataclass(frozen=True)
+class StageMemory:
+    """Net bytes per stage summed over the profiled calls of one operation (see :class:`RequestMemory`).
+
+    ``peak`` is the largest single stage.
+    """
+
+    operation: str
+    calls: int
+    raw_json: int
+    ws_models: int
+    domain_models: int
+    articles: int
+    peak: int
+
+    @property
+    def total(self) -> int:
+        return self.raw_json + self.ws_models + self.domain_models
+
+    def per_call(self, stage: str) -> float:
+        return getattr(self, stage) / self.calls if self.calls else 0.0
+
+
+@dataclass(frozen=True)
+class MemoryReport:
+    operations: dict[str, StageMemory]
+    traced_current: int
+    traced_peak: int
+    failed_calls: int
+
+    def format(self) -> str:
+        """Plain-text table of the net bytes per call and stage."""
+        lines = [f"{'operation':<14} {'calls':>7} " + " ".join(f"{stage:>14}" for stage in STAGES) + f" {'peak':>12}"]
+        for stats in self.operations.values():
+            lines.append(
+                f"{stats.operation:<14} {stats.calls:>7} "
+                + " ".join(f"{stats.per_call(stage):>14,.0f}" for stage in STAGES)
+                + f" {stats.peak:>12,}"
+            )
+        lines.append(f"traced memory: {self.traced_current:,} bytes, peak {self.traced_peak:,} bytes")
+        lines.append(
+            "stages are net bytes (allocated minus freed) and can be negative; articles is the getsizeof "
+            "size of the mapped articles, not a share of domain_models"
+        )
+        return "\n".join(lines)
+
+
+class MemoryProfiler(RequestHook):
+    """Opt-in memory profile of client calls, split into stages.
+
+    While started, :mod:`tracemalloc` traces every allocation, which roughly
+    halves throughput; ``sample_rate`` only limits which calls are measured
+    (and snapshotted for the article breakdown), not the tracing cost. The
+    stages are synchronous, so concurrent calls do not distort each other.
+
+    Use it as a hook and a context manager around an export::
+
+        profiler = MemoryProfiler(sample_rate=0.1)
+        client.add_hook(profiler)
+        with profiler:
+            await client.search_and_get(search)
+        print(profiler.report().format())
+    """
+
+    def __init__(
+            self,
+            sample_rate: float = 1.0,
+            article_breakdown: bool = True,
+            traceback_limit: int = 16,
+            seed: Optional[int] = None,
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.article_breakdown = article_breakdown
+        self.traceback_limit = traceback_limit
+        self._rng = random.Random(seed)
+        self._owns_tracing = False
+        self._totals: dict[str, _Totals] = {}
+        self._failed = 0
+        self._traced_peak = 0
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+
+    def start(self) -> None:
+        """Start tracemalloc unless something else already traces, and reset its peak."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.traceback_limit)
+            self._owns_tracing = True
+        tracemalloc.reset_peak()
+
+    def stop(self) -> None:
+        if self._owns_tracing:
+            self._traced_peak = max(self._traced_peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+    def __enter__(self) -> MemoryProfiler:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type: Optional[type[BaseException]], exc: Optional[BaseException],
+                 tb: Optional[TracebackType]) -> None:
+        self.stop()
+
+    def before_send(self, event: RequestEvent) -> None:
+        if event.memory is None and tracemalloc.is_tracing() and self._rng.random() < self.sample_rate:
+            event.memory = RequestMemory(article_breakdown=self.article_breakdown)
+
+    def after_response(self, event: RequestEvent) -> None:
+        memory = event.memory
+        if memory is None:
+            return
+        totals = self._totals.setdefault(event.operation.value, _Totals())
+        totals.calls += 1
+        totals.raw_json += memory.raw_json
+        totals.ws_models += memory.ws_models
+        totals.domain_models += memory.domain_models
+        totals.articles += memory.articles
+        totals.peak = max(totals.peak, memory.peak)
+        self._traced_peak = max(self._traced_peak, memory.traced_peak)
+        if tracemalloc.is_tracing():
+            self._traced_peak = max(self._traced_peak, tracemalloc.get_traced_memory()[1])
+
+    def on_error(self, event: RequestEvent) -> None:
+        if event.memory is not None:
+            self._failed += 1
+
+    def reset(self) -> None:
+        self._totals.clear()
+        self._failed = 0
+        self._traced_peak = 0
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+
+    def report(self) -> MemoryReport:
+        """Per-operation stage totals; ``traced_peak`` is the highest traced heap since :meth:`start`."""
+        current, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+        return MemoryReport(
+            operations={
+                operation: StageMemory(
+                    operation, t.calls, t.raw_json, t.ws_models, t.domain_models, t.articles, t.peak
+                )
+                for operation, t in self._totals.items()
+            },
+            traced_current=current,
+            traced_peak=max(self._traced_peak, peak),
+            failed_calls=self._failed,
+        )
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import math
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from otrs_gi_core.clients.hooks import RequestEvent, RequestHook
+from otrs_gi_core.util.errors import GenericInterfaceError
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+PHASES = ("serialize", "network", "decode", "validate", "map")
+
+SeriesKey = tuple[str, str]
+
+
+class Histogram:
+    """Fixed-bucket histogram with Prometheus ``le`` semantics.
+
+    Observations only increment counters, so there is no locking; the client
+    records from its event loop thread.
+    """
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self.buckets: tuple[float, ...] = tuple(sorted(buckets))
+        self.counts: list[int] = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[int]:
+        total = 0
+        result = []
+        for c in self.counts:
+            total += c
+            result.append(total)
+        return result
+
+    def quantile(self, q: float) -> float:
+        """Estimate the ``q`` quantile by linear interpolation inside the matching bucket."""
+        if self.count == 0:
+            return math.nan
+        rank = q * self.count
+        cumulative = 0
+        for index, c in enumerate(self.counts):
+            if cumulative + c >= rank and c:
+                if index == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - cumulative) / c
+            cumulative += c
+        return self.buckets[-1]
+
+
+@dataclass
+class _Series:
+    latency: Histogram
+    phase_seconds: dict[str, float]
+    requests: int = 0
+    errors: int = 0
+    in_flight: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+
+
+@dataclass(frozen=True)
+class OperationStats:
+    operation: str
+    webservice: str
+    requests: int
+    errors: int
+    in_flight: int
+    bytes_sent: int
+    bytes_received: int
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    operations: dict[SeriesKey, OperationStats]
+    errors_by_code: dict[tuple[str, str, str], int]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _format(value: float) -> str:
+    return "+Inf" if value == math.inf else repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class ClientMetrics(RequestHook):
+    """Request hook aggregating latency histograms, sizes, errors and in-flight counts.
+
+    Series are keyed by ``TicketOperation`` name and webservice. Register it with
+    ``client.add_hook(metrics)``; one instance can be shared by several clients.
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS, namespace: str = "otrs_gi") -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.namespace = namespace
+        self._series: dict[SeriesKey, _Series] = {}
+        self._errors: dict[tuple[str, str, str], int] = {}
+
+    def _get_series(self, event: RequestEvent) -> _Series:
+        key = (event.operation.name, event.webservice)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _Series(Histogram(self.buckets), dict.fromkeys(PHASES, 0.0))
+        return series
+
+    def before_send(self, event: RequestEvent) -> None:
+        self._get_series(event).in_flight += 1
+
+    def _finish(self, event: RequestEvent) -> _Series:
+        series = self._get_series(event)
+        if event.request_id:
+            # before_send ran, so the request was counted as in flight
+            series.in_flight -= 1
+        series.requests += 1
+        series.bytes_sent += event.request_bytes
+        series.bytes_received += event.response_bytes
+        timings = event.timings
+        for phase in PHASES:
+            series.phase_seconds[phase] += getattr(timings, phase)
+        series.latency.observe(timings.total)
+        return series
+
+    def after_response(self, event: RequestEvent) -> None:
+        self._finish(event)
+
+    def on_error(self, event: RequestEvent) -> None:
+        series = self._finish(event)
+        series.errors += 1
+        error = event.error
+        code = error.code if isinstance(error, GenericInterfaceError) else type(error).__name__
+        key = (event.operation.name, event.webservice, code or "unknown")
+        self._errors[key] = self._errors.get(key, 0) + 1
+
+    def reset(self) -> None:
+        self._series.clear()
+        self._errors.clear()
+
+    def snapshot(self) -> MetricsSnapshot:
+        operations = {}
+        for (operation, webservice), s in self._series.items():
+            latency = s.latency
+            operations[(operation, webservice)] = OperationStats(
+                operation=operation,
+                webservice=webservice,
+                requests=s.requests,
+                errors=s.errors,
+                in_flight=s.in_flight,
+                bytes_sent=s.bytes_sent,
+                bytes_received=s.bytes_received,
+                mean=latency.sum / latency.count if latency.count else math.nan,
+                p50=latency.quantile(0.5),
+                p95=latency.quantile(0.95),
+                p99=latency.quantile(0.99),
+            )
+        return MetricsSnapshot(operations, dict(self._errors))
+
+    def render_prometheus(self, extra_labels: Optional[dict[str, str]] = None) -> str:
+        """Render all series in the Prometheus text exposition format (version 0.0.4)."""
+        ns = self.namespace
+        extra = extra_labels or {}
+        lines: list[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {ns}_{name} {help_text}")
+            lines.append(f"# TYPE {ns}_{name} {kind}")
+
+        family("request_duration_seconds", "histogram", "GenericInterface request latency.")
+        for (operation, webservice), s in self._series.items():
+            base = {**extra, "operation": operation, "webservice": webservice}
+            bounds = [*s.latency.buckets, math.inf]
+            for bound, count in zip(bounds, s.latency.cumulative()):
+                lines.append(f"{ns}_request_duration_seconds_bucket{_labels(**base, le=_format(bound))} {count}")
+            lines.append(f"{ns}_request_duration_seconds_sum{_labels(**base)} {_format(s.latency.sum)}")
+            lines.append(f"{ns}_request_duration_seconds_count{_labels(**base)} {s.latency.count}")
+
+        family("request_phase_seconds_total", "counter", "Time spent per request phase.")
+        for (operation, webservice), s in self._series.items():
+            for phase, seconds in s.phase_seconds.items():
+                labels = _labels(**extra, operation=operation, webservice=webservice, phase=phase)
+                lines.append(f"{ns}_request_phase_seconds_total{labels} {_format(seconds)}")
+
+        family("requests_total", "counter", "Completed GenericInterface requests.")
+        for (operation, webservice), s in self._series.items():
+            labels = _labels(**extra, operation=operation, webservice=webservice)
+            lines.append(f"{ns}_requests_total{labels} {s.requests}")
+
+        family("request_bytes_total", "counter", "Request and response body bytes.")
+        for (operation, webservice), s in self._series.items():
+            for direction, value in (("sent", s.bytes_sent), ("received", s.bytes_received)):
+                labels = _labels(**extra, operation=operation, webservice=webservice, direction=direction)
+                lines.append(f"{ns}_request_bytes_total{labels} {value}")
+
+        family("requests_in_flight", "gauge", "Requests currently waiting for a response.")
+        for (operation, webservice), s in self._series.items():
+            labels = _labels(**extra, operation=operation, webservice=webservice)
+            lines.append(f"{ns}_requests_in_flight{labels} {s.in_flight}")
+
+        family("request_errors_total", "counter", "Failed requests by GenericInterface error code or exception type.")
+        for (operation, webservice, code), count in self._errors.items():
+            labels = _labels(**extra, operation=operation, webservice=webservice, code=code)
+            lines.append(f"{ns}_request_errors_total{labels} {count}")
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import json
+import logging
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Optional, Protocol, Union, runtime_checkable
+
+TRACEPARENT_HEADER = "traceparent"
+REQUEST_ID_HEADER = "X-Request-ID"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class Span:
+    """A finished or running span; ids are lower-case hex as in W3C trace context."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    start_ns: int = 0
+    end_ns: Optional[int] = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    @property
+    def duration(self) -> Optional[float]:
+        return None if self.end_ns is None else (self.end_ns - self.start_ns) / 1e9
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "status": "error" if self.error else "ok",
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+CURRENT_SPAN: ContextVar[Optional[Span]] = ContextVar("otrs_gi_current_span", default=None)
+
+
+def parse_traceparent(header: str) -> Optional[tuple[str, str]]:
+    """Return ``(trace_id, span_id)`` of a version 00 ``traceparent`` header, or None if it is invalid."""
+    parts = header.strip().split("-")
+    if len(parts) != 4 or parts[0] != "00" or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    trace_id, span_id = parts[1].lower(), parts[2].lower()
+    try:
+        int(trace_id, 16), int(span_id, 16)
+    except ValueError:
+        return None
+    if trace_id == "0" * 32 or span_id == "0" * 16:
+        return None
+    return trace_id, span_id
+
+
+@runtime_checkable
+class SpanExporter(Protocol):
+    """Receives every finished span; ``close`` is called by :meth:`Tracer.close`."""
+
+    def export(self, span: Span) -> None:
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+class JsonLinesSpanExporter:
+    """Appends one JSON object per finished span to ``path``."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._file: Optional[Any] = None
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str) + "\n"
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self.path.open("a", encoding="utf-8")
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class OpenTelemetrySpanExporter:
+    """Forwards spans to an OpenTelemetry SDK span processor, keeping their trace and span ids.
+
+    The ids sent to OTOBO in the ``traceparent`` header therefore match the ones
+    in the OpenTelemetry backend. Requires the ``otel`` extra.
+    """
+
+    def __init__(self, span_processor: Any, service_name: str = "otrs-gi-client"):
+        try:
+            from opentelemetry.sdk.resources import Resource
+            from opentelemetry.sdk.trace import ReadableSpan
+            from opentelemetry.trace import SpanContext, SpanKind, Status, StatusCode, TraceFlags
+        except ImportError as exc:
+            raise ImportError(
+                "opentelemetry-sdk is required for OpenTelemetry export; "
+                "install the 'otel' extra, e.g. `pip install otobo[otel]`"
+            ) from exc
+        self.span_processor = span_processor
+        self.resource = Resource.create({"service.name": service_name})
+        self._readable_span = ReadableSpan
+        self._span_context = SpanContext
+        self._span_kind = SpanKind
+        self._status = Status
+        self._status_code = StatusCode
+        self._sampled = TraceFlags(TraceFlags.SAMPLED)
+
+    def _context(self, trace_id: str, span_id: str) -> Any:
+        return self._span_context(int(trace_id, 16), int(span_id, 16), is_remote=False, trace_flags=self._sampled)
+
+    def export(self, span: Span) -> None:
+        status = self._status(self._status_code.ERROR, span.error) if span.error else self._status(self._status_code.OK)
+        readable = self._readable_span(
+            name=span.name,
+            context=self._context(span.trace_id, span.span_id),
+            parent=self._context(span.trace_id, span.parent_id) if span.parent_id else None,
+            resource=self.resource,
+            kind=self._span_kind.CLIENT if "http.method" in span.attributes else self._span_kind.INTERNAL,
+            attributes={k: v for k, v in span.attributes.items() if v is not None},
+            start_time=span.start_ns,
+            end_time=span.end_ns,
+            status=status,
+        )
+        self.span_processor.on_end(readable)
+
+    def close(self) -> None:
+        self.span_processor.shutdown()
+
+
+class Tracer:
+    """Creates spans for client calls and hands finished spans to ``exporter``.
+
+    The active span is kept in a context variable, so spans opened inside
+    tasks started from a span (e.g. the ``get_ticket`` calls of
+    ``search_and_get``) become its children.
+    """
+
+    def __init__(self, exporter: SpanExporter):
+        self.exporter = exporter
+
+    @contextmanager
+    def start_span(
+            self,
+            name: str,
+            attributes: Optional[dict[str, Any]] = None,
+            traceparent: Optional[str] = None,
+    ) -> Iterator[Span]:
+        """Open a child of the current span, of ``traceparent`` if given, or a new trace, and make it current."""
+        span = self.open_span(name, attributes, traceparent)
+        token = CURRENT_SPAN.set(span)
+        error: Optional[BaseException] = None
+        try:
+            yield span
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            CURRENT_SPAN.reset(token)
+            self.end_span(span, error)
+
+    def open_span(
+            self,
+            name: str,
+            attributes: Optional[dict[str, Any]] = None,
+            traceparent: Optional[str] = None,
+    ) -> Span:
+        """Like :meth:`start_span`, but the span does not become current and must be ended with :meth:`end_span`.
+
+        Meant for spans that stay open across ``yield``, where the caller's code
+        runs in between and must not become a child.
+        """
+        parent = CURRENT_SPAN.get()
+        remote = parse_traceparent(traceparent) if traceparent else None
+        if remote is not None:
+            trace_id, parent_id = remote
+        elif parent is not None:
+            trace_id, parent_id = parent.trace_id, parent.span_id
+        else:
+            trace_id, parent_id = secrets.token_hex(16), None
+        return Span(
+            name=name,
+            trace_id=trace_id,
+            span_id=secrets.token_hex(8),
+            parent_id=parent_id,
+            start_ns=time.time_ns(),
+            attributes=dict(attributes or {}),
+        )
+
+    def end_span(self, span: Span, error: Optional[BaseException] = None) -> None:
+        """Finish ``span``, marking it failed if ``error`` is given, and export it."""
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+        span.end_ns = time.time_ns()
+        try:
+            self.exporter.export(span)
+        except Exception:
+            logger.exception(f"failed to export span {span.name} {span.span_id}")
+
+    def close(self) -> None:
+        self.exporter.close()
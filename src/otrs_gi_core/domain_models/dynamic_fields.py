@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Mapping, Optional, TypeAlias, Union
+
+logger = logging.getLogger(__name__)
+
+WsDynamicFieldValue: TypeAlias = Union[str, list[str], None]
+
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+DATE_FORMAT = "%Y-%m-%d"
+
+
+class DynamicFieldType(Enum):
+    TEXT = "Text"
+    TEXTAREA = "TextArea"
+    DROPDOWN = "Dropdown"
+    MULTISELECT = "Multiselect"
+    CHECKBOX = "Checkbox"
+    DATE = "Date"
+    DATETIME = "DateTime"
+    INTEGER = "Integer"
+    DECIMAL = "Decimal"
+
+
+@dataclass(frozen=True, slots=True)
+class DynamicFieldConverter:
+    decode: Callable[[Any], Any]
+    encode: Callable[[Any], WsDynamicFieldValue]
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime(value: str) -> datetime:
+    for fmt in (DATETIME_FORMAT, DATE_FORMAT):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return datetime.fromisoformat(value)
+
+
+def _decode_text(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, list):
+        return value[0] if value else None
+    return str(value)
+
+
+def _decode_list(value: Any) -> list[str]:
+    if value is None or value == "":
+        return []
+    if isinstance(value, list):
+        return [str(v) for v in value]
+    return [str(value)]
+
+
+def _decode_checkbox(value: Any) -> Optional[bool]:
+    text = _decode_text(value)
+    if text is None or text == "":
+        return None
+    return text.strip() == "1"
+
+
+def _decode_date(value: Any) -> Optional[date]:
+    text = _decode_text(value)
+    return _parse_datetime(text).date() if text else None
+
+
+def _decode_datetime(value: Any) -> Optional[datetime]:
+    text = _decode_text(value)
+    return _parse_datetime(text) if text else None
+
+
+def _decode_integer(value: Any) -> Optional[int]:
+    text = _decode_text(value)
+    return int(text) if text else None
+
+
+def _decode_decimal(value: Any) -> Optional[Decimal]:
+    text = _decode_text(value)
+    return Decimal(text) if text else None
+
+
+def _encode_text(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _encode_list(value: Any) -> list[str]:
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [str(v) for v in value]
+    return [str(value)]
+
+
+def _encode_checkbox(value: Any) -> Optional[str]:
+    return None if value is None else ("1" if value else "0")
+
+
+def _encode_date(value: Any) -> Optional[str]:
+    if isinstance(value, (date, datetime)):
+        return value.strftime(DATE_FORMAT)
+    return _encode_text(value)
+
+
+def _encode_datetime(value: Any) -> Optional[str]:
+    if isinstance(value, datetime):
+        return value.strftime(DATETIME_FORMAT)
+    if isinstance(value, date):
+        return f"{value.strftime(DATE_FORMAT)} 00:00:00"
+    return _encode_text(value)
+
+
+TEXT_CONVERTER = DynamicFieldConverter(decode=_decode_text, encode=_encode_text)
+
+DEFAULT_CONVERTERS: dict[DynamicFieldType, DynamicFieldConverter] = {
+    DynamicFieldType.TEXT: TEXT_CONVERTER,
+    DynamicFieldType.TEXTAREA: TEXT_CONVERTER,
+    DynamicFieldType.DROPDOWN: TEXT_CONVERTER,
+    DynamicFieldType.MULTISELECT: DynamicFieldConverter(decode=_decode_list, encode=_encode_list),
+    DynamicFieldType.CHECKBOX: DynamicFieldConverter(decode=_decode_checkbox, encode=_encode_checkbox),
+    DynamicFieldType.DATE: DynamicFieldConverter(decode=_decode_date, encode=_encode_date),
+    DynamicFieldType.DATETIME: DynamicFieldConverter(decode=_decode_datetime, encode=_encode_datetime),
+    DynamicFieldType.INTEGER: DynamicFieldConverter(decode=_decode_integer, encode=_encode_text),
+    DynamicFieldType.DECIMAL: DynamicFieldConverter(decode=_decode_decimal, encode=_encode_text),
+}
+
+
+class DynamicFieldSchema:
+    """Registry mapping dynamic field names to converters.
+
+    Converters are resolved once at registration time, so decoding a field is a
+    single dictionary lookup. Fields without a registered converter pass through
+    unchanged.
+    """
+
+    def __init__(
+            self,
+            fields: Mapping[str, DynamicFieldType | DynamicFieldConverter] | None = None,
+    ) -> None:
+        self._converters: dict[str, DynamicFieldConverter] = {}
+        for name, field_type in (fields or {}).items():
+            self.register(name, field_type)
+
+    def register(self, name: str, field_type: DynamicFieldType | DynamicFieldConverter) -> DynamicFieldSchema:
+        if isinstance(field_type, DynamicFieldConverter):
+            self._converters[name] = field_type
+        else:
+            self._converters[name] = DEFAULT_CONVERTERS[DynamicFieldType(field_type)]
+        return self
+
+    def unregister(self, name: str) -> DynamicFieldSchema:
+        self._converters.pop(name, None)
+        return self
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._converters
+
+    def __len__(self) -> int:
+        return len(self._converters)
+
+    def converter_for(self, name: str) -> Optional[DynamicFieldConverter]:
+        return self._converters.get(name)
+
+    def decode(self, name: str, value: Any) -> Any:
+        converter = self._converters.get(name)
+        if converter is None:
+            return value
+        try:
+            return converter.decode(value)
+        except (ValueError, TypeError, InvalidOperation):
+            logger.warning(f"Failed to decode dynamic field {name!r}: {value!r}")
+            return value
+
+    def encode(self, name: str, value: Any) -> WsDynamicFieldValue:
+        converter = self._converters.get(name)
+        if converter is None:
+            return _encode_list(value) if isinstance(value, (list, tuple)) else _encode_text(value)
+        return converter.encode(value)
+
+    def decode_all(self, items: Iterable[tuple[str, Any]]) -> dict[str, Any]:
+        return {name: self.decode(name, value) for name, value in items}
+
+    def encode_all(self, values: Mapping[str, Any]) -> dict[str, WsDynamicFieldValue]:
+        return {name: self.encode(name, value) for name, value in values.items()}
@@ -1,7 +1,10 @@
+import io
+import mmap
 from abc import abstractmethod, ABC
+from contextlib import contextmanager
 from datetime import datetime
-from pydantic import BaseModel, ConfigDict, field_validator, model_validator
-from typing import Any, Optional, Self, Union
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from typing import Any, BinaryIO, Iterator, Optional, Self, Union
 
 
 class IdName(BaseModel):
@@ -24,6 +27,56 @@ class IdName(BaseModel):
         return self
 
 
+class Attachment(BaseModel):
+    """Attachment metadata plus a binary buffer holding the decoded content.
+
+    The buffer comes from an ``AttachmentSink`` and is either in memory or a
+    temporary file; the content is never kept as a Python string.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    filename: Optional[str] = None
+    content_type: Optional[str] = None
+    size: Optional[int] = None
+    file_id: Optional[int] = None
+    content_id: Optional[str] = None
+    disposition: Optional[str] = None
+    content: Optional[Any] = Field(default=None, exclude=True, repr=False)
+
+    def open(self) -> BinaryIO:
+        if self.content is None:
+            raise ValueError("attachment content was not fetched")
+        self.content.seek(0)
+        return self.content
+
+    def read_bytes(self) -> bytes:
+        return self.open().read()
+
+    @contextmanager
+    def memoryview(self) -> Iterator[memoryview]:
+        """Zero-copy view of the content; spilled files are memory-mapped until the block exits."""
+        buffer = self.open()
+        mapping: Optional[mmap.mmap] = None
+        if isinstance(buffer, io.BytesIO):
+            view = buffer.getbuffer()
+        elif self.size == 0:
+            view = memoryview(b"")
+        else:
+            mapping = mmap.mmap(buffer.fileno(), 0, access=mmap.ACCESS_READ)
+            view = memoryview(mapping)
+        try:
+            yield view
+        finally:
+            view.release()
+            if mapping is not None:
+                mapping.close()
+
+    def close(self) -> None:
+        if self.content is not None:
+            self.content.close()
+
+
 class Article(BaseModel):
     from_addr: Optional[str] = None
     to_addr: Optional[str] = None
@@ -34,6 +87,7 @@ class Article(BaseModel):
     changed_at: Optional[datetime] = None
     article_id: Optional[int] = None
     article_number: Optional[int] = None
+    attachments: list[Attachment] = []
 
 
 class TicketBase(BaseModel, ABC):
@@ -49,7 +103,7 @@ class TicketBase(BaseModel, ABC):
     customer_user: Optional[str] = None
     created_at: Optional[datetime] = None
     changed_at: Optional[datetime] = None
-    dynamic_fields: dict[str, str] = {}
+    dynamic_fields: dict[str, Any] = {}
 
     @abstractmethod
     def get_articles(self) -> list[Article]:
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import sys
+from datetime import datetime
+from typing import Any, NamedTuple, Optional
+
+from otrs_gi_core.domain_models.ticket_models import Article, IdName, Ticket
+
+
+def intern_name(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value is not None else None
+
+
+def _id_name_or_none(id_value: Optional[int], name_value: Optional[str]) -> Optional[IdName]:
+    if id_value is None and name_value is None:
+        return None
+    return IdName(id=id_value, name=name_value)
+
+
+class TicketRecord(NamedTuple):
+    """Read-only, tuple-backed ticket header for bulk results.
+
+    Repeated lookup names (queue, state, priority, ...) are interned, so a
+    hundred thousand records share one string object per distinct name.
+    ``articles`` is ``None`` when articles were not requested.
+    """
+
+    id: int
+    number: Optional[str] = None
+    title: Optional[str] = None
+    queue_id: Optional[int] = None
+    queue: Optional[str] = None
+    state_id: Optional[int] = None
+    state: Optional[str] = None
+    priority_id: Optional[int] = None
+    priority: Optional[str] = None
+    type_id: Optional[int] = None
+    type: Optional[str] = None
+    lock_id: Optional[int] = None
+    lock: Optional[str] = None
+    owner_id: Optional[int] = None
+    owner: Optional[str] = None
+    customer_id: Optional[str] = None
+    customer_user: Optional[str] = None
+    created_at: Optional[datetime] = None
+    changed_at: Optional[datetime] = None
+    dynamic_fields: Optional[dict[str, Any]] = None
+    articles: Optional[tuple[Article, ...]] = None
+
+    def to_ticket(self) -> Ticket:
+        return Ticket(
+            id=self.id,
+            number=self.number,
+            title=self.title,
+            queue=_id_name_or_none(self.queue_id, self.queue),
+            state=_id_name_or_none(self.state_id, self.state),
+            priority=_id_name_or_none(self.priority_id, self.priority),
+            type=_id_name_or_none(self.type_id, self.type),
+            lock=_id_name_or_none(self.lock_id, self.lock),
+            owner=_id_name_or_none(self.owner_id, self.owner),
+            customer_id=self.customer_id,
+            customer_user=self.customer_user,
+            created_at=self.created_at,
+            changed_at=self.changed_at,
+            dynamic_fields=dict(self.dynamic_fields or {}),
+            articles=list(self.articles or ()),
+        )
+
+    @classmethod
+    def from_ticket(cls, ticket: Ticket, include_articles: bool = True) -> TicketRecord:
+        def split(v: Optional[IdName]) -> tuple[Optional[int], Optional[str]]:
+            return (v.id, intern_name(v.name)) if v else (None, None)
+
+        queue_id, queue = split(ticket.queue)
+        state_id, state = split(ticket.state)
+        priority_id, priority = split(ticket.priority)
+        type_id, type_name = split(ticket.type)
+        lock_id, lock = split(ticket.lock)
+        owner_id, owner = split(ticket.owner)
+        return cls(
+            id=ticket.id,
+            number=ticket.number,
+            title=ticket.title,
+            queue_id=queue_id,
+            queue=queue,
+            state_id=state_id,
+            state=state,
+            priority_id=priority_id,
+            priority=priority,
+            type_id=type_id,
+            type=type_name,
+            lock_id=lock_id,
+            lock=lock,
+            owner_id=owner_id,
+            owner=owner,
+            customer_id=intern_name(ticket.customer_id),
+            customer_user=intern_name(ticket.customer_user),
+            created_at=ticket.created_at,
+            changed_at=ticket.changed_at,
+            dynamic_fields=ticket.dynamic_fields or None,
+            articles=tuple(ticket.articles) if include_articles else None,
+        )
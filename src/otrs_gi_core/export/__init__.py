@@ -0,0 +1,22 @@
+"""Bulk export utilities for ticket search results."""
+
+from __future__ import annotations
+
+from otrs_gi_core.export.columnar import (
+    ArticleColumns,
+    ColumnChunk,
+    TicketColumns,
+    export_parquet,
+    iter_column_chunks,
+)
+from otrs_gi_core.export.ndjson import export_ndjson, prepare_resume
+
+__all__ = [
+    "ArticleColumns",
+    "ColumnChunk",
+    "TicketColumns",
+    "export_ndjson",
+    "export_parquet",
+    "iter_column_chunks",
+    "prepare_resume",
+]
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import asyncio
+import math
+from array import array
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterable, Optional, Sequence
+
+if TYPE_CHECKING:
+    from otrs_gi_core.clients.generic_interface_client import GenericInterfaceClient
+    from otrs_gi_core.domain_models.ticket_models import TicketSearch
+    from otrs_gi_core.domain_models.ticket_record import TicketRecord
+
+DEFAULT_CHUNK_SIZE = 500
+
+INT_COLUMNS = ("id", "queue_id", "state_id", "priority_id", "type_id", "lock_id", "owner_id")
+STR_COLUMNS = (
+    "number", "title", "queue", "state", "priority", "type", "lock", "owner", "customer_id", "customer_user",
+)
+TIMESTAMP_COLUMNS = ("created_at", "changed_at")
+
+ARTICLE_INT_COLUMNS = ("ticket_id", "article_id", "article_number")
+ARTICLE_STR_COLUMNS = ("from_addr", "to_addr", "subject", "body", "content_type")
+ARTICLE_TIMESTAMP_COLUMNS = ("created_at", "changed_at")
+
+MISSING_ID = 0
+
+
+def _timestamp(value: Optional[datetime]) -> float:
+    if value is None:
+        return math.nan
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _require(module: str) -> Any:
+    try:
+        return __import__(module, fromlist=["_"])
+    except ImportError as exc:
+        raise ImportError(
+            f"{module} is required for this export format; "
+            "install the 'analytics' extra, e.g. `pip install otobo[analytics]`"
+        ) from exc
+
+
+class _ColumnBuffer:
+    int_columns: tuple[str, ...] = ()
+    str_columns: tuple[str, ...] = ()
+    timestamp_columns: tuple[str, ...] = ()
+
+    def __init__(self) -> None:
+        self.ints: dict[str, array[int]] = {name: array("q") for name in self.int_columns}
+        self.strs: dict[str, list[Optional[str]]] = {name: [] for name in self.str_columns}
+        self.timestamps: dict[str, array[float]] = {name: array("d") for name in self.timestamp_columns}
+
+    def __len__(self) -> int:
+        first = self.int_columns[0]
+        return len(self.ints[first])
+
+    def columns(self) -> dict[str, Sequence[Any]]:
+        return {**self.ints, **self.strs, **self.timestamps}
+
+    def to_numpy(self) -> dict[str, Any]:
+        np = _require("numpy")
+        result: dict[str, Any] = {}
+        for name, values in self.ints.items():
+            result[name] = np.frombuffer(values, dtype=np.int64) if values else np.empty(0, dtype=np.int64)
+        for name, stamps in self.timestamps.items():
+            seconds = np.frombuffer(stamps, dtype=np.float64) if stamps else np.empty(0, dtype=np.float64)
+            result[name] = seconds
+        for name, texts in self.strs.items():
+            result[name] = np.array(texts, dtype=object)
+        return result
+
+    def to_arrow(self) -> Any:
+        pa = _require("pyarrow")
+        arrays: dict[str, Any] = {}
+        for name, values in self.ints.items():
+            mask = pa.array([v == MISSING_ID for v in values], type=pa.bool_())
+            arrays[name] = pa.array(values, type=pa.int64(), mask=mask)
+        for name, texts in self.strs.items():
+            arrays[name] = pa.array(texts, type=pa.string())
+        for name, stamps in self.timestamps.items():
+            micros = [None if math.isnan(v) else int(v * 1_000_000) for v in stamps]
+            arrays[name] = pa.array(micros, type=pa.timestamp("us"))
+        return pa.table(arrays)
+
+
+class TicketColumns(_ColumnBuffer):
+    """Ticket header fields stored column-wise.
+
+    Integer ids live in ``array('q')`` (``0`` marks a missing id, GenericInterface
+    ids start at 1), timestamps in ``array('d')`` as POSIX seconds with NaN for
+    missing values, and text in plain lists. GenericInterface timestamps carry
+    no timezone and are taken as UTC, so values do not depend on the local zone.
+    """
+
+    int_columns = INT_COLUMNS
+    str_columns = STR_COLUMNS
+    timestamp_columns = TIMESTAMP_COLUMNS
+
+    def __init__(self, dynamic_field_names: Iterable[str] = ()) -> None:
+        super().__init__()
+        self.dynamic_field_names = tuple(dynamic_field_names)
+        self.dynamic_fields: dict[str, list[Any]] = {name: [] for name in self.dynamic_field_names}
+
+    def append(self, record: TicketRecord) -> None:
+        for name in self.int_columns:
+            value = getattr(record, name)
+            self.ints[name].append(MISSING_ID if value is None else value)
+        for name in self.str_columns:
+            self.strs[name].append(getattr(record, name))
+        for name in self.timestamp_columns:
+            self.timestamps[name].append(_timestamp(getattr(record, name)))
+        values = record.dynamic_fields or {}
+        for name in self.dynamic_field_names:
+            self.dynamic_fields[name].append(values.get(name))
+
+    def columns(self) -> dict[str, Sequence[Any]]:
+        return {**super().columns(), **{f"df_{k}": v for k, v in self.dynamic_fields.items()}}
+
+    def to_numpy(self) -> dict[str, Any]:
+        np = _require("numpy")
+        result = super().to_numpy()
+        for name, values in self.dynamic_fields.items():
+            result[f"df_{name}"] = np.array(values, dtype=object)
+        return result
+
+    def to_arrow(self) -> Any:
+        pa = _require("pyarrow")
+        table = super().to_arrow()
+        for name, values in self.dynamic_fields.items():
+            column = pa.array([None if v is None else str(v) for v in values], type=pa.string())
+            table = table.append_column(f"df_{name}", column)
+        return table
+
+
+class ArticleColumns(_ColumnBuffer):
+    int_columns = ARTICLE_INT_COLUMNS
+    str_columns = ARTICLE_STR_COLUMNS
+    timestamp_columns = ARTICLE_TIMESTAMP_COLUMNS
+
+    def extend_from(self, record: TicketRecord) -> None:
+        for article in record.articles or ():
+            self.ints["ticket_id"].append(record.id)
+            self.ints["article_id"].append(article.article_id or MISSING_ID)
+            self.ints["article_number"].append(article.article_number or MISSING_ID)
+            for name in self.str_columns:
+                self.strs[name].append(getattr(article, name))
+            for name in self.timestamp_columns:
+                self.timestamps[name].append(_timestamp(getattr(article, name)))
+
+
+class ColumnChunk:
+    def __init__(self, tickets: TicketColumns, articles: Optional[ArticleColumns]) -> None:
+        self.tickets = tickets
+        self.articles = articles
+
+    def __len__(self) -> int:
+        return len(self.tickets)
+
+
+async def iter_column_chunks(
+        client: GenericInterfaceClient,
+        ticket_search: TicketSearch,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        include_articles: bool = False,
+        dynamic_field_names: Iterable[str] = (),
+) -> AsyncIterator[ColumnChunk]:
+    """Search tickets and yield their fields column-wise in chunks of ``chunk_size``.
+
+    At most ``chunk_size`` TicketGet requests are in flight, and only the current
+    chunk's records are alive at any time. With ``include_articles`` every article
+    of a ticket is fetched, not just the first few.
+    """
+    dynamic_field_names = tuple(dynamic_field_names)
+    ids = await client.search_tickets(ticket_search)
+    for start in range(0, len(ids), chunk_size):
+        records = await asyncio.gather(
+            *(
+                client.get_ticket_record(i, include_articles=include_articles, article_limit=None)
+                for i in ids[start:start + chunk_size]
+            )
+        )
+        tickets = TicketColumns(dynamic_field_names)
+        articles = ArticleColumns() if include_articles else None
+        for record in records:
+            tickets.append(record)
+            if articles is not None:
+                articles.extend_from(record)
+        yield ColumnChunk(tickets, articles)
+
+
+async def export_parquet(
+        client: GenericInterfaceClient,
+        ticket_search: TicketSearch,
+        tickets_path: str | Path,
+        *,
+        articles_path: str | Path | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        dynamic_field_names: Iterable[str] = (),
+) -> int:
+    """Stream search results into Parquet files, one row group per chunk. Returns the ticket count.
+
+    An empty search still writes the files, with the schema and no rows.
+    """
+    pq = _require("pyarrow.parquet")
+    dynamic_field_names = tuple(dynamic_field_names)
+    ticket_writer = None
+    article_writer = None
+    total = 0
+    try:
+        async for chunk in iter_column_chunks(
+                client,
+                ticket_search,
+                chunk_size=chunk_size,
+                include_articles=articles_path is not None,
+                dynamic_field_names=dynamic_field_names,
+        ):
+            table = chunk.tickets.to_arrow()
+            if ticket_writer is None:
+                ticket_writer = pq.ParquetWriter(str(tickets_path), table.schema)
+            ticket_writer.write_table(table)
+            total += len(chunk)
+            if chunk.articles is not None and articles_path is not None:
+                article_table = chunk.articles.to_arrow()
+                if article_writer is None:
+                    article_writer = pq.ParquetWriter(str(articles_path), article_table.schema)
+                article_writer.write_table(article_table)
+        if ticket_writer is None:
+            pq.write_table(TicketColumns(dynamic_field_names).to_arrow(), str(tickets_path))
+        if article_writer is None and articles_path is not None:
+            pq.write_table(ArticleColumns().to_arrow(), str(articles_path))
+    finally:
+        if ticket_writer is not None:
+            ticket_writer.close()
+        if article_writer is not None:
+            article_writer.close()
+    return total
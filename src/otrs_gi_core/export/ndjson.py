@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, AbstractSet, Any, Callable, Iterable, Iterator, Optional, TextIO
+
+if TYPE_CHECKING:
+    from otrs_gi_core.clients.generic_interface_client import GenericInterfaceClient
+    from otrs_gi_core.domain_models.ticket_models import Ticket, TicketSearch
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 8
+
+
+def read_resumable_ndjson(path: str | Path) -> list[dict[str, Any]]:
+    """Read the complete records of an NDJSON file written by an interrupted run.
+
+    A trailing partial line is cut off, so appending to the file afterwards
+    yields valid NDJSON again.
+    """
+    path = Path(path)
+    if not path.exists():
+        return []
+    with path.open("r+b") as fh:
+        data = fh.read()
+        end = data.rfind(b"\n") + 1
+        if end != len(data):
+            fh.truncate(end)
+    records: list[dict[str, Any]] = []
+    for line in data[:end].splitlines():
+        if not line.strip():
+            continue
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            logger.warning(f"Skipping unreadable line: {line[:80]!r}")
+    return records
+
+
+def prepare_resume(path: str | Path) -> set[int]:
+    """Return the ticket ids already present in an NDJSON export."""
+    exported: set[int] = set()
+    for record in read_resumable_ndjson(path):
+        try:
+            exported.add(int(record["id"]))
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Skipping export record without ticket id: {record!r:.80}")
+    return exported
+
+
+def _pending(ids: Iterable[int], skip_ids: AbstractSet[int]) -> Iterator[int]:
+    return (i for i in ids if i not in skip_ids)
+
+
+async def export_ndjson(
+        client: GenericInterfaceClient,
+        ticket_search: TicketSearch,
+        out: TextIO,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        skip_ids: AbstractSet[int] = frozenset(),
+        on_error: Optional[Callable[[int, Exception], None]] = None,
+) -> int:
+    """Write every ticket matching ``ticket_search`` to ``out`` as one JSON object per line.
+
+    ``concurrency`` TicketGet requests run at a time and each ticket is written as
+    soon as it arrives, so output order follows completion order. Every article
+    of a ticket is exported. Returns the number of tickets written.
+    """
+    ids = await client.search_tickets(ticket_search)
+    pending = _pending(ids, skip_ids)
+    written = 0
+
+    async def worker() -> None:
+        nonlocal written
+        for ticket_id in pending:
+            try:
+                ticket: Ticket = await client.get_ticket(ticket_id, article_limit=None)
+            except Exception as exc:
+                if on_error is None:
+                    raise
+                on_error(ticket_id, exc)
+                continue
+            out.write(ticket.model_dump_json())
+            out.write("\n")
+            written += 1
+
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    out.flush()
+    return written
@@ -0,0 +1,376 @@
+"""Closed-loop load test for a ticket webservice with a concurrency sweep.
+
+Each level runs ``concurrency`` workers for a fixed time; every worker picks the
+next operation from a weighted get/search/create/update mix and starts it as
+soon as the previous one finished. Per level the report shows throughput,
+latency percentiles and the error rate, which is what is needed to size
+OTOBO/Znuny web workers and client connection limits.
+
+    python -m otrs_gi_core.loadtest --fake --concurrency 1,4,16,64 --duration 10
+    python -m otrs_gi_core.loadtest --base-url https://host/otrs/nph-genericinterface.pl \\
+        --webservice OpenTicketAI --user agent --mix get=70,search=20,create=5,update=5
+
+Creates and updates write real tickets; point them at a test system or a
+dedicated queue (``--queue``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import getpass
+import json
+import logging
+import math
+import random
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Mapping, Optional, Sequence
+
+from otrs_gi_core.domain_models.ticket_operation import TicketOperation
+
+if TYPE_CHECKING:
+    from otrs_gi_core.clients.generic_interface_client import GenericInterfaceClient
+    from otrs_gi_core.domain_models.ticket_models import TicketCreate
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MIX = {TicketOperation.GET: 70, TicketOperation.SEARCH: 20, TicketOperation.CREATE: 5,
+               TicketOperation.UPDATE: 5}
+DEFAULT_CONCURRENCY_LEVELS = (1, 2, 4, 8, 16, 32)
+PERCENTILES = (50, 90, 95, 99)
+_ID_POOL_SIZE = 1000
+
+
+def parse_mix(spec: str) -> dict[TicketOperation, int]:
+    """Parse ``get=70,search=20,create=5,update=5`` into operation weights."""
+    mix: dict[TicketOperation, int] = {}
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        name, _, weight = part.partition("=")
+        try:
+            operation = TicketOperation[name.strip().upper()]
+        except KeyError as exc:
+            valid = ", ".join(op.name.lower() for op in TicketOperation)
+            raise ValueError(f"Unknown operation '{name}' in mix, choose from: {valid}") from exc
+        try:
+            mix[operation] = int(weight) if weight else 1
+        except ValueError as exc:
+            raise ValueError(f"Weight of '{name}' must be an integer, got '{weight}'") from exc
+    if not mix or sum(mix.values()) <= 0 or min(mix.values()) < 0:
+        raise ValueError(f"Mix '{spec}' needs at least one positive weight and no negative ones")
+    return mix
+
+
+def parse_levels(spec: str) -> list[int]:
+    """Parse ``1,4,16`` into concurrency levels."""
+    try:
+        levels = [int(part) for part in spec.split(",") if part.strip()]
+    except ValueError as exc:
+        raise ValueError(f"Concurrency levels must be integers, got '{spec}'") from exc
+    if not levels or min(levels) < 1:
+        raise ValueError("Concurrency levels must be positive")
+    return levels
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted values, ``nan`` when empty."""
+    if not sorted_values:
+        return math.nan
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+@dataclass(frozen=True)
+class LoadTestConfig:
+    """What each level runs; durations in seconds.
+
+    ``queue`` receives created tickets, ``search_limit`` caps the ids a search
+    returns. Each level first runs for ``warmup`` seconds without recording,
+    so connection set-up is not part of the latency numbers.
+    """
+
+    mix: Mapping[TicketOperation, int] = field(default_factory=lambda: dict(DEFAULT_MIX))
+    duration: float = 10.0
+    warmup: float = 1.0
+    queue: str = "Raw"
+    search_limit: int = 50
+    seed: int = 0
+
+
+@dataclass(frozen=True)
+class LevelReport:
+    concurrency: int
+    requests: int
+    errors: int
+    duration: float
+    throughput: float
+    latency_ms: dict[str, float]
+    operations: dict[str, int]
+    error_kinds: dict[str, int]
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.requests if self.requests else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "error_rate": self.error_rate}
+
+
+def _error_kind(exc: Exception) -> str:
+    from otrs_gi_core.util.errors import GenericInterfaceError
+
+    if isinstance(exc, GenericInterfaceError):
+        return exc.code or "GenericInterfaceError"
+    status = getattr(getattr(exc, "response", None), "status_code", None)
+    return f"HTTP {status}" if status is not None else type(exc).__name__
+
+
+class LoadTest:
+    """Runs the configured mix against one client.
+
+    Ticket ids for get and update come from an initial search and from the
+    tickets created during the run.
+    """
+
+    def __init__(self, client: GenericInterfaceClient, config: LoadTestConfig = LoadTestConfig()):
+        from otrs_gi_core.testing.dataset import DatasetConfig, generate_ticket_creates
+
+        self.client = client
+        self.config = config
+        self.ticket_ids: list[int] = []
+        self._rng = random.Random(config.seed)
+        self._operations = list(config.mix)
+        self._weights = [config.mix[op] for op in self._operations]
+        dataset = DatasetConfig(tickets=1000, seed=config.seed, queues=(config.queue,), attachment_rate=0.0,
+                                dynamic_field_rate=0.0, max_articles=1)
+        self._creates: list[TicketCreate] = list(generate_ticket_creates(dataset))
+        self._handlers: dict[TicketOperation, Callable[[], Awaitable[Any]]] = {
+            TicketOperation.GET: self._get,
+            TicketOperation.SEARCH: self._search,
+            TicketOperation.CREATE: self._create,
+            TicketOperation.UPDATE: self._update,
+        }
+
+    async def prepare(self) -> None:
+        """Collect existing ticket ids; without any, get/update create a ticket first."""
+        from otrs_gi_core.domain_models.ticket_models import TicketSearch
+
+        self.ticket_ids = await self.client.search_tickets(TicketSearch(limit=_ID_POOL_SIZE))
+
+    async def _ticket_id(self) -> int:
+        if not self.ticket_ids:
+            await self._create()
+        return self._rng.choice(self.ticket_ids)
+
+    async def _get(self) -> Any:
+        return await self.client.get_ticket(await self._ticket_id())
+
+    async def _search(self) -> Any:
+        from otrs_gi_core.domain_models.ticket_models import IdName, TicketSearch
+
+        state = self._rng.choice(("new", "open"))
+        return await self.client.search_tickets(
+            TicketSearch(states=[IdName(name=state)], limit=self.config.search_limit)
+        )
+
+    async def _create(self) -> Any:
+        ticket = await self.client.create_ticket(self._rng.choice(self._creates))
+        self.ticket_ids.append(ticket.id)
+        return ticket
+
+    async def _update(self) -> Any:
+        from otrs_gi_core.domain_models.ticket_models import TicketUpdate
+
+        ticket_id = await self._ticket_id()
+        return await self.client.update_ticket(TicketUpdate(id=ticket_id, title=f"load test {self._rng.random():.6f}"))
+
+    async def run_level(self, concurrency: int) -> LevelReport:
+        """Run ``concurrency`` closed-loop workers for ``config.duration`` seconds."""
+        latencies: list[float] = []
+        operations: Counter[str] = Counter()
+        errors: Counter[str] = Counter()
+        measuring = False
+
+        async def worker(deadline: float) -> None:
+            while perf_counter() < deadline:
+                operation = self._rng.choices(self._operations, self._weights)[0]
+                started = perf_counter()
+                try:
+                    await self._handlers[operation]()
+                    failure = None
+                except Exception as exc:  # every failure counts against the level
+                    failure = _error_kind(exc)
+                if not measuring:
+                    continue
+                latencies.append(perf_counter() - started)
+                operations[operation.name.lower()] += 1
+                if failure is not None:
+                    errors[failure] += 1
+
+        if self.config.warmup > 0:
+            await asyncio.gather(*(worker(perf_counter() + self.config.warmup) for _ in range(concurrency)))
+        measuring = True
+        started = perf_counter()
+        await asyncio.gather(*(worker(started + self.config.duration) for _ in range(concurrency)))
+        elapsed = perf_counter() - started
+
+        latencies.sort()
+        latency_ms = {f"p{p}": percentile(latencies, p) * 1000 for p in PERCENTILES}
+        latency_ms["max"] = latencies[-1] * 1000 if latencies else math.nan
+        return LevelReport(
+            concurrency=concurrency,
+            requests=len(latencies),
+            errors=sum(errors.values()),
+            duration=elapsed,
+            throughput=len(latencies) / elapsed if elapsed else 0.0,
+            latency_ms=latency_ms,
+            operations=dict(operations),
+            error_kinds=dict(errors.most_common()),
+        )
+
+    async def sweep(
+            self,
+            levels: Sequence[int],
+            on_level: Optional[Callable[[LevelReport], None]] = None,
+    ) -> list[LevelReport]:
+        await self.prepare()
+        reports = []
+        for concurrency in levels:
+            report = await self.run_level(concurrency)
+            logger.info(f"load test level {concurrency}: {report.throughput:.1f} req/s, {report.errors} errors")
+            reports.append(report)
+            if on_level is not None:
+                on_level(report)
+        return reports
+
+
+def format_header() -> str:
+    percentiles = " ".join(f"{f'p{p} ms':>9}" for p in PERCENTILES)
+    return f"{'conc':>5} {'requests':>9} {'req/s':>9} {percentiles} {'max ms':>9} {'errors':>8}"
+
+
+def format_level(report: LevelReport) -> str:
+    percentiles = " ".join(f"{report.latency_ms[f'p{p}']:>9.1f}" for p in PERCENTILES)
+    line = (
+        f"{report.concurrency:>5} {report.requests:>9} {report.throughput:>9.1f} {percentiles} "
+        f"{report.latency_ms['max']:>9.1f} {report.error_rate:>8.2%}"
+    )
+    if report.error_kinds:
+        line += "  " + ", ".join(f"{kind}: {count}" for kind, count in report.error_kinds.items())
+    return line
+
+
+def silence_client_logging() -> None:
+    """Drop client log records; failures are counted per level and logging each one would drown the report."""
+    client_logger = logging.getLogger("otrs_gi_core.clients")
+    client_logger.addHandler(logging.NullHandler())
+    client_logger.propagate = False
+
+
+def build_fake_client(tickets: int = 1000, latency_ms: float = 0.0, error_rate: float = 0.0,
+                      seed: int = 0) -> GenericInterfaceClient:
+    """Client wired to an in-process :class:`FakeGenericInterface`, pre-loaded with ``tickets``."""
+    import httpx
+    from pydantic import SecretStr
+
+    from otrs_gi_core.clients.generic_interface_client import GenericInterfaceClient
+    from otrs_gi_core.domain_models.basic_auth_model import BasicAuth
+    from otrs_gi_core.domain_models.client_config import ClientConfig
+    from otrs_gi_core.testing import FakeGenericInterface, FaultInjection, lognormal_latency
+    from otrs_gi_core.testing.dataset import DatasetConfig, generate_raw_tickets
+    from otrs_gi_core.testing.fake_server import DEFAULT_OPERATION_URL_MAP
+
+    server = FakeGenericInterface(
+        latency=lognormal_latency(latency_ms / 1000) if latency_ms else None,
+        faults=(FaultInjection(error_rate),) if error_rate else (),
+        seed=seed,
+    )
+    server.store.insert_many(generate_raw_tickets(DatasetConfig(tickets=tickets, seed=seed)))
+    config = ClientConfig(
+        base_url=server.base_url(),
+        webservice_name=server.webservice_name,
+        operation_url_map=DEFAULT_OPERATION_URL_MAP,
+    )
+    client = GenericInterfaceClient(config, client=httpx.AsyncClient(transport=server.mock_transport()))
+    client.login(BasicAuth(user_login="loadtest", password=SecretStr("loadtest")))
+    return client
+
+
+async def run_load_test(
+        client: GenericInterfaceClient,
+        levels: Sequence[int],
+        config: LoadTestConfig = LoadTestConfig(),
+        on_level: Optional[Callable[[LevelReport], None]] = None,
+) -> list[LevelReport]:
+    """Sweep ``levels`` with one client and close it afterwards."""
+    async with client:
+        return await LoadTest(client, config).sweep(levels, on_level)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    target = parser.add_argument_group("target")
+    target.add_argument("--fake", action="store_true", help="use the in-process fake GenericInterface")
+    target.add_argument("--base-url")
+    target.add_argument("--webservice")
+    target.add_argument("--user")
+    target.add_argument("--password")
+    parser.add_argument("--mix", default="get=70,search=20,create=5,update=5")
+    parser.add_argument("--concurrency", default=",".join(map(str, DEFAULT_CONCURRENCY_LEVELS)),
+                        help="comma separated concurrency levels")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per level")
+    parser.add_argument("--warmup", type=float, default=1.0, help="seconds per level before measuring")
+    parser.add_argument("--queue", default="Raw", help="queue for created tickets")
+    parser.add_argument("--search-limit", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tickets", type=int, default=1000, help="fake server: pre-loaded tickets")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="fake server: median latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fake server: injected error rate")
+    parser.add_argument("--json", action="store_true", help="print one JSON object per level")
+    parser.add_argument("--verbose", action="store_true", help="also log every failed request")
+    args = parser.parse_args(argv)
+
+    if args.verbose:
+        logging.basicConfig(level=logging.INFO)
+    else:
+        silence_client_logging()
+
+    try:
+        config = LoadTestConfig(mix=parse_mix(args.mix), duration=args.duration, warmup=args.warmup,
+                                queue=args.queue, search_limit=args.search_limit, seed=args.seed)
+        levels = parse_levels(args.concurrency)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if args.fake:
+        client = build_fake_client(args.tickets, args.latency_ms, args.error_rate, args.seed)
+    elif args.base_url and args.webservice and args.user:
+        from pydantic import SecretStr
+
+        from otrs_gi_core.clients.generic_interface_client import GenericInterfaceClient
+        from otrs_gi_core.domain_models.basic_auth_model import BasicAuth
+        from otrs_gi_core.domain_models.client_config import ClientConfig
+        from otrs_gi_core.setup.webservices.operations import SUPPORTED_OPERATION_SPECS
+
+        client = GenericInterfaceClient(ClientConfig(
+            base_url=args.base_url,
+            webservice_name=args.webservice,
+            operation_url_map={op: spec.operation_name for op, spec in SUPPORTED_OPERATION_SPECS.items()},
+        ))
+        client.login(BasicAuth(user_login=args.user, password=SecretStr(args.password or getpass.getpass())))
+    else:
+        parser.error("pass --fake or --base-url, --webservice and --user")
+
+    def on_level(report: LevelReport) -> None:
+        print(json.dumps(report.to_dict()) if args.json else format_level(report), flush=True)
+
+    if not args.json:
+        print(format_header(), flush=True)
+    try:
+        asyncio.run(run_load_test(client, levels, config, on_level))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,21 @@
 import logging
 from datetime import datetime
-from typing import Any, Optional, Union
+from typing import Any, Literal, Optional, Union
 
 from pydantic import BaseModel
 
 from otrs_gi_core.domain_models.basic_auth_model import BasicAuth
+from otrs_gi_core.domain_models.dynamic_fields import DynamicFieldSchema
 from otrs_gi_core.models.base_models import BooleanInteger
-from otrs_gi_core.domain_models.ticket_models import Article, IdName, TicketBase, TicketSearch, DynamicFieldFilter
+from otrs_gi_core.domain_models.ticket_models import Article, Attachment, IdName, TicketBase, TicketSearch, \
+    DynamicFieldFilter
 from otrs_gi_core.domain_models.ticket_models import TicketUpdate, Ticket, TicketCreate
+from otrs_gi_core.domain_models.ticket_record import TicketRecord, intern_name
 from otrs_gi_core.models.request_models import WsTicketMutationRequest, WsTicketUpdateRequest, WsTicketSearchRequest, \
     WsTicketGetRequest, WsDynamicFieldFilter, WsAuthData
-from otrs_gi_core.models.ticket_models import WsDynamicField, WsArticleDetail, WsTicketOutput, WsTicketBase
+from otrs_gi_core.models.ticket_models import WsDynamicField, WsArticleDetail, WsTicketOutput, WsTicketBase, \
+    WsAttachment
+from otrs_gi_core.util.attachments import AttachmentSink, decode_base64_into, estimate_decoded_size
 
 logger = logging.getLogger(__name__)
 
@@ -28,12 +33,21 @@ def try_parsing_datetime(value: Optional[str]) -> Optional[datetime]:
     return None
 
 
-def to_ws_dynamic_field_items(dynamic_fields: dict[str, str]) -> list[WsDynamicField]:
-    return [WsDynamicField(Name=key, Value=value) for key, value in dynamic_fields.items()]
+def to_ws_dynamic_field_items(
+        dynamic_fields: dict[str, Any],
+        dynamic_field_schema: Optional[DynamicFieldSchema] = None,
+) -> list[WsDynamicField]:
+    schema = dynamic_field_schema or DynamicFieldSchema()
+    return [WsDynamicField(Name=key, Value=value) for key, value in schema.encode_all(dynamic_fields).items()]
 
 
-def from_ws_dynamic_field_items(dynamic_items: Optional[list[WsDynamicField]]) -> dict[str, str]:
-    return {item.Name: item.Value for item in dynamic_items or []}
+def from_ws_dynamic_field_items(
+        dynamic_items: Optional[list[WsDynamicField]],
+        dynamic_field_schema: Optional[DynamicFieldSchema] = None,
+) -> dict[str, Any]:
+    if dynamic_field_schema is None:
+        return {item.Name: item.Value for item in dynamic_items or []}
+    return dynamic_field_schema.decode_all((item.Name, item.Value) for item in dynamic_items or [])
 
 
 def _to_str(value: Any) -> str:
@@ -90,7 +104,34 @@ def to_ws_article(article: Article) -> WsArticleDetail:
     )
 
 
-def from_ws_article(article_otobo: WsArticleDetail) -> Article:
+def from_ws_attachment(attachment_otobo: WsAttachment, attachment_sink: AttachmentSink) -> Attachment:
+    """Decode the base64 content into a buffer from ``attachment_sink``.
+
+    The encoded string is released from ``attachment_otobo`` once decoded.
+    """
+    content = None
+    size = attachment_otobo.FilesizeRaw
+    encoded = attachment_otobo.Content
+    if encoded is not None:
+        size_hint = size if size is not None else estimate_decoded_size(encoded)
+        content = attachment_sink.create(size_hint, attachment_otobo.Filename, attachment_otobo.ContentType)
+        size = decode_base64_into(encoded, content)
+        attachment_otobo.Content = None
+    return Attachment(
+        filename=attachment_otobo.Filename,
+        content_type=attachment_otobo.ContentType,
+        size=size,
+        file_id=attachment_otobo.FileID,
+        content_id=attachment_otobo.ContentID,
+        disposition=attachment_otobo.Disposition,
+        content=content,
+    )
+
+
+def from_ws_article(article_otobo: WsArticleDetail, attachment_sink: Optional[AttachmentSink] = None) -> Article:
+    attachments = [
+        from_ws_attachment(a, attachment_sink) for a in article_otobo.Attachment or []
+    ] if attachment_sink is not None else []
     return Article(
         from_addr=article_otobo.From,
         to_addr=article_otobo.To,
@@ -101,6 +142,7 @@ def from_ws_article(article_otobo: WsArticleDetail) -> Article:
         changed_at=try_parsing_datetime(article_otobo.ChangeTime),
         article_id=article_otobo.ArticleID,
         article_number=article_otobo.ArticleNumber,
+        attachments=attachments,
     )
 
 
@@ -126,7 +168,11 @@ def has_any_attribute_set(otobo_ticket_base: BaseModel) -> bool:
     return bool(otobo_ticket_base.model_dump(exclude_none=True))
 
 
-def from_ws_ticket_detail(ticket_otobo: WsTicketOutput) -> Ticket:
+def from_ws_ticket_detail(
+        ticket_otobo: WsTicketOutput,
+        dynamic_field_schema: Optional[DynamicFieldSchema] = None,
+        attachment_sink: Optional[AttachmentSink] = None,
+) -> Ticket:
     return Ticket(
         id=ticket_otobo.TicketID,
         number=ticket_otobo.TicketNumber,
@@ -141,7 +187,48 @@ def from_ws_ticket_detail(ticket_otobo: WsTicketOutput) -> Ticket:
         customer_user=ticket_otobo.CustomerUser,
         created_at=try_parsing_datetime(ticket_otobo.Created),
         changed_at=try_parsing_datetime(ticket_otobo.Changed),
-        articles=[from_ws_article(a) for a in ticket_otobo.get_articles()],
+        dynamic_fields=from_ws_dynamic_field_items(ticket_otobo.DynamicField, dynamic_field_schema),
+        articles=[from_ws_article(a, attachment_sink) for a in ticket_otobo.get_articles()],
+    )
+
+
+def _record_name(value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return None
+    return intern_name(value.strip()) or None
+
+
+def from_ws_ticket_record(
+        ticket_otobo: WsTicketOutput,
+        dynamic_field_schema: Optional[DynamicFieldSchema] = None,
+        include_articles: bool = False,
+) -> TicketRecord:
+    if ticket_otobo.TicketID is None:
+        # Same exception type as the ValidationError that ``Ticket`` raises for a missing id.
+        raise ValueError("ticket without TicketID")
+    articles = tuple(from_ws_article(a) for a in ticket_otobo.get_articles()) if include_articles else None
+    return TicketRecord(
+        id=ticket_otobo.TicketID,
+        number=ticket_otobo.TicketNumber,
+        title=ticket_otobo.Title,
+        queue_id=ticket_otobo.QueueID,
+        queue=_record_name(ticket_otobo.Queue),
+        state_id=ticket_otobo.StateID,
+        state=_record_name(ticket_otobo.State),
+        priority_id=ticket_otobo.PriorityID,
+        priority=_record_name(ticket_otobo.Priority),
+        type_id=ticket_otobo.TypeID,
+        type=_record_name(ticket_otobo.Type),
+        lock_id=ticket_otobo.LockID,
+        lock=_record_name(ticket_otobo.Lock),
+        owner_id=ticket_otobo.OwnerID,
+        owner=_record_name(ticket_otobo.Owner),
+        customer_id=intern_name(ticket_otobo.CustomerID),
+        customer_user=intern_name(ticket_otobo.CustomerUser),
+        created_at=try_parsing_datetime(ticket_otobo.Created),
+        changed_at=try_parsing_datetime(ticket_otobo.Changed),
+        dynamic_fields=from_ws_dynamic_field_items(ticket_otobo.DynamicField, dynamic_field_schema) or None,
+        articles=articles,
     )
 
 
@@ -172,18 +259,38 @@ def to_ws_ticket_base(ticket: TicketBase) -> Optional[WsTicketBase]:
     return None
 
 
-def to_ws_ticket_create(ticket_domain: TicketCreate) -> WsTicketMutationRequest:
+def _to_ws_dynamic_fields_or_none(
+        ticket: TicketBase,
+        dynamic_field_schema: Optional[DynamicFieldSchema],
+) -> Optional[list[WsDynamicField]]:
+    if not ticket.dynamic_fields:
+        return None
+    return to_ws_dynamic_field_items(ticket.dynamic_fields, dynamic_field_schema)
+
+
+def to_ws_ticket_create(
+        ticket_domain: TicketCreate,
+        dynamic_field_schema: Optional[DynamicFieldSchema] = None,
+) -> WsTicketMutationRequest:
     ticket_base = to_ws_ticket_base(ticket_domain)
     article_otobo = to_ws_article(ticket_domain.article) if ticket_domain.article else None
-    return WsTicketMutationRequest(Ticket=ticket_base, Article=article_otobo)
+    return WsTicketMutationRequest(
+        Ticket=ticket_base,
+        Article=article_otobo,
+        DynamicField=_to_ws_dynamic_fields_or_none(ticket_domain, dynamic_field_schema),
+    )
 
 
-def to_ws_ticket_update(ticket_domain: TicketUpdate) -> WsTicketUpdateRequest:
+def to_ws_ticket_update(
+        ticket_domain: TicketUpdate,
+        dynamic_field_schema: Optional[DynamicFieldSchema] = None,
+) -> WsTicketUpdateRequest:
     ticket_base = to_ws_ticket_base(ticket_domain)
     article_otobo = to_ws_article(ticket_domain.article) if ticket_domain.article else None
     return WsTicketUpdateRequest(
         Ticket=ticket_base,
         Article=article_otobo,
+        DynamicField=_to_ws_dynamic_fields_or_none(ticket_domain, dynamic_field_schema),
         TicketID=ticket_domain.id,
         TicketNumber=ticket_domain.number,
     )
@@ -210,8 +317,23 @@ def to_ws_ticket_search(search_model: TicketSearch) -> WsTicketSearchRequest:
     )
 
 
-def to_ws_ticket_get(ticket_id: int) -> WsTicketGetRequest:
-    return WsTicketGetRequest(TicketID=ticket_id)
+def to_ws_ticket_get(
+        ticket_id: int,
+        *,
+        article_order: Literal["ASC", "DESC"] = "ASC",
+        article_limit: Optional[int] = 5,
+        include_dynamic_fields: bool = True,
+        include_attachments: bool = False,
+        include_articles: bool = True,
+) -> WsTicketGetRequest:
+    return WsTicketGetRequest(
+        TicketID=ticket_id,
+        AllArticles=1 if include_articles else 0,
+        ArticleOrder=article_order,
+        ArticleLimit=article_limit,
+        DynamicFields=1 if include_dynamic_fields else 0,
+        Attachments=1 if include_attachments else 0,
+    )
 
 
 def to_ws_auth(basic_auth: BasicAuth) -> WsAuthData:
@@ -57,7 +57,7 @@ class WsTicketGetRequest(BaseModel):
     AllArticles: BooleanInteger = 1
     ArticleSenderType: Optional[List[str]] = None
     ArticleOrder: Literal["ASC", "DESC"] = 'ASC'
-    ArticleLimit: int = 5
+    ArticleLimit: Optional[int] = 5
     Attachments: BooleanInteger = 0
     GetAttachmentContents: BooleanInteger = 1
     HTMLBodyAsAttachment: BooleanInteger = 1
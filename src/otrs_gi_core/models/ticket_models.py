@@ -29,7 +29,19 @@ class WsTicketBase(BaseModel):
 
 class WsDynamicField(BaseModel):
     Name: str
-    Value: Optional[str] = None
+    Value: Union[str, List[str], None] = None
+
+
+class WsAttachment(BaseModel):
+    Content: Optional[str] = None
+    ContentAlternative: Optional[str] = None
+    ContentID: Optional[str] = None
+    ContentType: Optional[str] = None
+    Disposition: Optional[str] = None
+    FileID: Optional[int] = None
+    Filename: Optional[str] = None
+    Filesize: Optional[str] = None
+    FilesizeRaw: Optional[int] = None
 
 
 class WsArticleDetail(BaseModel):
@@ -45,6 +57,7 @@ class WsArticleDetail(BaseModel):
     MessageID: Optional[str] = None
     ChangeBy: Optional[int] = None
     CreateBy: Optional[int] = None
+    Attachment: Optional[List[WsAttachment]] = None
 
 
 class WsTicketOutput(WsTicketBase):
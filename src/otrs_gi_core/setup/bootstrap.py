@@ -8,6 +8,7 @@ from typing import Callable
 from otrs_gi_core.cli.environments import DockerSystem, HostSystem, LocalSystem
 from otrs_gi_core.cli.system_console import SystemConsole
 from otrs_gi_core.setup.config import SetupConfig
+from otrs_gi_core.setup.provisioning import fetch_existing
 from otrs_gi_core.setup.webservices.builder import WebserviceBuilder
 
 
@@ -29,13 +30,17 @@ def setup_host_system(
     err = echo_error or echo
 
     echo(f"Setting up {product_label} system using: {system}")
+    existing = fetch_existing(console)
 
     if config.user_to_add:
-        echo(f"Creating user: {config.user_to_add}")
-        result = console.add_user(config.user_to_add)
-        if not result.ok:
-            err(f"Failed to create user: {result}")
-            return False
+        if config.user_to_add.user_name in (existing.users or ()):
+            echo(f"User already exists, skipping creation: {config.user_to_add.user_name}")
+        else:
+            echo(f"Creating user: {config.user_to_add}")
+            result = console.add_user(config.user_to_add)
+            if not result.ok:
+                err(f"Failed to create user: {result}")
+                return False
 
         console.link_user_to_group_with_permissions(
             config.user_to_add.user_name,
@@ -43,6 +48,11 @@ def setup_host_system(
             config.user_users_permissions or [],
         )
 
+    if config.webservice_name in (existing.webservices or ()):
+        echo(f"Web service already exists, skipping installation: {config.webservice_name}")
+        echo(f"{product_label} system setup completed successfully!")
+        return True
+
     echo(f"Generating web service: {config.webservice_name}")
 
     builder = WebserviceBuilder(name=config.webservice_name)
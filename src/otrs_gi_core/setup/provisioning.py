@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Literal
+
+import yaml
+from pydantic import BaseModel, Field
+
+from otrs_gi_core.cli.command_models import CmdResult
+from otrs_gi_core.cli.command_runner import DEFAULT_CONSOLE_WORKERS
+from otrs_gi_core.cli.system_console import SystemConsole, parse_list_output
+from otrs_gi_core.models.base_models import GroupConfig, QueueConfig, UserModel
+
+logger = logging.getLogger(__name__)
+
+StepKind = Literal["group", "queue", "user", "link"]
+StepStatus = Literal["ok", "failed", "skipped"]
+
+
+class GroupLink(BaseModel):
+    """Permissions of a user on a group; friendly names such as ``read``/``full`` are accepted."""
+
+    user: str = Field(..., description="Login name of the user")
+    group: str = Field(..., description="Name of the group")
+    permissions: list[str] = Field(default_factory=lambda: ["rw"], description="Permissions to grant")
+
+
+class ProvisioningManifest(BaseModel):
+    """Groups, queues, users and group links to create for a tenant."""
+
+    groups: list[GroupConfig] = Field(default_factory=list)
+    queues: list[QueueConfig] = Field(default_factory=list)
+    users: list[UserModel] = Field(default_factory=list)
+    links: list[GroupLink] = Field(default_factory=list)
+
+    @classmethod
+    def from_yaml(cls, path: str | Path) -> ProvisioningManifest:
+        return cls.model_validate(yaml.safe_load(Path(path).read_text(encoding="utf-8")) or {})
+
+
+@dataclass(frozen=True)
+class ProvisioningStep:
+    key: str
+    kind: StepKind
+    item: Any
+    depends_on: frozenset[str] = frozenset()
+
+
+@dataclass
+class StepOutcome:
+    step: ProvisioningStep
+    status: StepStatus
+    result: CmdResult | None = None
+
+
+@dataclass
+class ProvisioningReport:
+    outcomes: dict[str, StepOutcome] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return all(o.status == "ok" for o in self.outcomes.values())
+
+    def with_status(self, status: StepStatus) -> list[StepOutcome]:
+        return [o for o in self.outcomes.values() if o.status == status]
+
+
+@dataclass
+class ExistingObjects:
+    """Names already present on the system; ``None`` means the listing was unavailable."""
+
+    users: set[str] | None = None
+    groups: set[str] | None = None
+    queues: set[str] | None = None
+    webservices: set[str] | None = None
+
+
+@dataclass
+class ProvisioningPlan:
+    manifest: ProvisioningManifest
+    existing: list[str] = field(default_factory=list)
+
+
+def fetch_existing(console: SystemConsole) -> ExistingObjects:
+    """List users, groups, queues and webservices in a single console batch."""
+    with console.batch() as batch:
+        results = {
+            "users": batch.list_all_users(),
+            "groups": batch.list_all_groups(),
+            "queues": batch.list_all_queues(),
+            "webservices": batch.list_all_webservices(),
+        }
+    existing = ExistingObjects()
+    for kind, result in results.items():
+        if result.ok:
+            setattr(existing, kind, parse_list_output(result.out))
+        else:
+            logger.warning(f"Could not list existing {kind}, assuming none exist: {result.err}")
+    return existing
+
+
+def plan_provisioning(manifest: ProvisioningManifest, existing: ExistingObjects) -> ProvisioningPlan:
+    """Drop manifest entries that already exist.
+
+    Group links are always kept: there is no console command to list them and
+    ``Admin::Group::UserLink`` simply sets the permissions again.
+    """
+    plan = ProvisioningPlan(manifest.model_copy(update={"groups": [], "queues": [], "users": []}))
+
+    def keep(kind: str, name: str, present: set[str] | None) -> bool:
+        if present is not None and name in present:
+            plan.existing.append(f"{kind}:{name}")
+            return False
+        return True
+
+    plan.manifest.groups = [g for g in manifest.groups if keep("group", g.name, existing.groups)]
+    plan.manifest.queues = [q for q in manifest.queues if keep("queue", q.name, existing.queues)]
+    plan.manifest.users = [u for u in manifest.users if keep("user", u.user_name, existing.users)]
+    return plan
+
+
+def build_steps(manifest: ProvisioningManifest) -> dict[str, ProvisioningStep]:
+    """Turn the manifest into steps keyed ``<kind>:<name>``.
+
+    Queues depend on their group, users on the groups they are created in and
+    links on their user and group, whenever those are part of the manifest.
+    References to objects outside the manifest are assumed to exist already.
+    """
+    steps: dict[str, ProvisioningStep] = {}
+
+    def add(step: ProvisioningStep) -> None:
+        if step.key in steps:
+            raise ValueError(f"Duplicate manifest entry: {step.key}")
+        steps[step.key] = step
+
+    group_keys = {f"group:{g.name}" for g in manifest.groups}
+    user_keys = {f"user:{u.user_name}" for u in manifest.users}
+
+    def known(candidates: set[str], *keys: str) -> frozenset[str]:
+        return frozenset(k for k in keys if k in candidates)
+
+    for group in manifest.groups:
+        add(ProvisioningStep(f"group:{group.name}", "group", group))
+    for queue in manifest.queues:
+        add(ProvisioningStep(f"queue:{queue.name}", "queue", queue, known(group_keys, f"group:{queue.group}")))
+    for user in manifest.users:
+        depends_on = known(group_keys, *(f"group:{g}" for g in user.groups))
+        add(ProvisioningStep(f"user:{user.user_name}", "user", user, depends_on))
+    for link in manifest.links:
+        depends_on = known(group_keys, f"group:{link.group}") | known(user_keys, f"user:{link.user}")
+        add(ProvisioningStep(f"link:{link.user}:{link.group}", "link", link, depends_on))
+    return steps
+
+
+def _run_step(console: SystemConsole, step: ProvisioningStep) -> CmdResult:
+    item = step.item
+    if step.kind == "group":
+        return console.add_group(item)
+    if step.kind == "queue":
+        return console.add_queue(item)
+    if step.kind == "user":
+        return console.add_user(item)
+    # One process per step: the step already runs in one of the ``max_workers`` threads.
+    return console.link_user_to_group_with_permissions(item.user, item.group, item.permissions, max_workers=1)
+
+
+def execute_manifest(
+        console: SystemConsole,
+        manifest: ProvisioningManifest,
+        *,
+        max_workers: int = DEFAULT_CONSOLE_WORKERS,
+        on_outcome: Callable[[StepOutcome], None] | None = None,
+) -> ProvisioningReport:
+    """Create everything in ``manifest``, running steps whose dependencies are done in parallel.
+
+    A failed step marks everything depending on it as skipped; unrelated steps
+    still run.
+    """
+    steps = build_steps(manifest)
+    report = ProvisioningReport()
+    remaining = dict(steps)
+    running: dict[Future[CmdResult], ProvisioningStep] = {}
+
+    def record(outcome: StepOutcome) -> None:
+        report.outcomes[outcome.step.key] = outcome
+        logger.info(f"{outcome.step.key}: {outcome.status}")
+        if on_outcome is not None:
+            on_outcome(outcome)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        while remaining or running:
+            scheduled = len(remaining)
+            for key, step in list(remaining.items()):
+                finished = [report.outcomes.get(dep) for dep in step.depends_on]
+                if any(o is not None and o.status != "ok" for o in finished):
+                    del remaining[key]
+                    record(StepOutcome(step, "skipped"))
+                elif all(o is not None for o in finished):
+                    del remaining[key]
+                    running[pool.submit(_run_step, console, step)] = step
+            if not running:
+                if len(remaining) == scheduled:
+                    raise ValueError(f"Unsatisfiable dependencies: {sorted(remaining)}")
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                step = running.pop(future)
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    result = CmdResult(code=1, err=str(exc))
+                record(StepOutcome(step, "ok" if result.ok else "failed", result))
+    return report
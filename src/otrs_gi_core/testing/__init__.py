@@ -0,0 +1,39 @@
+"""Offline stand-ins for a GenericInterface webservice, for tests and benchmarks."""
+
+from __future__ import annotations
+
+from otrs_gi_core.testing.dataset import (
+    DatasetConfig,
+    DatasetGenerator,
+    generate_raw_tickets,
+    generate_ticket_creates,
+    generate_tickets,
+    write_raw_tickets,
+)
+from otrs_gi_core.testing.fake_server import (
+    FakeGenericInterface,
+    FaultInjection,
+    LatencyDistribution,
+    exponential_latency,
+    fixed_latency,
+    lognormal_latency,
+    uniform_latency,
+)
+from otrs_gi_core.testing.fake_store import TicketStore
+
+__all__ = [
+    "DatasetConfig",
+    "DatasetGenerator",
+    "FakeGenericInterface",
+    "FaultInjection",
+    "LatencyDistribution",
+    "TicketStore",
+    "exponential_latency",
+    "fixed_latency",
+    "generate_raw_tickets",
+    "generate_ticket_creates",
+    "generate_tickets",
+    "lognormal_latency",
+    "uniform_latency",
+    "write_raw_tickets",
+]
@@ -0,0 +1,3 @@
+from otrs_gi_core.testing.fake_server import main
+
+main()
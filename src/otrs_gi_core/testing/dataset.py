@@ -0,0 +1,310 @@
+"""Seeded synthetic ticket datasets for benchmarks and the fake GenericInterface server.
+
+Ticket ``i`` only depends on the seed and ``i``: any slice of a dataset can be
+generated on its own and the same config always yields the same tickets, so a
+one-million-ticket dataset can be streamed instead of kept in memory.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import math
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Union
+
+from otrs_gi_core.testing.fake_store import (
+    DEFAULT_LOCKS,
+    DEFAULT_PRIORITIES,
+    DEFAULT_QUEUES,
+    DEFAULT_STATES,
+    DEFAULT_TYPES,
+    TIME_FORMAT,
+)
+
+if TYPE_CHECKING:
+    from otrs_gi_core.domain_models.ticket_models import Ticket, TicketCreate
+
+EXTRA_QUEUES = (
+    "IT & Technology/Software Development",
+    "IT & Technology/Hardware Support",
+    "IT & Technology/Network Infrastructure",
+    "IT & Technology/Security Operations",
+    "Finance/Investments",
+    "Shopping/E-commerce",
+    "Travel & Transportation/Air Travel",
+    "Health/Medical Services",
+)
+
+# (name, weight) - most tickets of a long-running system are closed
+STATE_WEIGHTS = (
+    ("closed successful", 55),
+    ("closed unsuccessful", 8),
+    ("open", 14),
+    ("new", 10),
+    ("pending reminder", 5),
+    ("pending auto close+", 2),
+    ("merged", 3),
+    ("removed", 3),
+)
+PRIORITY_WEIGHTS = (("1 very low", 5), ("2 low", 15), ("3 normal", 60), ("4 high", 15), ("5 very high", 5))
+TYPE_WEIGHTS = (("Unclassified", 70), ("Incident", 30))
+
+SEVERITIES = ("minor", "major", "critical", "blocker")
+PRODUCT_LINES = ("Mail", "VPN", "ERP", "CRM", "Printing", "Telephony", "Webshop")
+TAGS = ("billing", "outage", "hardware", "access", "howto", "regression", "vip")
+
+WORDS = (
+    "printer network access password reset server error invoice customer order delivery the a to and of "
+    "please could you check again urgent update status request ticket issue resolved thanks regards "
+    "database timeout login failed mailbox quota license renewal backup restore firewall rule vpn tunnel "
+    "laptop monitor replacement warranty contract escalation callback schedule meeting yesterday today"
+).split()
+
+_TEXT_POOL_SIZE = 1 << 18
+_BINARY_POOL_SIZE = 1 << 18
+
+
+@dataclass(frozen=True)
+class DatasetConfig:
+    """Shape of a synthetic dataset; sizes are in bytes, times in days.
+
+    Article counts follow a geometric distribution with mean ``articles_mean``;
+    article bodies and attachments have log-normal sizes around the given
+    medians, which produces the long tail seen in real helpdesks.
+    """
+
+    tickets: int = 1000
+    seed: int = 0
+    first_ticket_id: int = 1
+    articles_mean: float = 3.0
+    max_articles: int = 50
+    body_size_median: int = 600
+    body_size_sigma: float = 1.0
+    max_body_size: int = 64_000
+    attachment_rate: float = 0.1
+    attachment_size_median: int = 20_000
+    max_attachment_size: int = 2_000_000
+    dynamic_field_rate: float = 0.8
+    customers: int = 5000
+    agents: int = 50
+    start: datetime = datetime(2020, 1, 1)
+    span_days: int = 3 * 365
+    queues: tuple[str, ...] = tuple(DEFAULT_QUEUES) + EXTRA_QUEUES
+
+
+def _weighted(options: tuple[tuple[str, int], ...]) -> tuple[list[str], list[int]]:
+    names, weights = zip(*options)
+    cumulative, total = [], 0
+    for w in weights:
+        total += w
+        cumulative.append(total)
+    return list(names), cumulative
+
+
+_STATES = _weighted(STATE_WEIGHTS)
+_PRIORITIES = _weighted(PRIORITY_WEIGHTS)
+_TYPES = _weighted(TYPE_WEIGHTS)
+
+
+class DatasetGenerator:
+    """Builds raw GenericInterface ``Ticket`` dictionaries as returned by TicketGet."""
+
+    def __init__(self, config: DatasetConfig = DatasetConfig()):
+        self.config = config
+        pool_rng = random.Random(config.seed)
+        words = []
+        length = 0
+        while length < _TEXT_POOL_SIZE:
+            word = pool_rng.choice(WORDS)
+            words.append(word)
+            length += len(word) + 1
+        self._text = " ".join(words)
+        self._binary = pool_rng.randbytes(_BINARY_POOL_SIZE)
+        self._queue_ids = dict(DEFAULT_QUEUES)
+        for name in config.queues:
+            self._queue_ids.setdefault(name, len(self._queue_ids) + 1)
+
+    def _rng(self, index: int) -> random.Random:
+        return random.Random((self.config.seed << 40) ^ index)
+
+    def _text_of_size(self, rng: random.Random, size: int) -> str:
+        size = min(size, len(self._text))
+        offset = rng.randrange(len(self._text) - size + 1)
+        return self._text[offset:offset + size]
+
+    def _size(self, rng: random.Random, median: int, sigma: float, maximum: int) -> int:
+        return max(1, min(maximum, int(rng.lognormvariate(math.log(median), sigma))))
+
+    @staticmethod
+    def _pick(rng: random.Random, table: tuple[list[str], list[int]]) -> str:
+        names, cumulative = table
+        return rng.choices(names, cum_weights=cumulative)[0]
+
+    def _attachment(self, rng: random.Random, article_id: int) -> dict[str, Any]:
+        cfg = self.config
+        size = self._size(rng, cfg.attachment_size_median, 1.2, cfg.max_attachment_size)
+        chunks = []
+        remaining = size
+        while remaining:
+            take = min(remaining, len(self._binary))
+            offset = rng.randrange(len(self._binary) - take + 1)
+            chunks.append(self._binary[offset:offset + take])
+            remaining -= take
+        kind = rng.choice((("pdf", "application/pdf"), ("png", "image/png"), ("txt", "text/plain")))
+        return {
+            "Content": base64.b64encode(b"".join(chunks)).decode("ascii"),
+            "ContentType": kind[1],
+            "Disposition": "attachment",
+            "FileID": 1,
+            "Filename": f"file-{article_id}.{kind[0]}",
+            "Filesize": f"{size / 1024:.1f} KBytes",
+            "FilesizeRaw": size,
+        }
+
+    def _dynamic_fields(self, rng: random.Random, created: datetime) -> list[dict[str, Any]]:
+        rate = self.config.dynamic_field_rate
+        candidates = (
+            ("Severity", lambda: rng.choice(SEVERITIES)),
+            ("ProductLine", lambda: rng.choice(PRODUCT_LINES)),
+            ("ContractID", lambda: f"C-{rng.randrange(10 ** 6):06d}"),
+            ("DueDate", lambda: (created + timedelta(days=rng.randint(1, 30))).strftime(TIME_FORMAT)),
+            ("Tags", lambda: rng.sample(TAGS, rng.randint(1, 3))),
+        )
+        return [{"Name": name, "Value": make()} for name, make in candidates if rng.random() < rate]
+
+    def ticket(self, index: int) -> dict[str, Any]:
+        """Return ticket number ``index`` (0-based) of the dataset."""
+        cfg = self.config
+        rng = self._rng(index)
+        ticket_id = cfg.first_ticket_id + index
+        created = cfg.start + timedelta(seconds=rng.randrange(max(1, cfg.span_days * 86400)))
+        queue = rng.choice(cfg.queues)
+        state = self._pick(rng, _STATES)
+        priority = self._pick(rng, _PRIORITIES)
+        type_ = self._pick(rng, _TYPES)
+        lock = "lock" if state in ("open", "pending reminder") and rng.random() < 0.5 else "unlock"
+        owner_id = rng.randint(1, cfg.agents)
+        customer = rng.randrange(cfg.customers)
+
+        if cfg.articles_mean > 1:
+            p = 1 / cfg.articles_mean
+            article_count = min(cfg.max_articles, 1 + int(math.log(1 - rng.random()) / math.log(1 - p)))
+        else:
+            article_count = 1
+        articles = []
+        at = created
+        first_article_id = (ticket_id - 1) * cfg.max_articles + 1
+        for number in range(1, article_count + 1):
+            article_id = first_article_id + number - 1
+            from_customer = number % 2 == 1
+            body_size = self._size(rng, cfg.body_size_median, cfg.body_size_sigma, cfg.max_body_size)
+            article: dict[str, Any] = {
+                "ArticleID": article_id,
+                "ArticleNumber": number,
+                "From": f"customer{customer}@example.com" if from_customer else f"agent{owner_id}@helpdesk.example",
+                "To": f"agent{owner_id}@helpdesk.example" if from_customer else f"customer{customer}@example.com",
+                "SenderType": "customer" if from_customer else "agent",
+                "Subject": self._text_of_size(rng, rng.randint(20, 70)).strip().capitalize(),
+                "Body": self._text_of_size(rng, body_size),
+                "ContentType": "text/plain; charset=utf-8",
+                "CreateTime": at.strftime(TIME_FORMAT),
+                "ChangeTime": at.strftime(TIME_FORMAT),
+            }
+            if rng.random() < cfg.attachment_rate:
+                article["Attachment"] = [self._attachment(rng, article_id)]
+            articles.append(article)
+            at += timedelta(minutes=rng.randint(5, 3 * 24 * 60))
+
+        return {
+            "TicketID": ticket_id,
+            "TicketNumber": f"{created:%Y%m%d}{ticket_id:010d}",
+            "Title": articles[0]["Subject"],
+            "Queue": queue,
+            "QueueID": self._queue_ids[queue],
+            "State": state,
+            "StateID": DEFAULT_STATES[state],
+            "Priority": priority,
+            "PriorityID": DEFAULT_PRIORITIES[priority],
+            "Type": type_,
+            "TypeID": DEFAULT_TYPES[type_],
+            "Lock": lock,
+            "LockID": DEFAULT_LOCKS[lock],
+            "OwnerID": owner_id,
+            "Owner": f"agent{owner_id}",
+            "CustomerID": f"CUST-{customer % 1000:05d}",
+            "CustomerUser": f"customer{customer}@example.com",
+            "Created": created.strftime(TIME_FORMAT),
+            "Changed": (at if article_count > 1 else created).strftime(TIME_FORMAT),
+            "DynamicField": self._dynamic_fields(rng, created),
+            "Article": articles,
+        }
+
+    def raw_tickets(self, start: int = 0, stop: Optional[int] = None) -> Iterator[dict[str, Any]]:
+        stop = self.config.tickets if stop is None else min(stop, self.config.tickets)
+        for index in range(start, stop):
+            yield self.ticket(index)
+
+
+def generate_raw_tickets(
+        config: DatasetConfig = DatasetConfig(),
+        start: int = 0,
+        stop: Optional[int] = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield the raw ``Ticket`` dictionaries ``start``..``stop`` of the dataset."""
+    return DatasetGenerator(config).raw_tickets(start, stop)
+
+
+def generate_tickets(
+        config: DatasetConfig = DatasetConfig(),
+        start: int = 0,
+        stop: Optional[int] = None,
+) -> Iterator[Ticket]:
+    """Yield the dataset as domain :class:`Ticket` objects, mapped like client responses."""
+    from otrs_gi_core.mappers import from_ws_ticket_detail
+    from otrs_gi_core.models.ticket_models import WsTicketOutput
+
+    for raw in generate_raw_tickets(config, start, stop):
+        yield from_ws_ticket_detail(WsTicketOutput.model_validate(raw))
+
+
+def generate_ticket_creates(
+        config: DatasetConfig = DatasetConfig(),
+        start: int = 0,
+        stop: Optional[int] = None,
+) -> Iterator[TicketCreate]:
+    """Yield :class:`TicketCreate` payloads (first article only) for import and load tests."""
+    from otrs_gi_core.domain_models.ticket_models import Article, IdName, TicketCreate
+
+    for raw in generate_raw_tickets(config, start, stop):
+        first = raw["Article"][0]
+        yield TicketCreate(
+            title=raw["Title"],
+            queue=IdName(name=raw["Queue"]),
+            state=IdName(name=raw["State"]),
+            priority=IdName(name=raw["Priority"]),
+            type=IdName(name=raw["Type"]),
+            customer_user=raw["CustomerUser"],
+            dynamic_fields={f["Name"]: f["Value"] for f in raw["DynamicField"]},
+            article=Article(
+                from_addr=first["From"],
+                to_addr=first["To"],
+                subject=first["Subject"],
+                body=first["Body"],
+                content_type=first["ContentType"],
+            ),
+        )
+
+
+def write_raw_tickets(path: Union[str, Path], config: DatasetConfig = DatasetConfig()) -> int:
+    """Write the dataset as NDJSON, one raw ``Ticket`` per line; returns the number of tickets."""
+    count = 0
+    with Path(path).open("w", encoding="utf-8") as fh:
+        for raw in generate_raw_tickets(config):
+            fh.write(json.dumps(raw, ensure_ascii=False))
+            fh.write("\n")
+            count += 1
+    return count
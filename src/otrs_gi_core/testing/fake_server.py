@@ -0,0 +1,290 @@
+"""In-process stand-in for an OTOBO/Znuny GenericInterface ticket webservice.
+
+``FakeGenericInterface`` is an ASGI application. It can be used in three ways:
+
+- with ``httpx.AsyncClient(transport=server.mock_transport())``
+- with ``httpx.ASGITransport(app=server)``
+- as a real HTTP server via :meth:`FakeGenericInterface.start_server`, or
+  ``python -m otrs_gi_core.testing``.
+
+No uvicorn is needed for the last option.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import random
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Mapping, Optional, Union
+
+import httpx
+
+from otrs_gi_core.domain_models.ticket_operation import TicketOperation
+from otrs_gi_core.testing.dataset import DatasetConfig, generate_raw_tickets
+from otrs_gi_core.testing.fake_store import TicketStore
+from otrs_gi_core.util.errors import GenericInterfaceError
+
+logger = logging.getLogger(__name__)
+
+LatencyDistribution = Callable[[random.Random], float]
+
+DEFAULT_OPERATION_URL_MAP = {
+    TicketOperation.CREATE: "ticket-create",
+    TicketOperation.GET: "ticket-get",
+    TicketOperation.SEARCH: "ticket-search",
+    TicketOperation.UPDATE: "ticket-update",
+}
+
+_HTTP_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    411: "Length Required",
+    413: "Request Entity Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+def fixed_latency(seconds: float) -> LatencyDistribution:
+    return lambda rng: seconds
+
+
+def uniform_latency(low: float, high: float) -> LatencyDistribution:
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal_latency(median: float, sigma: float = 0.5) -> LatencyDistribution:
+    """Right-skewed latency typical for database-backed requests; ``median`` in seconds."""
+    mu = math.log(median)
+    return lambda rng: rng.lognormvariate(mu, sigma)
+
+
+def exponential_latency(mean: float) -> LatencyDistribution:
+    return lambda rng: rng.expovariate(1 / mean)
+
+
+@dataclass(frozen=True)
+class FaultInjection:
+    """Fail a share of requests, either with a GenericInterface ``Error`` payload or an HTTP status.
+
+    ``operations`` limits the fault to some operations (all when empty). With the
+    default ``status_code`` of 200 the response carries ``error_code``, which
+    defaults to ``<Operation>.InjectedFault``.
+    """
+
+    rate: float
+    operations: tuple[TicketOperation, ...] = ()
+    status_code: int = 200
+    error_code: Optional[str] = None
+    message: str = "Injected fault"
+
+
+class FakeGenericInterface:
+    """ASGI app answering ticket operations of one webservice from a :class:`TicketStore`.
+
+    ``users`` maps logins to passwords; without it every non-empty ``UserLogin``
+    is accepted. ``latency`` is one distribution or one per operation, ``faults``
+    are checked in order and ``max_length`` mirrors the provider transport
+    ``MaxLength`` setting: larger request bodies get HTTP 413 like in OTOBO.
+    """
+
+    def __init__(
+            self,
+            webservice_name: str = "FakeWebservice",
+            operation_url_map: Optional[Mapping[TicketOperation, str]] = None,
+            *,
+            store: Optional[TicketStore] = None,
+            users: Optional[Mapping[str, str]] = None,
+            latency: Union[LatencyDistribution, Mapping[TicketOperation, LatencyDistribution], None] = None,
+            faults: tuple[FaultInjection, ...] = (),
+            max_length: Optional[int] = None,
+            seed: Optional[int] = None,
+    ):
+        self.webservice_name = webservice_name
+        url_map = operation_url_map or DEFAULT_OPERATION_URL_MAP
+        self.routes = {endpoint: operation for operation, endpoint in url_map.items()}
+        self.store = store or TicketStore()
+        self.users = dict(users) if users is not None else None
+        self.latency = latency
+        self.faults = faults
+        self.max_length = max_length
+        self.rng = random.Random(seed)
+        self.request_counts: Counter[str] = Counter()
+        self._handlers: dict[TicketOperation, Callable[[dict[str, Any]], dict[str, Any]]] = {
+            TicketOperation.CREATE: self.store.create,
+            TicketOperation.GET: self.store.get,
+            TicketOperation.SEARCH: self.store.search,
+            TicketOperation.UPDATE: self.store.update,
+        }
+
+    def _latency_for(self, operation: TicketOperation) -> float:
+        latency = self.latency
+        if latency is None:
+            return 0.0
+        if isinstance(latency, Mapping):
+            latency = latency.get(operation)
+            if latency is None:
+                return 0.0
+        return max(0.0, latency(self.rng))
+
+    def _injected_fault(self, operation: TicketOperation) -> Optional[FaultInjection]:
+        for fault in self.faults:
+            if (not fault.operations or operation in fault.operations) and self.rng.random() < fault.rate:
+                return fault
+        return None
+
+    def _authenticate(self, operation: TicketOperation, request: dict[str, Any]) -> None:
+        login, password = request.get("UserLogin"), request.get("Password")
+        if not login or (self.users is not None and self.users.get(login) != password):
+            raise GenericInterfaceError(f"{operation.value}.AuthFail", f"{operation.value}: Authorization failing!")
+
+    async def handle(self, method: str, path: str, body: bytes) -> tuple[int, bytes]:
+        """Answer one request; returns the HTTP status and the response body."""
+        if self.max_length is not None and len(body) > self.max_length:
+            return 413, b"Request Entity Too Large"
+        prefix = f"/Webservice/{self.webservice_name}/"
+        marker = path.find(prefix)
+        operation = self.routes.get(path[marker + len(prefix):].strip("/")) if marker >= 0 else None
+        if operation is None:
+            return 404, b"Not Found"
+        self.request_counts[operation.value] += 1
+
+        delay = self._latency_for(operation)
+        if delay:
+            await asyncio.sleep(delay)
+        fault = self._injected_fault(operation)
+        if fault is not None and fault.status_code != 200:
+            return fault.status_code, _HTTP_REASONS.get(fault.status_code, "Error").encode()
+
+        try:
+            request = json.loads(body or b"{}")
+            if not isinstance(request, dict):
+                raise ValueError("request body must be a JSON object")
+        except ValueError:
+            return 400, b"Bad Request"
+        try:
+            if fault is not None:
+                raise GenericInterfaceError(fault.error_code or f"{operation.value}.InjectedFault", fault.message)
+            self._authenticate(operation, request)
+            payload = self._handlers[operation](request)
+        except GenericInterfaceError as err:
+            payload = {"Error": {"ErrorCode": err.code, "ErrorMessage": err.message}}
+        return 200, json.dumps(payload).encode()
+
+    async def __call__(
+            self,
+            scope: dict[str, Any],
+            receive: Callable[[], Awaitable[dict[str, Any]]],
+            send: Callable[[dict[str, Any]], Awaitable[None]],
+    ) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        chunks = []
+        while True:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body"):
+                break
+        status, body = await self.handle(scope["method"], scope["path"], b"".join(chunks))
+        content_type = b"application/json" if status == 200 else b"text/plain"
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", content_type), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def _handle_httpx(self, request: httpx.Request) -> httpx.Response:
+        status, body = await self.handle(request.method, request.url.path, await request.aread())
+        content_type = "application/json" if status == 200 else "text/plain"
+        return httpx.Response(status, content=body, headers={"Content-Type": content_type})
+
+    def mock_transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self._handle_httpx)
+
+    def base_url(self, host: str = "http://fake-otobo") -> str:
+        """``base_url`` for a ``ClientConfig`` pointing at this server."""
+        return f"{host}/otrs/nph-genericinterface.pl"
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    return
+                method, target, version = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                if "content-length" in headers:
+                    body = await reader.readexactly(int(headers["content-length"]))
+                    status, response = await self.handle(method, target.split("?", 1)[0], body)
+                elif method in ("POST", "PUT", "PATCH"):
+                    status, response = 411, b"Length Required"
+                else:
+                    status, response = await self.handle(method, target.split("?", 1)[0], b"")
+                keep_alive = headers.get("connection", "").lower() != "close" and version.strip() == "HTTP/1.1"
+                content_type = "application/json" if status == 200 else "text/plain"
+                writer.write(
+                    f"HTTP/1.1 {status} {_HTTP_REASONS.get(status, 'Error')}\r\n"
+                    f"Content-Type: {content_type}\r\nContent-Length: {len(response)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + response
+                )
+                await writer.drain()
+                if not keep_alive:
+                    return
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError) as exc:
+            logger.debug(f"fake GenericInterface connection closed: {exc!r}")
+        finally:
+            writer.close()
+
+    async def start_server(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.Server:
+        """Serve HTTP/1.1 on ``host:port`` (0 picks a free port, see ``server.sockets``)."""
+        return await asyncio.start_server(self._serve_connection, host, port)
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    server = FakeGenericInterface(
+        args.webservice,
+        latency=lognormal_latency(args.latency_ms / 1000) if args.latency_ms else None,
+        faults=(FaultInjection(args.error_rate),) if args.error_rate else (),
+        max_length=args.max_length,
+        seed=args.seed,
+    )
+    if args.tickets:
+        config = DatasetConfig(tickets=args.tickets, seed=args.seed or 0)
+        server.store.insert_many(generate_raw_tickets(config))
+    http_server = await server.start_server(args.host, args.port)
+    host, port = http_server.sockets[0].getsockname()[:2]
+    print(f"Fake GenericInterface listening, base URL: {server.base_url(f'http://{host}:{port}')}", flush=True)
+    async with http_server:
+        await http_server.serve_forever()
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run a fake OTOBO/Znuny GenericInterface ticket webservice.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--webservice", default="FakeWebservice")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="median of a log-normal latency")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--max-length", type=int, default=None)
+    parser.add_argument("--tickets", type=int, default=0, help="pre-load this many synthetic tickets")
+    parser.add_argument("--seed", type=int, default=None)
+    try:
+        asyncio.run(_serve(parser.parse_args(argv)))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Iterable, Optional
+
+from otrs_gi_core.util.errors import GenericInterfaceError
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+DEFAULT_QUEUES = {"Postmaster": 1, "Raw": 2, "Junk": 3, "Misc": 4}
+DEFAULT_STATES = {
+    "new": 1,
+    "closed successful": 2,
+    "closed unsuccessful": 3,
+    "open": 4,
+    "removed": 5,
+    "pending reminder": 6,
+    "pending auto close+": 7,
+    "pending auto close-": 8,
+    "merged": 9,
+}
+DEFAULT_PRIORITIES = {"1 very low": 1, "2 low": 2, "3 normal": 3, "4 high": 4, "5 very high": 5}
+DEFAULT_LOCKS = {"unlock": 1, "lock": 2, "tmp_lock": 3}
+DEFAULT_TYPES = {"Unclassified": 1, "Incident": 2}
+
+# Ticket attribute -> (lookup name, id attribute, search names filter, search ids filter)
+_LOOKUP_FIELDS = (
+    ("Queue", "queues", "QueueID", "Queues", "QueueIDs"),
+    ("State", "states", "StateID", "States", "StateIDs"),
+    ("Priority", "priorities", "PriorityID", "Priorities", "PriorityIDs"),
+    ("Lock", "locks", "LockID", "Locks", "LockIDs"),
+    ("Type", "types", "TypeID", "Types", "TypeIDs"),
+)
+_PLAIN_FIELDS = ("Title", "CustomerUser", "CustomerID", "Owner", "OwnerID")
+
+
+class Lookup:
+    """Bidirectional name/id table; unknown names get the next free id instead of an error."""
+
+    def __init__(self, entries: dict[str, int]):
+        self.by_name = dict(entries)
+        self.by_id = {v: k for k, v in entries.items()}
+
+    def resolve(self, name: Optional[str], id_: Optional[int]) -> tuple[Optional[str], Optional[int]]:
+        if id_ is not None:
+            id_ = int(id_)
+            if name is not None and id_ not in self.by_id and name not in self.by_name:
+                self.by_name[name], self.by_id[id_] = id_, name
+            return self.by_id.get(id_, name), id_
+        if name is None:
+            return None, None
+        if name not in self.by_name:
+            new_id = max(self.by_id, default=0) + 1
+            self.by_name[name], self.by_id[new_id] = new_id, name
+        return name, self.by_name[name]
+
+
+def _as_list(value: Any) -> list[Any]:
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return value
+    if isinstance(value, str) and "," in value:
+        return [v.strip() for v in value.split(",")]
+    return [value]
+
+
+@lru_cache(maxsize=256)
+def _like(pattern: str) -> re.Pattern[str]:
+    """Translate a GenericInterface ``%``/``*`` wildcard pattern into a case-insensitive regex."""
+    parts = (re.escape(p) for p in re.split(r"[%*]", pattern))
+    return re.compile("^" + ".*".join(parts) + "$", re.IGNORECASE | re.DOTALL)
+
+
+def _matches_any(value: Any, patterns: list[Any]) -> bool:
+    text = "" if value is None else str(value)
+    return any(_like(str(p)).match(text) for p in patterns)
+
+
+def _dynamic_field_matches(value: Any, condition: dict[str, Any]) -> bool:
+    values = [str(v) for v in _as_list(value) if v not in (None, "")]
+    if not values:
+        return bool(int(condition.get("Empty", 0) or 0)) and len(condition) == 1
+    for key, expected in condition.items():
+        if expected is None or key == "Empty":
+            continue
+        if key == "Equals" and not set(values) & {str(e) for e in _as_list(expected)}:
+            return False
+        if key == "Like" and not any(_like(str(expected)).match(v) for v in values):
+            return False
+        if key == "GreaterThan" and not any(v > str(expected) for v in values):
+            return False
+        if key == "GreaterThanEquals" and not any(v >= str(expected) for v in values):
+            return False
+        if key == "SmallerThan" and not any(v < str(expected) for v in values):
+            return False
+        if key == "SmallerThanEquals" and not any(v <= str(expected) for v in values):
+            return False
+    return True
+
+
+class TicketStore:
+    """In-memory tickets stored as raw GenericInterface ``Ticket`` dictionaries.
+
+    Implements the request semantics of TicketCreate, TicketGet, TicketSearch and
+    TicketUpdate closely enough for the client; errors are raised as
+    :class:`GenericInterfaceError` with the operation-prefixed codes OTOBO uses.
+    """
+
+    def __init__(self) -> None:
+        self.tickets: dict[int, dict[str, Any]] = {}
+        self.lookups = {
+            "queues": Lookup(DEFAULT_QUEUES),
+            "states": Lookup(DEFAULT_STATES),
+            "priorities": Lookup(DEFAULT_PRIORITIES),
+            "locks": Lookup(DEFAULT_LOCKS),
+            "types": Lookup(DEFAULT_TYPES),
+        }
+        self._numbers: dict[str, int] = {}
+        self._next_ticket_id = 1
+        self._next_article_id = 1
+
+    def __len__(self) -> int:
+        return len(self.tickets)
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now().strftime(TIME_FORMAT)
+
+    def _apply_ticket_fields(self, ticket: dict[str, Any], fields: dict[str, Any]) -> None:
+        for name_key, lookup, id_key, _, _ in _LOOKUP_FIELDS:
+            name, id_ = fields.get(name_key), fields.get(id_key)
+            if name is not None or id_ is not None:
+                ticket[name_key], ticket[id_key] = self.lookups[lookup].resolve(name, id_)
+        for key in _PLAIN_FIELDS:
+            if fields.get(key) is not None:
+                ticket[key] = fields[key]
+
+    def _add_article(self, ticket: dict[str, Any], article: dict[str, Any]) -> int:
+        article_id = self._next_article_id
+        self._next_article_id += 1
+        now = self._now()
+        articles = ticket.setdefault("Article", [])
+        stored = {
+            "ContentType": "text/plain; charset=utf-8",
+            "CreateTime": now,
+            "ChangeTime": now,
+            **article,
+            "ArticleID": article_id,
+            "ArticleNumber": len(articles) + 1,
+        }
+        articles.append(stored)
+        return article_id
+
+    @staticmethod
+    def _apply_dynamic_fields(ticket: dict[str, Any], items: Any) -> None:
+        if not items:
+            return
+        if isinstance(items, dict):
+            items = [items]
+        current = {f["Name"]: f for f in ticket.setdefault("DynamicField", [])}
+        for item in items:
+            current[item["Name"]] = {"Name": item["Name"], "Value": item.get("Value")}
+        ticket["DynamicField"] = list(current.values())
+
+    def insert(self, ticket: dict[str, Any]) -> int:
+        """Store a complete ticket (e.g. from a generated dataset) keeping its ids where present.
+
+        The store takes ownership of ``ticket`` and may modify it.
+        """
+        ticket_id = int(ticket.get("TicketID") or self._next_ticket_id)
+        self._next_ticket_id = max(self._next_ticket_id, ticket_id + 1)
+        ticket["TicketID"] = ticket_id
+        ticket.setdefault("TicketNumber", f"{ticket_id:016d}")
+        self._apply_ticket_fields(ticket, ticket)
+        for article in ticket.get("Article") or []:
+            if article.get("ArticleID") is None:
+                article["ArticleID"] = self._next_article_id
+            self._next_article_id = max(self._next_article_id, int(article["ArticleID"]) + 1)
+        self.tickets[ticket_id] = ticket
+        self._numbers[ticket["TicketNumber"]] = ticket_id
+        return ticket_id
+
+    def insert_many(self, tickets: Iterable[dict[str, Any]]) -> int:
+        count = 0
+        for ticket in tickets:
+            self.insert(ticket)
+            count += 1
+        return count
+
+    def create(self, request: dict[str, Any]) -> dict[str, Any]:
+        fields = request.get("Ticket") or {}
+        article = request.get("Article")
+        missing = [
+            label for label, keys in (
+                ("Title", ("Title",)),
+                ("Queue or QueueID", ("Queue", "QueueID")),
+                ("State or StateID", ("State", "StateID")),
+                ("Priority or PriorityID", ("Priority", "PriorityID")),
+            ) if all(fields.get(k) in (None, "") for k in keys)
+        ]
+        if not isinstance(article, dict) or not article.get("Subject") or not article.get("Body"):
+            missing.append("Article Subject and Body")
+        if missing:
+            raise GenericInterfaceError("TicketCreate.MissingParameter", f"Required parameter missing: {missing[0]}")
+
+        ticket_id = self._next_ticket_id
+        self._next_ticket_id += 1
+        now = self._now()
+        number = f"{datetime.now():%Y%m%d}{ticket_id:08d}"
+        ticket: dict[str, Any] = {"TicketID": ticket_id, "TicketNumber": number, "Created": now, "Changed": now}
+        self._apply_ticket_fields(ticket, {"Lock": "unlock", "Type": "Unclassified", **fields})
+        article_id = self._add_article(ticket, article)
+        self._apply_dynamic_fields(ticket, request.get("DynamicField"))
+        self.tickets[ticket_id] = ticket
+        self._numbers[number] = ticket_id
+        return {"TicketID": str(ticket_id), "TicketNumber": number, "ArticleID": str(article_id), "Ticket": ticket}
+
+    def _find(self, request: dict[str, Any], operation: str) -> dict[str, Any]:
+        ticket_id = request.get("TicketID")
+        if ticket_id is None and request.get("TicketNumber") is not None:
+            ticket_id = self._numbers.get(str(request["TicketNumber"]))
+        if ticket_id is None and "TicketNumber" not in request:
+            raise GenericInterfaceError(f"{operation}.MissingParameter", "TicketID or TicketNumber is required")
+        ticket = self.tickets.get(int(ticket_id)) if ticket_id is not None else None
+        if ticket is None:
+            raise GenericInterfaceError(f"{operation}.AccessDenied", "User does not have access to the ticket")
+        return ticket
+
+    def update(self, request: dict[str, Any]) -> dict[str, Any]:
+        ticket = self._find(request, "TicketUpdate")
+        self._apply_ticket_fields(ticket, request.get("Ticket") or {})
+        response: dict[str, Any] = {"TicketID": str(ticket["TicketID"]), "TicketNumber": ticket["TicketNumber"]}
+        if isinstance(request.get("Article"), dict):
+            response["ArticleID"] = str(self._add_article(ticket, request["Article"]))
+        self._apply_dynamic_fields(ticket, request.get("DynamicField"))
+        ticket["Changed"] = self._now()
+        response["Ticket"] = ticket
+        return response
+
+    @staticmethod
+    def _render(ticket: dict[str, Any], request: dict[str, Any]) -> dict[str, Any]:
+        rendered = {k: v for k, v in ticket.items() if k not in ("Article", "DynamicField")}
+        if int(request.get("DynamicFields", 0) or 0):
+            rendered["DynamicField"] = ticket.get("DynamicField") or []
+        if int(request.get("AllArticles", 0) or 0):
+            articles = ticket.get("Article") or []
+            sender_types = request.get("ArticleSenderType")
+            if sender_types:
+                articles = [a for a in articles if a.get("SenderType") in sender_types]
+            if request.get("ArticleOrder") == "DESC":
+                articles = articles[::-1]
+            limit = request.get("ArticleLimit")
+            if limit:
+                articles = articles[:int(limit)]
+            if not int(request.get("Attachments", 0) or 0):
+                articles = [{k: v for k, v in a.items() if k != "Attachment"} for a in articles]
+            elif not int(request.get("GetAttachmentContents", 1) or 0):
+                articles = [
+                    {**a, "Attachment": [{k: v for k, v in f.items() if k != "Content"} for f in a["Attachment"]]}
+                    if a.get("Attachment") else a
+                    for a in articles
+                ]
+            rendered["Article"] = articles
+        return rendered
+
+    def get(self, request: dict[str, Any]) -> dict[str, Any]:
+        ids = _as_list(request.get("TicketID"))
+        if not ids:
+            raise GenericInterfaceError("TicketGet.MissingParameter", "TicketID is required")
+        rendered = []
+        for ticket_id in ids:
+            ticket = self.tickets.get(int(ticket_id))
+            if ticket is None:
+                raise GenericInterfaceError(
+                    "TicketGet.AccessDenied", f"User does not have access to the ticket {ticket_id}"
+                )
+            rendered.append(self._render(ticket, request))
+        return {"Ticket": rendered}
+
+    def _search_filters(self, request: dict[str, Any]) -> list[Any]:
+        filters = []
+        for key in ("TicketNumber", "Title", "CustomerID", "CustomerUserLogin"):
+            patterns = _as_list(request.get(key))
+            if patterns:
+                field = "CustomerUser" if key == "CustomerUserLogin" else key
+                filters.append(lambda t, f=field, p=patterns: _matches_any(t.get(f), p))
+        for name_key, _, id_key, names_filter, ids_filter in _LOOKUP_FIELDS:
+            names = set(_as_list(request.get(names_filter)))
+            if names:
+                filters.append(lambda t, k=name_key, n=names: t.get(k) in n)
+            ids = {int(i) for i in _as_list(request.get(ids_filter))}
+            if ids:
+                filters.append(lambda t, k=id_key, i=ids: t.get(k) in i)
+        for key, condition in request.items():
+            if key.startswith("DynamicField_") and isinstance(condition, dict):
+                name = key[len("DynamicField_"):]
+                filters.append(lambda t, n=name, c=condition: _dynamic_field_matches(
+                    next((f.get("Value") for f in t.get("DynamicField") or [] if f["Name"] == n), None), c
+                ))
+        return filters
+
+    def search(self, request: dict[str, Any]) -> dict[str, Any]:
+        filters = self._search_filters(request)
+        limit = int(request.get("Limit") or 0) or int(request.get("SearchLimit") or 0)
+        result: list[str] = []
+        # OTOBO sorts by age, newest first, unless told otherwise
+        for ticket_id in sorted(self.tickets, reverse=True):
+            ticket = self.tickets[ticket_id]
+            if all(f(ticket) for f in filters):
+                result.append(str(ticket_id))
+                if limit and len(result) >= limit:
+                    break
+        return {"TicketID": result} if result else {}
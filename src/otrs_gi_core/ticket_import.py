@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import json
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, AbstractSet, Iterator, Literal, Optional, TextIO, Union
+
+from otrs_gi_core.export.ndjson import read_resumable_ndjson
+
+if TYPE_CHECKING:
+    from otrs_gi_core.clients.generic_interface_client import GenericInterfaceClient
+    from otrs_gi_core.domain_models.ticket_models import TicketCreate
+
+logger = logging.getLogger(__name__)
+
+ImportFormat = Literal["csv", "ndjson"]
+ImportRow = Union[dict[str, Any], str]
+
+DEFAULT_IMPORT_CONCURRENCY = 4
+
+_ID_NAME_COLUMNS = ("queue", "state", "priority", "type", "lock", "owner")
+_ARTICLE_COLUMNS = {
+    "article_subject": "subject",
+    "article_body": "body",
+    "article_from": "from_addr",
+    "article_to": "to_addr",
+    "article_content_type": "content_type",
+}
+DYNAMIC_FIELD_PREFIX = "df_"
+
+
+def detect_format(path: str | Path) -> ImportFormat:
+    suffix = Path(path).suffix.lower()
+    if suffix == ".csv":
+        return "csv"
+    if suffix in (".ndjson", ".jsonl"):
+        return "ndjson"
+    raise ValueError(f"Cannot infer import format from '{path}', use .csv, .ndjson or .jsonl")
+
+
+def iter_rows(source: TextIO, fmt: ImportFormat) -> Iterator[tuple[int, ImportRow]]:
+    """Yield ``(row_number, row)`` pairs, numbering data rows from 1.
+
+    NDJSON rows are yielded as raw lines and parsed per row, so one malformed
+    line only fails its own row.
+    """
+    if fmt == "csv":
+        for row_number, row in enumerate(csv.DictReader(source), start=1):
+            yield row_number, row
+        return
+    row_number = 0
+    for line in source:
+        if not line.strip():
+            continue
+        row_number += 1
+        yield row_number, line
+
+
+def _blank_to_none(value: Any) -> Any:
+    return None if value == "" else value
+
+
+def csv_row_to_ticket_create(row: dict[str, Any]) -> TicketCreate:
+    """Build a ticket from flat CSV columns.
+
+    ``queue``/``queue_id`` style columns become ``IdName`` values,
+    ``article_*`` columns the first article and ``df_<Name>`` columns dynamic fields.
+    """
+    from otrs_gi_core.domain_models.ticket_models import Article, IdName, TicketCreate
+
+    row = {k: _blank_to_none(v) for k, v in row.items() if k is not None}
+    fields: dict[str, Any] = {
+        "title": row.get("title"),
+        "customer_id": row.get("customer_id"),
+        "customer_user": row.get("customer_user"),
+    }
+    for column in _ID_NAME_COLUMNS:
+        id_value, name_value = row.get(f"{column}_id"), row.get(column)
+        if id_value is not None or name_value is not None:
+            fields[column] = IdName(id=id_value, name=name_value)
+    article = {target: row[column] for column, target in _ARTICLE_COLUMNS.items() if row.get(column) is not None}
+    if article:
+        fields["article"] = Article(**article)
+    fields["dynamic_fields"] = {
+        k[len(DYNAMIC_FIELD_PREFIX):]: v
+        for k, v in row.items()
+        if k.startswith(DYNAMIC_FIELD_PREFIX) and v is not None
+    }
+    return TicketCreate(**fields)
+
+
+def row_to_ticket_create(row: ImportRow, fmt: ImportFormat) -> TicketCreate:
+    from otrs_gi_core.domain_models.ticket_models import TicketCreate
+
+    if isinstance(row, str):
+        return TicketCreate.model_validate_json(row)
+    if fmt == "csv":
+        return csv_row_to_ticket_create(row)
+    return TicketCreate.model_validate(row)
+
+
+def completed_rows(results_path: str | Path) -> set[int]:
+    """Rows that already produced a ticket in a previous run; failed rows are retried."""
+    return {
+        int(record["row"])
+        for record in read_resumable_ndjson(results_path)
+        if record.get("ticket_id") is not None and record.get("row") is not None
+    }
+
+
+async def import_tickets(
+        client: GenericInterfaceClient,
+        rows: Iterator[tuple[int, ImportRow]],
+        fmt: ImportFormat,
+        results: TextIO,
+        *,
+        concurrency: int = DEFAULT_IMPORT_CONCURRENCY,
+        skip_rows: AbstractSet[int] = frozenset(),
+) -> tuple[int, int]:
+    """Create a ticket per row with at most ``concurrency`` requests in flight.
+
+    Every outcome is appended to ``results`` as ``{"row", "ticket_id", "ticket_number"}``
+    or ``{"row", "error"}`` and flushed immediately, so an interrupted run can be
+    resumed without creating tickets twice. Returns ``(created, failed)``.
+    """
+    created = 0
+    failed = 0
+    pending = ((n, row) for n, row in rows if n not in skip_rows)
+
+    def record(entry: dict[str, Any]) -> None:
+        results.write(json.dumps(entry))
+        results.write("\n")
+        results.flush()
+
+    async def worker() -> None:
+        nonlocal created, failed
+        for row_number, row in pending:
+            try:
+                ticket_create = row_to_ticket_create(row, fmt)
+            except ValueError as exc:
+                failed += 1
+                record({"row": row_number, "error": f"invalid row: {exc}"})
+                continue
+            try:
+                ticket = await client.create_ticket(ticket_create)
+            except Exception as exc:
+                failed += 1
+                logger.warning(f"Failed to import row {row_number}: {exc}")
+                record({"row": row_number, "error": str(exc)})
+                continue
+            created += 1
+            record({"row": row_number, "ticket_id": ticket.id, "ticket_number": ticket.number})
+
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    return created, failed
+
+
+def open_rows(path: str | Path, fmt: Optional[ImportFormat] = None) -> tuple[TextIO, ImportFormat]:
+    resolved = fmt or detect_format(path)
+    return Path(path).open("r", encoding="utf-8", newline="" if resolved == "csv" else None), resolved
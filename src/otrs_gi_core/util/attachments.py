@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import binascii
+import io
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Optional, Protocol, runtime_checkable
+
+DEFAULT_SPILL_THRESHOLD = 1024 * 1024
+DECODE_CHUNK_CHARS = 64 * 1024
+
+_BASE64_WHITESPACE = str.maketrans("", "", " \t\r\n")
+
+
+@runtime_checkable
+class AttachmentSink(Protocol):
+    """Provides the writable, seekable binary buffer an attachment is decoded into."""
+
+    def create(self, size_hint: int, filename: Optional[str], content_type: Optional[str]) -> BinaryIO:
+        ...
+
+
+class SpillingAttachmentSink:
+    """Keeps small attachments in memory and writes larger ones to anonymous temp files."""
+
+    def __init__(self, threshold: int = DEFAULT_SPILL_THRESHOLD, directory: str | Path | None = None) -> None:
+        self.threshold = threshold
+        self.directory = str(directory) if directory is not None else None
+
+    def create(self, size_hint: int, filename: Optional[str], content_type: Optional[str]) -> BinaryIO:
+        if size_hint <= self.threshold:
+            return io.BytesIO()
+        return tempfile.TemporaryFile(mode="w+b", dir=self.directory)
+
+
+class DirectoryAttachmentSink:
+    """Writes every attachment to a uniquely named file below ``directory``."""
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    def create(self, size_hint: int, filename: Optional[str], content_type: Optional[str]) -> BinaryIO:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        suffix = Path(filename).suffix if filename else ""
+        fd, path = tempfile.mkstemp(suffix=suffix, prefix="attachment-", dir=self.directory)
+        return open(fd, "w+b", closefd=True)
+
+
+def estimate_decoded_size(encoded: str) -> int:
+    return (len(encoded) * 3) // 4
+
+
+def decode_base64_into(encoded: str, target: BinaryIO, chunk_chars: int = DECODE_CHUNK_CHARS) -> int:
+    """Decode ``encoded`` chunk by chunk into ``target`` and return the number of bytes written.
+
+    Line breaks inserted by MIME encoders are skipped, so only one chunk of decoded
+    bytes is held in memory at a time.
+    """
+    written = 0
+    carry = ""
+    for start in range(0, len(encoded), chunk_chars):
+        chunk = carry + encoded[start:start + chunk_chars].translate(_BASE64_WHITESPACE)
+        usable = len(chunk) - len(chunk) % 4
+        carry = chunk[usable:]
+        if usable:
+            written += target.write(binascii.a2b_base64(chunk[:usable]))
+    if carry:
+        written += target.write(binascii.a2b_base64(carry + "=" * (-len(carry) % 4)))
+    target.seek(0)
+    return written
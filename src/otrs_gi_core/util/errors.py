@@ -4,3 +4,12 @@ class GenericInterfaceError(Exception):
         super().__init__(f"{code}: {message}")
         self.code = code
         self.message = message
+
+
+class ResponseTooLargeError(Exception):
+    """A response (or, when streaming, a single ticket) exceeded the configured size limit."""
+
+    def __init__(self, limit: int, size: int):
+        super().__init__(f"response exceeds the limit of {limit} bytes (at least {size} bytes)")
+        self.limit = limit
+        self.size = size
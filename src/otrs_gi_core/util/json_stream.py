@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Optional
+
+from otrs_gi_core.util.errors import ResponseTooLargeError
+
+_STRUCTURAL = re.compile(rb'["\[\]{},:]')
+_STRING_END = re.compile(rb'["\\]')
+
+
+class JsonArrayItemSplitter:
+    """Splits a top-level JSON object incrementally, yielding the items of one array member.
+
+    ``feed`` takes response chunks and returns the raw bytes of every item of
+    ``{"<key>": [item, ...]}`` completed so far, so only one item has to be
+    held at a time. Strings are skipped with a regular expression, which keeps
+    large article bodies cheap. All other top-level members (e.g. ``Error``)
+    are decoded into ``members``; a ``key`` whose value is not an array ends
+    up there as well. An item larger than ``max_item_bytes`` raises
+    :class:`ResponseTooLargeError` as soon as the limit is crossed.
+    """
+
+    def __init__(self, key: str, max_item_bytes: Optional[int] = None) -> None:
+        self.key = key
+        self.max_item_bytes = max_item_bytes
+        self.members: dict[str, Any] = {}
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._expect_key = False
+        self._current_key: Optional[str] = None
+        self._in_array = False
+        self._finished = False
+        self._buffer = bytearray()
+        self._capture_from: Optional[int] = None
+
+    def _start_capture(self, pos: int) -> None:
+        self._buffer.clear()
+        self._capture_from = pos
+
+    def _end_capture(self, data: bytes, end: int) -> bytes:
+        self._buffer += data[self._capture_from:end]
+        self._capture_from = None
+        return bytes(self._buffer).strip()
+
+    def _check_item_size(self, size: int) -> None:
+        if self.max_item_bytes is not None and size > self.max_item_bytes:
+            raise ResponseTooLargeError(self.max_item_bytes, size)
+
+    def _end_item(self, data: bytes, end: int, items: list[bytes]) -> None:
+        item = self._end_capture(data, end)
+        self._check_item_size(len(item))
+        if item:
+            items.append(item)
+
+    def _end_member(self, data: bytes, end: int) -> None:
+        raw = self._end_capture(data, end)
+        if self._current_key is not None and raw:
+            self.members[self._current_key] = json.loads(raw)
+        self._current_key = None
+
+    def feed(self, data: bytes) -> list[bytes]:
+        """Consume the next chunk and return the raw items it completed."""
+        if self._finished and data.strip():
+            raise ValueError("unexpected data after the end of the JSON document")
+        items: list[bytes] = []
+        pos, size = 0, len(data)
+        while pos < size:
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                    pos += 1
+                    continue
+                match = _STRING_END.search(data, pos)
+                if match is None:
+                    break
+                pos = match.end()
+                if data[match.start()] == 0x5C:  # backslash: skip the escaped byte
+                    self._escape = True
+                    continue
+                self._in_string = False
+                if self._expect_key and self._depth == 1:
+                    self._current_key = json.loads(self._end_capture(data, pos))
+                    self._expect_key = False
+                continue
+
+            match = _STRUCTURAL.search(data, pos)
+            if match is None:
+                break
+            char, index, pos = data[match.start()], match.start(), match.end()
+            if char == 0x22:  # "
+                self._in_string = True
+                if self._expect_key and self._depth == 1:
+                    self._start_capture(index)
+            elif char in (0x7B, 0x5B):  # { [
+                if self._depth == 0:
+                    if char != 0x7B:
+                        raise ValueError("expected a JSON object")
+                    self._expect_key = True
+                elif self._depth == 1 and char == 0x5B and self._current_key == self.key:
+                    self._capture_from = None
+                    self._in_array = True
+                    self._start_capture(pos)
+                self._depth += 1
+            elif char in (0x7D, 0x5D):  # } ]
+                if self._in_array and self._depth == 2:
+                    self._end_item(data, index, items)
+                    self._in_array = False
+                    self._current_key = None
+                elif self._depth == 1:
+                    if self._current_key is not None:
+                        self._end_member(data, index)
+                    self._finished = True
+                self._depth -= 1
+            elif char == 0x2C:  # ,
+                if self._in_array and self._depth == 2:
+                    self._end_item(data, index, items)
+                    self._start_capture(pos)
+                elif self._depth == 1:
+                    if self._current_key is not None:
+                        self._end_member(data, index)
+                    self._expect_key = True
+            elif char == 0x3A and self._depth == 1:  # :
+                self._start_capture(pos)
+        if self._capture_from is not None:
+            self._buffer += data[self._capture_from:]
+            self._capture_from = 0
+            if self._in_array:
+                self._check_item_size(len(self._buffer))
+        return items
+
+    def close(self) -> None:
+        """Raise ``ValueError`` if the document ended early."""
+        if not self._finished:
+            raise ValueError("truncated JSON document")
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import importlib
+from typing import Any, Callable, Mapping
+
+
+def lazy_exports(
+        module_globals: dict[str, Any],
+        exports: Mapping[str, tuple[str, str]],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build module-level ``__getattr__``/``__dir__`` resolving ``exports`` on first access.
+
+    ``exports`` maps a public name to ``(module, attribute)``. Resolved values are
+    stored in ``module_globals`` so later lookups bypass ``__getattr__``.
+    """
+    module_name = module_globals["__name__"]
+
+    def __getattr__(name: str) -> Any:
+        try:
+            target_module, attribute = exports[name]
+        except KeyError:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}") from None
+        value = getattr(importlib.import_module(target_module), attribute)
+        module_globals[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(module_globals) | set(exports))
+
+    return __getattr__, __dir__
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from otrs_gi_core.cli.environments import HostSystem, detect_system
+if TYPE_CHECKING:
+    from otrs_gi_core.cli.environments import HostSystem
 
 DEFAULT_CONSOLE_PATHS = (
     Path("/opt/znuny/bin/otrs.Console.pl"),
@@ -18,6 +20,8 @@ DEFAULT_DOCKER_WEBSERVICES_PATH = Path("/opt/znuny/var/webservices")
 
 
 def detect_znuny_system() -> HostSystem | None:
+    from otrs_gi_core.cli.environments import detect_system
+
     return detect_system(
         console_paths=DEFAULT_CONSOLE_PATHS,
         webservice_paths=DEFAULT_WEBSERVICE_PATHS,
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from otrs_gi_core.clients.article_cursor import InMemoryArticleCursorStore, JsonFileArticleCursorStore
+from otrs_gi_core.clients.generic_interface_client import GenericInterfaceClient
+from otrs_gi_core.domain_models.basic_auth_model import BasicAuth
+from otrs_gi_core.domain_models.client_config import ClientConfig
+from otrs_gi_core.domain_models.ticket_operation import TicketOperation
+
+pytestmark = pytest.mark.unit
+
+
+class FakeTicketGetResponse:
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self._payload = payload
+        self.status_code = 200
+        self.text = "{}"
+
+    def json(self) -> Any:
+        return self._payload
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+def make_server(article_ids: list[int]) -> AsyncMock:
+    """Fake TicketGet honouring ArticleOrder=DESC and ArticleLimit."""
+    http_client = AsyncMock()
+
+    async def request(method: str, url: str, json: dict[str, Any], headers: dict[str, str]) -> FakeTicketGetResponse:
+        ordered = sorted(article_ids, reverse=json.get("ArticleOrder") == "DESC")
+        limit = json.get("ArticleLimit")
+        if limit:
+            ordered = ordered[:limit]
+        articles = [{"ArticleID": i, "Subject": f"S{i}"} for i in ordered]
+        return FakeTicketGetResponse({"Ticket": [{"TicketID": 1, "Article": articles}]})
+
+    http_client.request.side_effect = request
+    return http_client
+
+
+def make_client(http_client: AsyncMock) -> GenericInterfaceClient:
+    client = GenericInterfaceClient(
+        ClientConfig(
+            base_url="https://example.org",
+            webservice_name="Service",
+            operation_url_map={TicketOperation.GET: "ticket-get"},
+        ),
+        client=http_client,
+    )
+    client.login(BasicAuth(user_login="user", password="pass"))
+    return client
+
+
+async def test_no_new_articles_costs_one_request() -> None:
+    http_client = make_server([1, 2, 3])
+    client = make_client(http_client)
+
+    articles = await client.get_new_articles(1, after_article_id=3, page_size=2)
+
+    assert articles == []
+    assert http_client.request.await_count == 1
+    sent = http_client.request.call_args.kwargs["json"]
+    assert sent["ArticleOrder"] == "DESC"
+    assert sent["ArticleLimit"] == 2
+    assert sent["DynamicFields"] == 0
+
+
+async def test_default_poll_requests_a_single_article_first() -> None:
+    http_client = make_server([1, 2, 3, 4, 5, 6])
+    client = make_client(http_client)
+
+    assert await client.get_new_articles(1, after_article_id=6) == []
+    assert http_client.request.call_args.kwargs["json"]["ArticleLimit"] == 1
+
+    articles = await client.get_new_articles(1, after_article_id=2)
+
+    assert [a.article_id for a in articles] == [3, 4, 5, 6]
+    limits = [c.kwargs["json"]["ArticleLimit"] for c in http_client.request.call_args_list[1:]]
+    assert limits == [1, 2, 4, 8]
+
+
+async def test_page_grows_until_cursor_is_reached() -> None:
+    http_client = make_server(list(range(1, 11)))
+    client = make_client(http_client)
+
+    articles = await client.get_new_articles(1, after_article_id=4, page_size=2)
+
+    assert [a.article_id for a in articles] == [5, 6, 7, 8, 9, 10]
+    limits = [c.kwargs["json"]["ArticleLimit"] for c in http_client.request.call_args_list]
+    assert limits == [2, 4, 8]
+
+
+async def test_without_cursor_all_articles_are_returned() -> None:
+    http_client = make_server([3, 1, 2])
+    client = make_client(http_client)
+
+    articles = await client.get_new_articles(1)
+
+    assert [a.article_id for a in articles] == [1, 2, 3]
+    assert "ArticleLimit" not in http_client.request.call_args.kwargs["json"]
+
+
+async def test_poll_new_articles_advances_cursor() -> None:
+    article_ids = [1, 2]
+    client = make_client(make_server(article_ids))
+    store = InMemoryArticleCursorStore()
+
+    first = await client.poll_new_articles(1, store)
+    article_ids.append(3)
+    second = await client.poll_new_articles(1, store)
+    third = await client.poll_new_articles(1, store)
+
+    assert [a.article_id for a in first] == [1, 2]
+    assert [a.article_id for a in second] == [3]
+    assert third == []
+    assert store.get(1) == 3
+
+
+def test_json_file_cursor_store_persists(tmp_path) -> None:
+    path = tmp_path / "cursors.json"
+    store = JsonFileArticleCursorStore(path)
+    store.set(7, 10)
+    store.set(7, 5)
+
+    reloaded = JsonFileArticleCursorStore(path)
+    assert reloaded.get(7) == 10
+    assert reloaded.get(8) is None
@@ -0,0 +1,71 @@
+import base64
+import io
+import os
+
+import pytest
+
+from otrs_gi_core.mappers import from_ws_article, from_ws_ticket_detail, to_ws_ticket_get
+from otrs_gi_core.models.ticket_models import WsArticleDetail, WsAttachment, WsTicketOutput
+from otrs_gi_core.util.attachments import DirectoryAttachmentSink, SpillingAttachmentSink, decode_base64_into
+
+pytestmark = pytest.mark.unit
+
+
+def mime_base64(data: bytes) -> str:
+    return base64.encodebytes(data).decode("ascii")
+
+
+@pytest.mark.parametrize("chunk_chars", [3, 7, 76, 4096])
+def test_decode_base64_into_handles_line_breaks_and_chunk_boundaries(chunk_chars: int) -> None:
+    data = os.urandom(1000)
+    target = io.BytesIO()
+
+    written = decode_base64_into(mime_base64(data), target, chunk_chars=chunk_chars)
+
+    assert written == len(data)
+    assert target.read() == data
+
+
+def test_spilling_sink_keeps_small_attachments_in_memory_and_spills_large_ones(tmp_path) -> None:
+    sink = SpillingAttachmentSink(threshold=100, directory=tmp_path)
+    small = WsAttachment(Filename="a.txt", Content=mime_base64(b"hello"), FilesizeRaw=5)
+    large_data = os.urandom(5000)
+    large = WsAttachment(Filename="b.bin", Content=mime_base64(large_data), FilesizeRaw=len(large_data))
+
+    article = from_ws_article(WsArticleDetail(ArticleID=1, Attachment=[small, large]), sink)
+
+    small_att, large_att = article.attachments
+    assert isinstance(small_att.content, io.BytesIO)
+    with small_att.memoryview() as view:
+        assert bytes(view) == b"hello"
+    assert not isinstance(large_att.content, io.BytesIO)
+    assert large_att.size == len(large_data)
+    with large_att.memoryview() as view:
+        assert bytes(view) == large_data
+    with pytest.raises(ValueError):
+        bytes(view)
+    assert large.Content is None
+    large_att.close()
+
+
+def test_directory_sink_writes_named_files(tmp_path) -> None:
+    sink = DirectoryAttachmentSink(tmp_path / "out")
+    wire = WsTicketOutput(
+        TicketID=1,
+        Article=[WsArticleDetail(Attachment=[WsAttachment(Filename="report.pdf", Content=mime_base64(b"%PDF"))])],
+    )
+
+    ticket = from_ws_ticket_detail(wire, attachment_sink=sink)
+
+    attachment = ticket.articles[0].attachments[0]
+    assert attachment.read_bytes() == b"%PDF"
+    assert [p.suffix for p in (tmp_path / "out").iterdir()] == [".pdf"]
+    assert "content" not in ticket.model_dump()["articles"][0]["attachments"][0]
+    attachment.close()
+
+
+def test_attachments_are_skipped_without_sink() -> None:
+    article = from_ws_article(WsArticleDetail(Attachment=[WsAttachment(Content=mime_base64(b"x"))]))
+    assert article.attachments == []
+    assert to_ws_ticket_get(1).Attachments == 0
+    assert to_ws_ticket_get(1, include_attachments=True).Attachments == 1
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+DEFERRED_MODULES = (
+    "pydantic",
+    "httpx",
+    "yaml",
+    "zxcvbn",
+    "otrs_gi_core.clients.generic_interface_client",
+    "otrs_gi_core.cli.system_console",
+    "otrs_gi_core.setup.bootstrap",
+    "otrs_gi_core.ticket_import",
+    "otrs_gi_core.loadtest",
+    "otrs_gi_core.export",
+)
+
+_PROBE = """
+import json, sys
+from {package}.cli import app
+try:
+    app(["--help"], prog_name="{package}")
+except SystemExit:
+    pass
+print(json.dumps({{"loaded": [m for m in {deferred!r} if m in sys.modules]}}), file=sys.stderr)
+"""
+
+
+def run_help(package: str) -> tuple[str, dict]:
+    code = _PROBE.format(package=package, deferred=DEFERRED_MODULES)
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return result.stdout, json.loads(result.stderr.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("package", ["otobo", "znuny"])
+def test_help_does_not_import_command_dependencies(package: str) -> None:
+    output, probe = run_help(package)
+
+    assert probe["loaded"] == []
+    for command in ("add-user", "export-tickets", "import-tickets", "bench", "setup-system"):
+        assert command in output
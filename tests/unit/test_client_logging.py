@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+import logging
+
+import httpx
+import pytest
+
+from otrs_gi_core.clients import generic_interface_client
+from otrs_gi_core.clients.generic_interface_client import GenericInterfaceClient
+from otrs_gi_core.domain_models.basic_auth_model import BasicAuth
+from otrs_gi_core.domain_models.client_config import ClientConfig
+from otrs_gi_core.domain_models.ticket_operation import TicketOperation
+from otrs_gi_core.util.errors import GenericInterfaceError
+
+pytestmark = pytest.mark.unit
+
+LOGGER = "otrs_gi_core.clients.generic_interface_client"
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if json.loads(request.content)["TicketID"] == 13:
+        return httpx.Response(200, json={"Error": {"ErrorCode": "TicketGet.NotFound", "ErrorMessage": "gone"}})
+    return httpx.Response(200, json={"Ticket": [{"TicketID": 1}]})
+
+
+def make_client(**kwargs) -> GenericInterfaceClient:
+    config = ClientConfig(
+        base_url="https://example.org/otrs",
+        webservice_name="WS",
+        operation_url_map={TicketOperation.GET: "get"},
+    )
+    client = GenericInterfaceClient(config, client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), **kwargs)
+    client.login(BasicAuth(user_login="agent", password="pw"))
+    return client
+
+
+async def test_debug_records_carry_structured_fields(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.DEBUG, logger=LOGGER)
+
+    await make_client().get_ticket(1)
+
+    request, response = [r for r in caplog.records if r.name == LOGGER]
+    assert request.otrs_gi["method"] == "POST"
+    assert request.otrs_gi["payload_keys"][:3] == ["UserLogin", "Password", "TicketID"]
+    assert response.otrs_gi["request_id"] == request.otrs_gi["request_id"]
+    assert response.otrs_gi["status"] == 200
+    assert response.getMessage().startswith(f"response request_id={request.otrs_gi['request_id']} status=200")
+
+
+async def test_fields_are_not_rendered_below_debug(
+        caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fail(self) -> str:
+        raise AssertionError("fields rendered although DEBUG is disabled")
+
+    monkeypatch.setattr(generic_interface_client._LogFields, "__str__", fail)
+    caplog.set_level(logging.INFO, logger=LOGGER)
+
+    await make_client().get_ticket(1)
+
+    assert not [r for r in caplog.records if r.name == LOGGER]
+
+
+async def test_debug_logging_can_be_sampled(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.DEBUG, logger=LOGGER)
+    client = make_client(debug_log_sample_rate=0.0)
+
+    await client.get_ticket(1)
+    with pytest.raises(GenericInterfaceError):
+        await client.get_ticket(13)
+
+    records = [r for r in caplog.records if r.name == LOGGER]
+    assert [r.levelno for r in records] == [logging.ERROR]
+    assert records[0].otrs_gi["code"] == "TicketGet.NotFound"
+    assert records[0].otrs_gi["message"] == "gone"
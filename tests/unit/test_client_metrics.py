@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+import math
+import time
+
+import httpx
+import pytest
+
+from otrs_gi_core.clients.generic_interface_client import GenericInterfaceClient
+from otrs_gi_core.clients.hooks import RequestEvent
+from otrs_gi_core.clients.metrics import ClientMetrics, Histogram
+from otrs_gi_core.domain_models.basic_auth_model import BasicAuth
+from otrs_gi_core.domain_models.client_config import ClientConfig
+from otrs_gi_core.domain_models.ticket_models import TicketSearch
+from otrs_gi_core.domain_models.ticket_operation import TicketOperation
+from otrs_gi_core.util.errors import GenericInterfaceError
+
+pytestmark = pytest.mark.unit
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    body = json.loads(request.content)
+    if request.url.path.endswith("search"):
+        return httpx.Response(200, json={"TicketID": [1, 2, 13]})
+    if body.get("TicketID") == 14:
+        time.sleep(0.3)
+        raise httpx.ReadTimeout("slow server", request=request)
+    if body.get("TicketID") == 13:
+        return httpx.Response(200, json={"Error": {"ErrorCode": "TicketGet.AccessDenied", "ErrorMessage": "no"}})
+    return httpx.Response(200, json={"Ticket": [{"TicketID": body["TicketID"], "Title": "t"}]})
+
+
+def make_client(metrics: ClientMetrics) -> GenericInterfaceClient:
+    config = ClientConfig(
+        base_url="https://example.org/otrs",
+        webservice_name="WS",
+        operation_url_map={TicketOperation.SEARCH: "search", TicketOperation.GET: "get"},
+    )
+    client = GenericInterfaceClient(
+        config, client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), hooks=[metrics]
+    )
+    client.login(BasicAuth(user_login="agent", password="pw"))
+    return client
+
+
+async def test_metrics_aggregate_requests_per_operation_and_webservice() -> None:
+    metrics = ClientMetrics()
+    client = make_client(metrics)
+
+    await client.search_tickets(TicketSearch())
+    await client.get_ticket(1)
+    with pytest.raises(GenericInterfaceError):
+        await client.get_ticket(13)
+
+    snapshot = metrics.snapshot()
+    search = snapshot.operations[("SEARCH", "WS")]
+    get = snapshot.operations[("GET", "WS")]
+    assert (search.requests, search.errors, search.in_flight) == (1, 0, 0)
+    assert (get.requests, get.errors, get.in_flight) == (2, 1, 0)
+    assert get.bytes_sent > 0 and get.bytes_received > 0
+    assert 0 < get.p50 <= get.p99
+    assert snapshot.errors_by_code == {("GET", "WS", "TicketGet.AccessDenied"): 1}
+
+
+async def test_timeouts_are_observed_with_their_real_duration() -> None:
+    metrics = ClientMetrics(buckets=(0.01, 0.25, 1.0))
+    client = make_client(metrics)
+
+    with pytest.raises(httpx.ReadTimeout):
+        await client.get_ticket(14)
+
+    get = metrics.snapshot().operations[("GET", "WS")]
+    assert (get.requests, get.errors) == (1, 1)
+    assert metrics.snapshot().errors_by_code == {("GET", "WS", "ReadTimeout"): 1}
+    assert 0.25 < get.p50 <= 1.0
+
+
+def test_in_flight_is_tracked_between_before_send_and_completion() -> None:
+    metrics = ClientMetrics()
+    event = RequestEvent(operation=TicketOperation.GET, method="POST", request_id="r1", webservice="WS")
+
+    metrics.before_send(event)
+    assert metrics.snapshot().operations[("GET", "WS")].in_flight == 1
+
+    event.error = RuntimeError("boom")
+    metrics.on_error(event)
+    stats = metrics.snapshot()
+    assert stats.operations[("GET", "WS")].in_flight == 0
+    assert stats.errors_by_code == {("GET", "WS", "RuntimeError"): 1}
+
+
+def test_histogram_quantile_interpolates_within_bucket() -> None:
+    histogram = Histogram((0.1, 0.2, 0.4))
+    assert math.isnan(histogram.quantile(0.5))
+    for value in (0.05, 0.15, 0.15, 0.3):
+        histogram.observe(value)
+
+    assert histogram.cumulative() == [1, 3, 4, 4]
+    assert histogram.quantile(0.5) == pytest.approx(0.15)
+    assert histogram.quantile(1.0) == pytest.approx(0.4)
+
+
+def test_render_prometheus_emits_cumulative_buckets_and_escaped_labels() -> None:
+    metrics = ClientMetrics(buckets=(0.1, 1.0))
+    event = RequestEvent(operation=TicketOperation.SEARCH, method="POST", webservice='My "WS"', request_bytes=10)
+    event.timings.network = 0.5
+    metrics.after_response(event)
+
+    text = metrics.render_prometheus(extra_labels={"instance": "a"})
+
+    labels = 'instance="a",operation="SEARCH",webservice="My \\"WS\\""'
+    assert "# TYPE otrs_gi_request_duration_seconds histogram" in text
+    assert f'otrs_gi_request_duration_seconds_bucket{{{labels},le="0.1"}} 0' in text
+    assert f'otrs_gi_request_duration_seconds_bucket{{{labels},le="1.0"}} 1' in text
+    assert f'otrs_gi_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+    assert f"otrs_gi_request_duration_seconds_count{{{labels}}} 1" in text
+    assert f'otrs_gi_request_bytes_total{{{labels},direction="sent"}} 10' in text
+    assert f"otrs_gi_requests_in_flight{{{labels}}} 0" in text
+    assert text.endswith("\n")
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import calendar
+import math
+import time
+from array import array
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from otrs_gi_core.clients.generic_interface_client import GenericInterfaceClient
+from otrs_gi_core.domain_models.basic_auth_model import BasicAuth
+from otrs_gi_core.domain_models.client_config import ClientConfig
+from otrs_gi_core.domain_models.ticket_models import Article, TicketSearch
+from otrs_gi_core.domain_models.ticket_record import TicketRecord
+from otrs_gi_core.export.columnar import (
+    MISSING_ID,
+    ArticleColumns,
+    TicketColumns,
+    export_parquet,
+    iter_column_chunks,
+)
+from otrs_gi_core.testing import FakeGenericInterface
+from otrs_gi_core.testing.fake_server import DEFAULT_OPERATION_URL_MAP
+
+pytestmark = pytest.mark.unit
+
+
+def make_record(ticket_id: int, **overrides) -> TicketRecord:
+    fields = dict(
+        id=ticket_id,
+        number=f"N{ticket_id}",
+        queue_id=2,
+        queue="Raw",
+        created_at=datetime(2025, 1, 1, 12, 0, 0),
+        dynamic_fields={"Effort": ticket_id * 10},
+        articles=(Article(article_id=ticket_id * 100, subject="S"),),
+    )
+    fields.update(overrides)
+    return TicketRecord(**fields)
+
+
+def test_ticket_columns_use_typed_arrays() -> None:
+    columns = TicketColumns(dynamic_field_names=["Effort"])
+    columns.append(make_record(1))
+    columns.append(make_record(2, queue_id=None, created_at=None))
+
+    data = columns.columns()
+    assert len(columns) == 2
+    assert isinstance(data["id"], array) and data["id"].typecode == "q"
+    assert list(data["queue_id"]) == [2, MISSING_ID]
+    assert data["created_at"][0] == datetime(2025, 1, 1, 12, tzinfo=timezone.utc).timestamp()
+    assert math.isnan(data["created_at"][1])
+    assert data["queue"] == ["Raw", "Raw"]
+    assert data["df_Effort"] == [10, 20]
+
+
+def test_article_columns_flatten_articles() -> None:
+    columns = ArticleColumns()
+    columns.extend_from(make_record(1))
+    columns.extend_from(make_record(2, articles=None))
+
+    assert list(columns.ints["ticket_id"]) == [1]
+    assert list(columns.ints["article_id"]) == [100]
+    assert columns.strs["subject"] == ["S"]
+
+
+async def test_iter_column_chunks_streams_in_chunks() -> None:
+    class FakeClient:
+        def __init__(self) -> None:
+            self.requested: list[tuple[int, bool, int | None]] = []
+
+        async def search_tickets(self, _: TicketSearch) -> list[int]:
+            return [1, 2, 3, 4, 5]
+
+        async def get_ticket_record(
+                self, ticket_id: int, include_articles: bool = False, article_limit: int | None = 5
+        ) -> TicketRecord:
+            self.requested.append((ticket_id, include_articles, article_limit))
+            return make_record(ticket_id)
+
+    client = FakeClient()
+    chunks = [c async for c in iter_column_chunks(client, TicketSearch(), chunk_size=2, include_articles=True)]
+
+    assert [len(c) for c in chunks] == [2, 2, 1]
+    assert [list(c.tickets.ints["id"]) for c in chunks] == [[1, 2], [3, 4], [5]]
+    assert chunks[0].articles is not None and list(chunks[0].articles.ints["article_id"]) == [100, 200]
+    assert all(include and limit is None for _, include, limit in client.requested)
+
+
+async def test_iter_column_chunks_keeps_every_article() -> None:
+    server = FakeGenericInterface()
+    articles = [{"ArticleID": i, "Subject": f"S{i}", "Body": "b"} for i in range(1, 9)]
+    server.store.insert({"TicketID": 1, "Title": "T", "Queue": "Raw", "Article": articles})
+    client = GenericInterfaceClient(
+        ClientConfig(
+            base_url="https://example.org/otrs",
+            webservice_name="FakeWebservice",
+            operation_url_map=DEFAULT_OPERATION_URL_MAP,
+        ),
+        client=httpx.AsyncClient(transport=server.mock_transport()),
+    )
+    client.login(BasicAuth(user_login="agent", password="pw"))
+
+    chunks = [c async for c in iter_column_chunks(client, TicketSearch(), include_articles=True)]
+
+    assert chunks[0].articles is not None
+    assert list(chunks[0].articles.ints["article_id"]) == list(range(1, 9))
+
+
+@pytest.fixture
+def berlin_time(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("TZ", "Europe/Berlin")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.mark.usefixtures("berlin_time")
+def test_naive_timestamps_are_stored_as_utc() -> None:
+    created = datetime(2025, 1, 2, 3, 4, 5)
+    columns = TicketColumns()
+    columns.append(make_record(1, created_at=created))
+
+    assert columns.columns()["created_at"][0] == calendar.timegm(created.timetuple())
+
+
+@pytest.mark.usefixtures("berlin_time")
+def test_arrow_timestamps_keep_the_wall_clock_time() -> None:
+    pytest.importorskip("pyarrow")
+    created = datetime(2025, 1, 2, 3, 4, 5)
+    columns = TicketColumns()
+    columns.append(make_record(1, created_at=created))
+
+    assert columns.to_arrow().column("created_at").to_pylist() == [created]
+
+
+def test_to_numpy_shares_array_buffers() -> None:
+    np = pytest.importorskip("numpy")
+    columns = TicketColumns()
+    columns.append(make_record(7))
+
+    result = columns.to_numpy()
+    assert result["id"].dtype == np.int64
+    assert result["id"].tolist() == [7]
+
+
+def test_to_arrow_marks_missing_values_as_null() -> None:
+    pytest.importorskip("pyarrow")
+    columns = TicketColumns()
+    columns.append(make_record(1, owner_id=None, changed_at=None))
+
+    table = columns.to_arrow()
+    assert table.column("owner_id").null_count == 1
+    assert table.column("changed_at").null_count == 1
+    assert table.column("id").to_pylist() == [1]
+
+
+async def test_export_parquet_writes_schema_for_an_empty_search(tmp_path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    class EmptyClient:
+        async def search_tickets(self, _: TicketSearch) -> list[int]:
+            return []
+
+    tickets_path, articles_path = tmp_path / "tickets.parquet", tmp_path / "articles.parquet"
+    total = await export_parquet(
+        EmptyClient(), TicketSearch(), tickets_path, articles_path=articles_path, dynamic_field_names=["Effort"]
+    )
+
+    assert total == 0
+    assert pq.read_table(tickets_path).num_rows == 0
+    assert "df_Effort" in pq.read_schema(tickets_path).names
+    assert "article_id" in pq.read_schema(articles_path).names
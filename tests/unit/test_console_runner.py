@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import asyncio
+import subprocess
+import threading
+import time
+
+import pytest
+
+from otrs_gi_core.cli import command_runner
+from otrs_gi_core.cli.async_system_console import AsyncSystemConsole
+from otrs_gi_core.cli.command_models import BATCH_PENDING_CODE, TIMEOUT_CODE, CmdResult
+from otrs_gi_core.cli.command_runner import ConsoleCommandRunner
+from otrs_gi_core.cli.system_console import SystemConsole
+from otrs_gi_core.models.base_models import GroupConfig
+
+pytestmark = pytest.mark.unit
+
+FAKE_CONSOLE = """#!/bin/sh
+echo "$1 $*"
+case "$*" in
+  *fail*) echo "cannot $1" >&2; exit 3 ;;
+esac
+printf 'no newline'
+"""
+
+
+@pytest.fixture
+def fake_runner(tmp_path, monkeypatch) -> tuple[ConsoleCommandRunner, list[list[str]]]:
+    console = tmp_path / "otobo.Console.pl"
+    console.write_text(FAKE_CONSOLE)
+    console.chmod(0o755)
+    spawned: list[list[str]] = []
+    real_run = subprocess.run
+
+    def recording_run(cmd, *args, **kwargs):
+        spawned.append(cmd)
+        return real_run(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(command_runner.subprocess, "run", recording_run)
+    return ConsoleCommandRunner.from_local(console_path=str(console)), spawned
+
+
+def test_run_batch_returns_result_per_command(fake_runner) -> None:
+    runner, spawned = fake_runner
+
+    results = runner.run_batch([
+        ("Admin::Group::Add", ["--name", "it's quoted"]),
+        ("Admin::Group::Add", ["--name", "fail"]),
+        ("Admin::Queue::List", []),
+    ])
+
+    assert len(spawned) == 1
+    assert [r.code for r in results] == [0, 3, 0]
+    assert results[0].out.startswith("Admin::Group::Add Admin::Group::Add --name it's quoted")
+    assert results[0].out.endswith("no newline")
+    assert results[0].err == ""
+    assert results[1].err == "cannot Admin::Group::Add"
+    assert results[2].out.startswith("Admin::Queue::List")
+
+
+def test_run_batch_splits_long_batches(fake_runner, monkeypatch) -> None:
+    runner, spawned = fake_runner
+    monkeypatch.setattr(command_runner, "MAX_BATCH_SCRIPT_LENGTH", 1000)
+
+    results = runner.run_batch([("Admin::Group::Add", ["--name", f"g{i}"]) for i in range(20)])
+
+    assert len(spawned) > 1
+    assert all(r.ok for r in results)
+    assert all(f"g{i}" in results[i].out for i in range(20))
+
+
+def test_system_console_batch_fills_results_on_exit(fake_runner) -> None:
+    runner, spawned = fake_runner
+    console = SystemConsole(runner)
+
+    with console.batch() as batch:
+        first = batch.add_group(GroupConfig(name="devops"))
+        second = batch.link_user_to_group("fail", "devops", "rw")
+        assert first.code == BATCH_PENDING_CODE
+        assert spawned == []
+
+    assert len(spawned) == 1
+    assert first.ok and "--name devops" in first.out
+    assert second.code == 3
+
+
+class SlowRunner(ConsoleCommandRunner):
+    def __init__(self) -> None:
+        super().__init__([], "console")
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.commands: list[list[str]] = []
+
+    def run(self, operation: str, args: list[str]) -> CmdResult:
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.commands.append([operation, *args])
+        time.sleep(0.02)
+        with self.lock:
+            self.in_flight -= 1
+        return CmdResult(code=4 if "broken" in args else 0, out=" ".join(args))
+
+
+def test_list_apis_run_concurrently_with_limit() -> None:
+    runner = SlowRunner()
+    console = SystemConsole(runner, max_workers=3)
+
+    result = console.add_groups([GroupConfig(name=f"g{i}") for i in range(8)] + [GroupConfig(name="broken")])
+
+    assert runner.max_in_flight == 3
+    assert len(runner.commands) == 9
+    assert result.code == 4
+    assert result.out.splitlines()[0] == "--no-ansi --name g0"
+
+
+def test_permission_links_join_enclosing_batch_in_order(fake_runner) -> None:
+    runner, spawned = fake_runner
+    console = SystemConsole(runner)
+
+    with console.batch() as batch:
+        batch.add_group(GroupConfig(name="devops"))
+        links = batch.link_user_to_group_with_permissions("agent", "devops", ["read", "full"])
+
+    assert len(spawned) == 1
+    assert links.ok
+    script = spawned[0][-1]
+    assert script.index("Admin::Group::Add") < script.index("--permission ro") < script.index("--permission rw")
+
+
+async def test_run_async_streams_output(fake_runner) -> None:
+    runner, _ = fake_runner
+    seen: list[tuple[str, str]] = []
+
+    result = await runner.run_async("Admin::Group::Add", ["--name", "fail"], on_output=lambda s, l: seen.append((s, l)))
+
+    assert result.code == 3
+    assert ("stderr", "cannot Admin::Group::Add") in seen
+    assert ("stdout", "Admin::Group::Add Admin::Group::Add --name fail") in seen
+
+
+async def test_run_async_timeout_and_cancellation_kill_the_process(tmp_path) -> None:
+    console = tmp_path / "slow.Console.pl"
+    console.write_text("#!/bin/sh\necho started\nexec sleep 30\n")
+    console.chmod(0o755)
+    runner = ConsoleCommandRunner.from_local(console_path=str(console))
+
+    started = time.perf_counter()
+    result = await runner.run_async("Admin::Queue::List", [], timeout=0.2)
+    assert result.code == TIMEOUT_CODE
+    assert result.out == "started"
+    assert "timed out" in result.err
+
+    task = asyncio.create_task(runner.run_async("Admin::Queue::List", []))
+    await asyncio.sleep(0.2)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert time.perf_counter() - started < 5
+
+
+async def test_async_system_console(fake_runner) -> None:
+    runner, _ = fake_runner
+    console = AsyncSystemConsole(runner, max_workers=2)
+
+    group = await console.add_group(GroupConfig(name="devops"))
+    links = await console.link_user_to_group_with_permissions("agent", "devops", ["read", "fail"])
+
+    assert group.ok and "--name devops" in group.out
+    assert links.code == 3
+    assert "--permission ro" in links.out
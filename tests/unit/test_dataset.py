@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import base64
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from otrs_gi_core.clients.generic_interface_client import GenericInterfaceClient
+from otrs_gi_core.domain_models.basic_auth_model import BasicAuth
+from otrs_gi_core.domain_models.client_config import ClientConfig
+from otrs_gi_core.domain_models.ticket_models import IdName, TicketSearch
+from otrs_gi_core.models.ticket_models import WsTicketOutput
+from otrs_gi_core.testing import (
+    DatasetConfig,
+    DatasetGenerator,
+    FakeGenericInterface,
+    generate_raw_tickets,
+    generate_ticket_creates,
+    generate_tickets,
+    write_raw_tickets,
+)
+from otrs_gi_core.testing.fake_server import DEFAULT_OPERATION_URL_MAP
+
+pytestmark = pytest.mark.unit
+
+
+def test_dataset_is_deterministic_and_sliceable() -> None:
+    config = DatasetConfig(tickets=50, seed=7)
+
+    full = list(generate_raw_tickets(config))
+    tail = list(generate_raw_tickets(config, start=40))
+
+    assert full == list(generate_raw_tickets(config))
+    assert full[40:] == tail
+    assert full != list(generate_raw_tickets(DatasetConfig(tickets=50, seed=8)))
+    assert [t["TicketID"] for t in full] == list(range(1, 51))
+    article_ids = [a["ArticleID"] for t in full for a in t["Article"]]
+    assert len(article_ids) == len(set(article_ids))
+
+
+def test_raw_tickets_validate_and_honour_size_settings() -> None:
+    config = DatasetConfig(
+        tickets=200, articles_mean=4, body_size_median=2000, attachment_rate=1.0, attachment_size_median=500,
+    )
+    tickets = list(generate_raw_tickets(config))
+
+    articles = [a for t in tickets for a in t["Article"]]
+    assert 3 < len(articles) / len(tickets) < 5
+    assert 1000 < sorted(len(a["Body"]) for a in articles)[len(articles) // 2] < 4000
+    attachment = articles[0]["Attachment"][0]
+    assert len(base64.b64decode(attachment["Content"])) == attachment["FilesizeRaw"]
+    assert all(WsTicketOutput.model_validate(t).TicketID for t in tickets[:20])
+    assert {t["State"] for t in tickets} >= {"closed successful", "open", "new"}
+
+
+def test_domain_objects_match_raw_tickets(tmp_path: Path) -> None:
+    config = DatasetConfig(tickets=5, seed=3)
+    raw = list(generate_raw_tickets(config))
+
+    tickets = list(generate_tickets(config))
+    creates = list(generate_ticket_creates(config))
+    written = write_raw_tickets(tmp_path / "tickets.ndjson", config)
+
+    assert [t.title for t in tickets] == [t["Title"] for t in raw] == [c.title for c in creates]
+    assert tickets[0].queue == IdName(id=raw[0]["QueueID"], name=raw[0]["Queue"])
+    assert creates[0].article.body == raw[0]["Article"][0]["Body"]
+    assert written == 5
+    assert [json.loads(line) for line in (tmp_path / "tickets.ndjson").read_text().splitlines()] == raw
+
+
+async def test_fake_server_serves_a_generated_dataset() -> None:
+    config = DatasetConfig(tickets=300, seed=1)
+    server = FakeGenericInterface()
+    server.store.insert_many(generate_raw_tickets(config))
+    client = GenericInterfaceClient(
+        ClientConfig(
+            base_url=server.base_url(),
+            webservice_name=server.webservice_name,
+            operation_url_map=DEFAULT_OPERATION_URL_MAP,
+        ),
+        client=httpx.AsyncClient(transport=server.mock_transport()),
+    )
+    client.login(BasicAuth(user_login="agent", password="pw"))
+
+    ids = await client.search_tickets(TicketSearch(queues=[IdName(name="Raw")], limit=1000))
+    ticket = await client.get_ticket(ids[0])
+
+    expected = [t["TicketID"] for t in generate_raw_tickets(config) if t["Queue"] == "Raw"]
+    assert ids == sorted(expected, reverse=True)
+    assert ticket.title == DatasetGenerator(config).ticket(ids[0] - 1)["Title"]
@@ -0,0 +1,100 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from otrs_gi_core.domain_models.dynamic_fields import (
+    DynamicFieldConverter,
+    DynamicFieldSchema,
+    DynamicFieldType,
+)
+from otrs_gi_core.domain_models.ticket_models import TicketCreate, TicketUpdate
+from otrs_gi_core.mappers import from_ws_ticket_detail, to_ws_ticket_create, to_ws_ticket_update
+from otrs_gi_core.models.ticket_models import WsDynamicField, WsTicketOutput
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def schema() -> DynamicFieldSchema:
+    return DynamicFieldSchema(
+        {
+            "DueDate": DynamicFieldType.DATE,
+            "ResolvedAt": DynamicFieldType.DATETIME,
+            "Effort": DynamicFieldType.INTEGER,
+            "Cost": DynamicFieldType.DECIMAL,
+            "Tags": DynamicFieldType.MULTISELECT,
+            "Urgent": DynamicFieldType.CHECKBOX,
+        }
+    )
+
+
+def test_decode_native_values(schema: DynamicFieldSchema) -> None:
+    assert schema.decode("DueDate", "2025-03-01 00:00:00") == date(2025, 3, 1)
+    assert schema.decode("ResolvedAt", "2025-03-01 12:30:00") == datetime(2025, 3, 1, 12, 30)
+    assert schema.decode("Effort", "42") == 42
+    assert schema.decode("Cost", "12.50") == Decimal("12.50")
+    assert schema.decode("Tags", ["a", "b"]) == ["a", "b"]
+    assert schema.decode("Tags", "a") == ["a"]
+    assert schema.decode("Urgent", "1") is True
+    assert schema.decode("Urgent", "0") is False
+    assert schema.decode("Effort", None) is None
+
+
+def test_unregistered_fields_pass_through(schema: DynamicFieldSchema) -> None:
+    assert schema.decode("Unknown", "raw") == "raw"
+    assert schema.encode("Unknown", 5) == "5"
+
+
+def test_decode_failure_keeps_raw_value(schema: DynamicFieldSchema) -> None:
+    assert schema.decode("Effort", "not-a-number") == "not-a-number"
+
+
+def test_encode_native_values(schema: DynamicFieldSchema) -> None:
+    assert schema.encode("DueDate", date(2025, 3, 1)) == "2025-03-01"
+    assert schema.encode("ResolvedAt", datetime(2025, 3, 1, 12, 30)) == "2025-03-01 12:30:00"
+    assert schema.encode("Tags", ("a", "b")) == ["a", "b"]
+    assert schema.encode("Urgent", True) == "1"
+
+
+def test_custom_converter_registration() -> None:
+    schema = DynamicFieldSchema().register(
+        "Score",
+        DynamicFieldConverter(decode=lambda v: float(v) * 10, encode=lambda v: str(v / 10)),
+    )
+    assert "Score" in schema
+    assert schema.decode("Score", "0.5") == 5.0
+    assert schema.encode("Score", 5.0) == "0.5"
+
+
+def test_from_ws_ticket_detail_decodes_dynamic_fields(schema: DynamicFieldSchema) -> None:
+    wire = WsTicketOutput(
+        TicketID=1,
+        DynamicField=[
+            WsDynamicField(Name="Effort", Value="3"),
+            WsDynamicField(Name="Tags", Value=["x", "y"]),
+            WsDynamicField(Name="Free", Value="text"),
+        ],
+    )
+
+    ticket = from_ws_ticket_detail(wire, schema)
+    assert ticket.dynamic_fields == {"Effort": 3, "Tags": ["x", "y"], "Free": "text"}
+
+    raw_ticket = from_ws_ticket_detail(wire)
+    assert raw_ticket.dynamic_fields["Effort"] == "3"
+
+
+def test_create_and_update_encode_dynamic_fields(schema: DynamicFieldSchema) -> None:
+    create = to_ws_ticket_create(
+        TicketCreate(title="T", dynamic_fields={"DueDate": date(2025, 1, 2), "Urgent": False}),
+        schema,
+    )
+    assert create.DynamicField == [
+        WsDynamicField(Name="DueDate", Value="2025-01-02"),
+        WsDynamicField(Name="Urgent", Value="0"),
+    ]
+
+    update = to_ws_ticket_update(TicketUpdate(id=1, dynamic_fields={"Effort": 7}), schema)
+    assert update.DynamicField == [WsDynamicField(Name="Effort", Value="7")]
+
+    assert to_ws_ticket_create(TicketCreate(title="T")).DynamicField is None
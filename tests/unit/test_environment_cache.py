@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from otrs_gi_core.cli import environment_cache
+from otrs_gi_core.cli.app_factory import create_cli_app
+from otrs_gi_core.cli.environment_cache import EnvironmentCache, detect_with_cache
+from otrs_gi_core.cli.environments import DockerSystem, LocalSystem
+
+pytestmark = pytest.mark.unit
+
+
+class CountingDetector:
+    def __init__(self, system) -> None:
+        self.system = system
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.system
+
+
+@pytest.fixture
+def running_containers(monkeypatch) -> dict[str, str]:
+    containers = {"otobo-web-1": "abc123"}
+    monkeypatch.setattr(
+        environment_cache,
+        "_inspect_container",
+        lambda name: (containers[name], True) if name in containers else None,
+    )
+    return containers
+
+
+def docker_system() -> DockerSystem:
+    return DockerSystem(
+        container_name="otobo-web-1",
+        console_path="/opt/otobo/bin/otobo.Console.pl",
+        webservices_dir=Path("/opt/otobo/var/webservices"),
+    )
+
+
+def test_docker_detection_is_reused_while_container_runs(tmp_path, running_containers) -> None:
+    cache = EnvironmentCache(tmp_path / "env.json", host="jump-host")
+    detect = CountingDetector(docker_system())
+
+    first = detect_with_cache(detect, "OTOBO", cache)
+    second = detect_with_cache(detect, "OTOBO", cache)
+
+    assert detect.calls == 1
+    assert second == first
+    assert EnvironmentCache(tmp_path / "env.json", host="other-host").load("OTOBO") is None
+
+    running_containers["otobo-web-1"] = "recreated"
+    detect_with_cache(detect, "OTOBO", cache)
+    assert detect.calls == 2
+
+    detect_with_cache(detect, "OTOBO", cache, refresh=True)
+    assert detect.calls == 3
+
+
+def test_local_system_is_invalidated_when_paths_disappear(tmp_path) -> None:
+    console = tmp_path / "otobo.Console.pl"
+    console.touch()
+    system = LocalSystem(console_path=str(console), webservices_dir=tmp_path)
+    cache = EnvironmentCache(tmp_path / "env.json", host="h")
+    cache.store("OTOBO", system)
+
+    assert cache.load("OTOBO") == system
+    console.unlink()
+    assert cache.load("OTOBO") is None
+
+
+@pytest.mark.parametrize("content", ["[]", '{"version": 1, "entries": []}', '{"version": 1}'])
+def test_malformed_cache_file_is_ignored(tmp_path, content: str) -> None:
+    path = tmp_path / "env.json"
+    path.write_text(content, encoding="utf-8")
+
+    assert EnvironmentCache(path, host="h").load("OTOBO") is None
+
+
+def test_cli_uses_cache_and_refresh_option(tmp_path, monkeypatch, running_containers) -> None:
+    monkeypatch.setenv("OTOBO_ENVIRONMENT_CACHE", str(tmp_path / "env.json"))
+    monkeypatch.setattr("otrs_gi_core.cli.system_console.SystemConsole.add_group", lambda self, group: _ok())
+    detect = CountingDetector(docker_system())
+    app = create_cli_app(product_label="OTOBO", detect_environment=detect)
+    runner = CliRunner()
+
+    for args in (["add-group", "a"], ["add-group", "b"], ["--refresh-environment", "add-group", "c"]):
+        result = runner.invoke(app, args)
+        assert result.exit_code == 0, result.output
+
+    assert detect.calls == 2
+
+
+def _ok():
+    from otrs_gi_core.cli.command_models import CmdResult
+
+    return CmdResult(code=0, out="ok")
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from time import perf_counter
+
+import httpx
+import pytest
+
+from otrs_gi_core.clients.generic_interface_client import GenericInterfaceClient
+from otrs_gi_core.domain_models.basic_auth_model import BasicAuth
+from otrs_gi_core.domain_models.client_config import ClientConfig
+from otrs_gi_core.domain_models.ticket_models import (
+    Article,
+    IdName,
+    TicketCreate,
+    TicketSearch,
+    TicketUpdate,
+)
+from otrs_gi_core.domain_models.ticket_operation import TicketOperation
+from otrs_gi_core.testing import FakeGenericInterface, FaultInjection, fixed_latency
+from otrs_gi_core.testing.fake_server import DEFAULT_OPERATION_URL_MAP
+from otrs_gi_core.util.errors import GenericInterfaceError
+
+pytestmark = pytest.mark.unit
+
+
+def make_client(
+        server: FakeGenericInterface,
+        transport: httpx.AsyncBaseTransport,
+        base_url: str = "",
+) -> GenericInterfaceClient:
+    config = ClientConfig(
+        base_url=base_url or server.base_url(),
+        webservice_name=server.webservice_name,
+        operation_url_map=DEFAULT_OPERATION_URL_MAP,
+    )
+    client = GenericInterfaceClient(config, client=httpx.AsyncClient(transport=transport))
+    client.login(BasicAuth(user_login="agent", password="secret"))
+    return client
+
+
+def new_ticket(title: str, queue: str = "Raw", **kwargs) -> TicketCreate:
+    return TicketCreate(
+        title=title,
+        queue=IdName(name=queue),
+        state=IdName(name="new"),
+        priority=IdName(name="3 normal"),
+        article=Article(subject=title, body="body"),
+        **kwargs,
+    )
+
+
+async def test_client_round_trip_against_fake_server() -> None:
+    server = FakeGenericInterface()
+    client = make_client(server, server.mock_transport())
+
+    first = await client.create_ticket(new_ticket("Printer broken", dynamic_fields={"Team": "ops"}))
+    await client.create_ticket(new_ticket("VPN down", queue="Misc"))
+    updated = await client.update_ticket(
+        TicketUpdate(id=first.id, state=IdName(name="open"), article=Article(subject="note", body="on it"))
+    )
+    fetched = await client.get_ticket(first.id)
+
+    assert updated.state == IdName(id=4, name="open")
+    assert fetched.queue == IdName(id=2, name="Raw")
+    assert [a.subject for a in fetched.articles] == ["Printer broken", "note"]
+    assert fetched.dynamic_fields == {"Team": "ops"}
+    assert await client.search_tickets(TicketSearch(queues=[IdName(name="Misc")])) == [first.id + 1]
+    assert await client.search_tickets(TicketSearch(titles=["printer%"])) == [first.id]
+    assert server.store.search({"DynamicField_Team": {"Equals": "ops"}}) == {"TicketID": [str(first.id)]}
+    assert server.request_counts == {"TicketCreate": 2, "TicketUpdate": 1, "TicketGet": 1, "TicketSearch": 2}
+
+
+async def test_unknown_ticket_and_wrong_password_return_generic_interface_errors() -> None:
+    server = FakeGenericInterface(users={"agent": "other"})
+    client = make_client(server, server.mock_transport())
+    with pytest.raises(GenericInterfaceError) as auth:
+        await client.get_ticket(1)
+
+    server.users = None
+    with pytest.raises(GenericInterfaceError) as missing:
+        await client.get_ticket(1)
+
+    assert auth.value.code == "TicketGet.AuthFail"
+    assert missing.value.code == "TicketGet.AccessDenied"
+
+
+async def test_faults_latency_and_max_length() -> None:
+    server = FakeGenericInterface(
+        latency={TicketOperation.SEARCH: fixed_latency(0.02)},
+        faults=(
+            FaultInjection(rate=1.0, operations=(TicketOperation.GET,)),
+            FaultInjection(rate=1.0, operations=(TicketOperation.UPDATE,), status_code=503),
+        ),
+        max_length=300,
+        seed=1,
+    )
+    client = make_client(server, server.mock_transport())
+
+    started = perf_counter()
+    assert await client.search_tickets(TicketSearch()) == []
+    assert perf_counter() - started >= 0.02
+    with pytest.raises(GenericInterfaceError, match="TicketGet.InjectedFault"):
+        await client.get_ticket(1)
+    with pytest.raises(json.JSONDecodeError):
+        await client.update_ticket(TicketUpdate(id=1, title="x"))
+    with pytest.raises(json.JSONDecodeError):
+        await client.create_ticket(new_ticket("x" * 400))
+
+
+async def test_asgi_transport_and_standalone_server_serve_the_same_app() -> None:
+    server = FakeGenericInterface()
+    asgi_client = make_client(server, httpx.ASGITransport(app=server))
+    ticket = await asgi_client.create_ticket(new_ticket("via ASGI"))
+
+    http_server = await server.start_server()
+    host, port = http_server.sockets[0].getsockname()[:2]
+    try:
+        async with make_client(server, httpx.AsyncHTTPTransport(), server.base_url(f"http://{host}:{port}")) as client:
+            results = await asyncio.gather(*(client.get_ticket(ticket.id) for _ in range(5)))
+    finally:
+        http_server.close()
+        await http_server.wait_closed()
+
+    assert {t.title for t in results} == {"via ASGI"}
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+HEAVY_MODULES = (
+    "yaml",
+    "zxcvbn",
+    "typer",
+    "otrs_gi_core.setup.bootstrap",
+    "otrs_gi_core.setup.webservices.builder",
+    "otrs_gi_core.cli.system_console",
+)
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "elapsed": elapsed,
+    "modules": len(sys.modules),
+    "loaded": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+
+def run_probe(statement: str) -> dict:
+    code = _PROBE.format(statement=statement, heavy=HEAVY_MODULES)
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "from otobo import OTOBOClient, TicketCreate",
+        "from znuny import ZnunyClient, TicketSearch",
+        "from otrs_gi_core import GenericInterfaceClient, BasicAuth",
+    ],
+)
+def test_client_import_does_not_load_setup_stack(statement: str) -> None:
+    assert run_probe(statement)["loaded"] == []
+
+
+@pytest.mark.parametrize("package", ["otobo", "znuny", "otrs_gi_core"])
+def test_every_public_name_resolves(package: str) -> None:
+    module = __import__(package)
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+    assert set(module.__all__) <= set(dir(module))
+    with pytest.raises(AttributeError):
+        getattr(module, "does_not_exist")
+
+
+def test_lazy_client_import_loads_fewer_modules_than_eager_import() -> None:
+    lazy = run_probe("from otobo import OTOBOClient")
+    eager = run_probe("import otobo\nfor name in otobo.__all__: getattr(otobo, name)")
+    assert lazy["modules"] < eager["modules"]
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from otrs_gi_core.domain_models.ticket_operation import TicketOperation
+from otrs_gi_core.loadtest import (
+    LoadTest,
+    LoadTestConfig,
+    build_fake_client,
+    parse_levels,
+    parse_mix,
+    percentile,
+    run_load_test,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def test_parse_mix_and_levels() -> None:
+    assert parse_mix("get=3, search=1,create") == {
+        TicketOperation.GET: 3,
+        TicketOperation.SEARCH: 1,
+        TicketOperation.CREATE: 1,
+    }
+    assert parse_levels("1,4,16") == [1, 4, 16]
+    with pytest.raises(ValueError, match="Unknown operation 'delete'"):
+        parse_mix("delete=1")
+    with pytest.raises(ValueError):
+        parse_mix("get=0")
+    with pytest.raises(ValueError):
+        parse_levels("0,2")
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    values = [float(v) for v in range(1, 101)]
+    assert [percentile(values, p) for p in (50, 99, 100)] == [50.0, 99.0, 100.0]
+    assert math.isnan(percentile([], 50))
+
+
+async def test_sweep_reports_every_level_with_errors_and_created_ids() -> None:
+    client = build_fake_client(tickets=0, error_rate=0.2, seed=3)
+    config = LoadTestConfig(
+        mix={TicketOperation.GET: 2, TicketOperation.CREATE: 1, TicketOperation.UPDATE: 1},
+        duration=0.2,
+        warmup=0.05,
+        seed=3,
+    )
+    seen = []
+
+    reports = await run_load_test(client, [1, 4], config, on_level=seen.append)
+
+    assert [r.concurrency for r in reports] == [1, 4] and seen == reports
+    for report in reports:
+        assert report.requests == sum(report.operations.values()) > 0
+        assert 0 < report.errors == sum(report.error_kinds.values()) < report.requests
+        assert report.latency_ms["p50"] <= report.latency_ms["p99"] <= report.latency_ms["max"]
+    assert set(reports[0].operations) == {"get", "create", "update"}
+    assert any(kind.endswith(".InjectedFault") for kind in reports[1].error_kinds)
+
+
+async def test_get_and_update_create_a_ticket_when_the_target_is_empty() -> None:
+    client = build_fake_client(tickets=0)
+    async with client:
+        load_test = LoadTest(client, LoadTestConfig(seed=1))
+        await load_test.prepare()
+        await load_test._update()
+
+    assert load_test.ticket_ids == [1]
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import tracemalloc
+
+import httpx
+import pytest
+
+from otrs_gi_core.clients.generic_interface_client import GenericInterfaceClient
+from otrs_gi_core.clients.hooks import RequestEvent, RequestHook
+from otrs_gi_core.clients.memory_profiling import MemoryProfiler
+from otrs_gi_core.domain_models.basic_auth_model import BasicAuth
+from otrs_gi_core.domain_models.client_config import ClientConfig
+from otrs_gi_core.domain_models.ticket_models import TicketSearch
+from otrs_gi_core.testing import FakeGenericInterface
+from otrs_gi_core.testing.dataset import DatasetConfig, generate_raw_tickets
+from otrs_gi_core.testing.fake_server import DEFAULT_OPERATION_URL_MAP
+
+pytestmark = pytest.mark.unit
+
+
+class RecordingHook(RequestHook):
+    def __init__(self) -> None:
+        self.events: list[RequestEvent] = []
+
+    def after_response(self, event: RequestEvent) -> None:
+        self.events.append(event)
+
+
+def make_client(*hooks: RequestHook) -> GenericInterfaceClient:
+    server = FakeGenericInterface()
+    server.store.insert_many(generate_raw_tickets(DatasetConfig(tickets=4, seed=7, articles_mean=4.0)))
+    config = ClientConfig(
+        base_url=server.base_url(),
+        webservice_name=server.webservice_name,
+        operation_url_map=DEFAULT_OPERATION_URL_MAP,
+    )
+    client = GenericInterfaceClient(
+        config, client=httpx.AsyncClient(transport=server.mock_transport()), hooks=hooks
+    )
+    client.login(BasicAuth(user_login="agent", password="pw"))
+    return client
+
+
+async def test_profiler_reports_bytes_per_stage_for_search_and_get() -> None:
+    profiler = MemoryProfiler()
+    recorder = RecordingHook()
+    client = make_client(profiler, recorder)
+
+    with profiler:
+        tickets = await client.search_and_get(TicketSearch())
+    report = profiler.report()
+
+    assert not tracemalloc.is_tracing()
+    assert len(tickets) == 4
+    get = report.operations["TicketGet"]
+    assert get.calls == 4 and report.operations["TicketSearch"].calls == 1
+    assert get.raw_json > 0 and get.ws_models > 0 and get.peak > 0
+    assert 0 < get.articles
+    assert report.traced_peak > 0 and report.failed_calls == 0
+    assert all(event.memory is not None for event in recorder.events)
+    assert "TicketGet" in report.format()
+
+
+async def test_calls_are_not_profiled_unless_tracing_and_sampled() -> None:
+    profiler = MemoryProfiler(sample_rate=0.0)
+    recorder = RecordingHook()
+    client = make_client(profiler, recorder)
+
+    await client.search_and_get(TicketSearch())
+    with profiler:
+        await client.search_and_get(TicketSearch())
+
+    assert profiler.report().operations == {}
+    assert [event.memory for event in recorder.events] == [None] * 10
+
+
+async def test_tracing_started_elsewhere_is_left_running() -> None:
+    profiler = MemoryProfiler(article_breakdown=False)
+    client = make_client(profiler)
+    tracemalloc.start()
+    try:
+        with profiler:
+            await client.search_and_get(TicketSearch())
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+    assert profiler.report().operations["TicketGet"].articles == 0
+
+
+async def test_traced_peak_survives_the_per_stage_peak_resets() -> None:
+    profiler = MemoryProfiler()
+    client = make_client(profiler)
+
+    with profiler:
+        transient = bytearray(4 << 20)
+        del transient
+        await client.search_and_get(TicketSearch())
+        current = tracemalloc.get_traced_memory()[0]
+    report = profiler.report()
+
+    assert report.traced_peak >= 4 << 20 > current
+    assert "net bytes" in report.format()
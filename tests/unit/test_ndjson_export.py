@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+
+import httpx
+import pytest
+from typer.testing import CliRunner
+
+from otrs_gi_core.cli.app_factory import create_cli_app
+from otrs_gi_core.clients.generic_interface_client import GenericInterfaceClient
+from otrs_gi_core.domain_models.basic_auth_model import BasicAuth
+from otrs_gi_core.domain_models.client_config import ClientConfig
+from otrs_gi_core.domain_models.ticket_models import Ticket, TicketSearch
+from otrs_gi_core.export.ndjson import export_ndjson, prepare_resume
+from otrs_gi_core.testing import FakeGenericInterface
+from otrs_gi_core.testing.fake_server import DEFAULT_OPERATION_URL_MAP
+
+pytestmark = pytest.mark.unit
+
+
+class FakeClient:
+    instances: list[FakeClient] = []
+
+    def __init__(self, config=None, ids=(1, 2, 3, 4, 5), failing=()) -> None:
+        self.config = config
+        self.ids = list(ids)
+        self.failing = set(failing)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.searches: list[TicketSearch] = []
+        FakeClient.instances.append(self)
+
+    def login(self, auth) -> None:
+        self.auth = auth
+
+    async def __aenter__(self) -> FakeClient:
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    async def search_tickets(self, ticket_search: TicketSearch) -> list[int]:
+        self.searches.append(ticket_search)
+        return self.ids
+
+    async def get_ticket(self, ticket_id: int, article_limit: int | None = 5) -> Ticket:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        if ticket_id in self.failing:
+            raise RuntimeError("boom")
+        return Ticket(id=ticket_id, title=f"T{ticket_id}")
+
+
+async def test_export_ndjson_bounds_concurrency_and_skips_ids() -> None:
+    client = FakeClient(ids=range(1, 21))
+    out = io.StringIO()
+
+    written = await export_ndjson(client, TicketSearch(), out, concurrency=3, skip_ids={2, 4})
+
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert written == 18
+    assert sorted(line["id"] for line in lines) == [i for i in range(1, 21) if i not in (2, 4)]
+    assert client.max_in_flight <= 3
+
+
+async def test_export_ndjson_reports_errors_and_continues() -> None:
+    client = FakeClient(failing={3})
+    failures: list[int] = []
+
+    written = await export_ndjson(client, TicketSearch(), io.StringIO(), on_error=lambda i, _: failures.append(i))
+
+    assert written == 4
+    assert failures == [3]
+
+
+async def test_export_ndjson_keeps_every_article() -> None:
+    server = FakeGenericInterface()
+    articles = [{"ArticleID": i, "Subject": f"S{i}", "Body": "b"} for i in range(1, 9)]
+    server.store.insert({"TicketID": 1, "Title": "T", "Queue": "Raw", "Article": articles})
+    client = GenericInterfaceClient(
+        ClientConfig(
+            base_url="https://example.org/otrs",
+            webservice_name="FakeWebservice",
+            operation_url_map=DEFAULT_OPERATION_URL_MAP,
+        ),
+        client=httpx.AsyncClient(transport=server.mock_transport()),
+    )
+    client.login(BasicAuth(user_login="agent", password="pw"))
+    out = io.StringIO()
+
+    assert await export_ndjson(client, TicketSearch(), out) == 1
+    [line] = out.getvalue().splitlines()
+    assert [a["article_id"] for a in json.loads(line)["articles"]] == list(range(1, 9))
+
+
+def test_prepare_resume_truncates_partial_line(tmp_path) -> None:
+    path = tmp_path / "export.ndjson"
+    path.write_text('{"id": 1}\n{"id": 2}\n{"id": 3, "tit', encoding="utf-8")
+
+    assert prepare_resume(path) == {1, 2}
+    assert path.read_text(encoding="utf-8") == '{"id": 1}\n{"id": 2}\n'
+    assert prepare_resume(tmp_path / "missing.ndjson") == set()
+
+
+def test_export_tickets_command_resumes(tmp_path, monkeypatch) -> None:
+    FakeClient.instances.clear()
+    monkeypatch.setattr("otrs_gi_core.clients.generic_interface_client.GenericInterfaceClient", FakeClient)
+    app = create_cli_app(product_label="OTOBO", detect_environment=lambda: None)
+    output = tmp_path / "tickets.ndjson"
+    output.write_text('{"id": 1}\n{"id": 2}\n', encoding="utf-8")
+
+    result = CliRunner().invoke(
+        app,
+        [
+            "export-tickets", "--base-url", "https://example.org", "--webservice", "WS",
+            "--user", "agent", "--password", "secret", "--queue", "Raw",
+            "--output", str(output), "--resume",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    ids = [json.loads(line)["id"] for line in output.read_text(encoding="utf-8").splitlines()]
+    assert ids[:2] == [1, 2]
+    assert sorted(ids[2:]) == [3, 4, 5]
+    search = FakeClient.instances[0].searches[0]
+    assert [q.name for q in search.queues or []] == ["Raw"]
@@ -135,7 +135,7 @@ async def test_create_ticket_uses_mappers(monkeypatch: pytest.MonkeyPatch) -> No
             captured["dump_args"] = (exclude_none, by_alias)
             return request_dump
 
-    def fake_build_request(arg: TicketCreate) -> DummyRequest:
+    def fake_build_request(arg: TicketCreate, dynamic_field_schema: Any = None) -> DummyRequest:
         captured["request_arg"] = arg
         return DummyRequest()
 
@@ -153,7 +153,7 @@ async def test_create_ticket_uses_mappers(monkeypatch: pytest.MonkeyPatch) -> No
 
     parsed_ticket = object()
 
-    def fake_parse(arg: Any) -> Any:
+    def fake_parse(arg: Any, *_: Any, **__: Any) -> Any:
         captured["parsed_arg"] = arg
         return parsed_ticket
 
@@ -207,7 +207,7 @@ async def test_get_ticket_returns_parsed_ticket(monkeypatch: pytest.MonkeyPatch)
 
     monkeypatch.setattr(
         "otrs_gi_core.clients.generic_interface_client.to_ws_ticket_get",
-        lambda ticket_id: DummyRequest(),
+        lambda ticket_id, **_: DummyRequest(),
     )
 
     response_payload = {"TicketID": 42}
@@ -221,7 +221,7 @@ async def test_get_ticket_returns_parsed_ticket(monkeypatch: pytest.MonkeyPatch)
     parsed_ticket = object()
     captured: dict[str, Any] = {}
 
-    def fake_parse(arg: Any) -> Any:
+    def fake_parse(arg: Any, *_: Any, **__: Any) -> Any:
         captured["arg"] = arg
         return parsed_ticket
 
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+from typer.testing import CliRunner
+
+from otrs_gi_core.cli.app_factory import create_cli_app
+from otrs_gi_core.cli.command_models import CmdResult
+from otrs_gi_core.cli.command_runner import ConsoleCommandRunner
+from otrs_gi_core.cli.system_console import SystemConsole
+from otrs_gi_core.setup.provisioning import (
+    ExistingObjects,
+    ProvisioningManifest,
+    build_steps,
+    execute_manifest,
+    fetch_existing,
+    plan_provisioning,
+)
+
+pytestmark = pytest.mark.unit
+
+MANIFEST = """
+groups:
+  - name: tenant-a
+  - name: tenant-b
+    comment: second tenant
+queues:
+  - name: A::Support
+    group: tenant-a
+  - name: B::Support
+    group: tenant-b
+users:
+  - user_name: alice
+    email: alice@example.org
+    password: correct horse battery staple
+    groups: [tenant-a]
+links:
+  - user: alice
+    group: tenant-b
+    permissions: [read, full]
+  - user: bob
+    group: users
+"""
+
+
+class RecordingConsole:
+    def __init__(self, failing: set[str] = frozenset()) -> None:
+        self.failing = failing
+        self.lock = threading.Lock()
+        self.events: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _run(self, event: str) -> CmdResult:
+        with self.lock:
+            self.events.append(event)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.02)
+        with self.lock:
+            self.in_flight -= 1
+        return CmdResult(code=1, err=f"{event} failed") if event in self.failing else CmdResult()
+
+    def add_group(self, group) -> CmdResult:
+        return self._run(f"group:{group.name}")
+
+    def add_queue(self, queue) -> CmdResult:
+        return self._run(f"queue:{queue.name}")
+
+    def add_user(self, user) -> CmdResult:
+        return self._run(f"user:{user.user_name}")
+
+    def link_user_to_group_with_permissions(self, user_name, group_name, permissions, max_workers=None) -> CmdResult:
+        return self._run(f"link:{user_name}:{group_name}")
+
+
+@pytest.fixture
+def manifest(tmp_path) -> ProvisioningManifest:
+    path = tmp_path / "tenant.yml"
+    path.write_text(MANIFEST, encoding="utf-8")
+    return ProvisioningManifest.from_yaml(path)
+
+
+def test_dependencies_only_reference_manifest_entries(manifest) -> None:
+    steps = build_steps(manifest)
+
+    assert steps["queue:A::Support"].depends_on == {"group:tenant-a"}
+    assert steps["user:alice"].depends_on == {"group:tenant-a"}
+    assert steps["link:alice:tenant-b"].depends_on == {"group:tenant-b", "user:alice"}
+    assert steps["link:bob:users"].depends_on == frozenset()
+
+
+def test_execute_runs_in_dependency_order_and_in_parallel(manifest) -> None:
+    console = RecordingConsole()
+
+    report = execute_manifest(console, manifest, max_workers=4)
+
+    assert report.ok and len(report.outcomes) == 7
+    assert console.max_in_flight > 1
+    order = console.events.index
+    assert order("group:tenant-a") < order("queue:A::Support")
+    assert order("group:tenant-a") < order("user:alice") < order("link:alice:tenant-b")
+    assert order("group:tenant-b") < order("link:alice:tenant-b")
+
+
+def test_failed_step_skips_dependents_only(manifest) -> None:
+    console = RecordingConsole(failing={"group:tenant-b"})
+
+    report = execute_manifest(console, manifest)
+
+    assert {o.step.key for o in report.with_status("failed")} == {"group:tenant-b"}
+    assert {o.step.key for o in report.with_status("skipped")} == {"queue:B::Support", "link:alice:tenant-b"}
+    assert "queue:B::Support" not in console.events
+    assert report.outcomes["user:alice"].status == "ok"
+
+
+class CountingRunner(ConsoleCommandRunner):
+    def __init__(self) -> None:
+        super().__init__([], "otobo.Console.pl")
+        self.counter = RecordingConsole()
+
+    def run(self, operation: str, args: list[str]) -> CmdResult:
+        return self.counter._run(operation)
+
+
+def test_max_workers_bounds_console_processes_across_link_permissions(tmp_path) -> None:
+    path = tmp_path / "links.yml"
+    path.write_text(
+        "links:\n"
+        + "".join(f"  - {{user: u{i}, group: users, permissions: [read, create, full]}}\n" for i in range(4)),
+        encoding="utf-8",
+    )
+    runner = CountingRunner()
+
+    report = execute_manifest(SystemConsole(runner), ProvisioningManifest.from_yaml(path), max_workers=2)
+
+    assert len(runner.counter.events) == 12
+    assert all(o.status == "ok" for o in report.outcomes.values())
+    assert runner.counter.max_in_flight <= 2
+
+
+def test_provision_command_reports_each_item(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "tenant.yml"
+    path.write_text(MANIFEST, encoding="utf-8")
+    console = RecordingConsole(failing={"link:bob:users"})
+    monkeypatch.setenv("OTOBO_ENVIRONMENT_CACHE", "off")
+    monkeypatch.setattr("otrs_gi_core.cli.system_console.SystemConsole", lambda runner: console)
+    app = create_cli_app(product_label="OTOBO", detect_environment=lambda: _StubSystem())
+
+    result = CliRunner().invoke(app, ["provision", str(path), "--force"])
+
+    assert result.exit_code == 1
+    assert "6 succeeded, 1 failed, 0 skipped, 0 already existed." in result.stdout
+    assert "link:bob:users (link:bob:users failed)" in result.stderr
+
+
+class ListingRunner:
+    outputs = {
+        "Admin::User::List": CmdResult(out="Listing users...\n  alice\n  root@localhost\nDone."),
+        "Admin::Group::List": CmdResult(out="| ID | Name | Valid |\n| 1 | users | 1 |\n| 7 | tenant-a | 1 |"),
+        "Admin::Queue::List": CmdResult(out="Listing all queues...\nRaw\nA::Support\nDone."),
+        "Admin::WebService::List": CmdResult(code=1, err="Unknown command"),
+    }
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    def run_batch(self, commands) -> list[CmdResult]:
+        commands = list(commands)
+        self.batches.append([operation for operation, _ in commands])
+        return [self.outputs[operation] for operation, _ in commands]
+
+
+def test_fetch_existing_lists_everything_in_one_batch() -> None:
+    runner = ListingRunner()
+
+    existing = fetch_existing(SystemConsole(runner))
+
+    assert len(runner.batches) == 1
+    assert existing.users == {"alice", "root@localhost"}
+    assert existing.groups == {"users", "tenant-a"}
+    assert existing.queues == {"Raw", "A::Support"}
+    assert existing.webservices is None
+
+
+def test_plan_skips_existing_objects_and_keeps_links(manifest) -> None:
+    existing = ExistingObjects(users={"alice"}, groups={"tenant-a"}, queues={"A::Support"})
+
+    plan = plan_provisioning(manifest, existing)
+    steps = build_steps(plan.manifest)
+
+    assert sorted(plan.existing) == ["group:tenant-a", "queue:A::Support", "user:alice"]
+    assert sorted(steps) == ["group:tenant-b", "link:alice:tenant-b", "link:bob:users", "queue:B::Support"]
+    assert steps["link:alice:tenant-b"].depends_on == {"group:tenant-b"}
+    assert len(manifest.groups) == 2
+
+
+class _StubSystem:
+    def build_command_runner(self) -> None:
+        return None
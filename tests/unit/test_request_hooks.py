@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+import time
+
+import httpx
+import pytest
+
+from otrs_gi_core.clients import generic_interface_client
+from otrs_gi_core.clients.generic_interface_client import GenericInterfaceClient
+from otrs_gi_core.clients.hooks import RequestEvent, RequestHook
+from otrs_gi_core.domain_models.basic_auth_model import BasicAuth
+from otrs_gi_core.domain_models.client_config import ClientConfig
+from otrs_gi_core.domain_models.ticket_models import TicketSearch
+from otrs_gi_core.domain_models.ticket_operation import TicketOperation
+from otrs_gi_core.util.errors import GenericInterfaceError
+
+pytestmark = pytest.mark.unit
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    body = json.loads(request.content)
+    if request.url.path.endswith("search"):
+        return httpx.Response(200, json={"TicketID": [1, 2, 3]})
+    if body.get("TicketID") == 14:
+        time.sleep(0.05)
+        raise httpx.ReadTimeout("slow server", request=request)
+    if body.get("TicketID") == 13:
+        return httpx.Response(200, json={"Error": {"ErrorCode": "TicketGet.AccessDenied", "ErrorMessage": "no"}})
+    return httpx.Response(200, json={"Ticket": [{"TicketID": body["TicketID"], "Title": "t" * 100}]})
+
+
+class RecordingHook(RequestHook):
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, RequestEvent]] = []
+
+    def before_send(self, event: RequestEvent) -> None:
+        self.calls.append(("before_send", event))
+
+    def after_response(self, event: RequestEvent) -> None:
+        self.calls.append(("after_response", event))
+
+    def on_error(self, event: RequestEvent) -> None:
+        self.calls.append(("on_error", event))
+
+
+def make_client(**kwargs) -> GenericInterfaceClient:
+    config = ClientConfig(
+        base_url="https://example.org/otrs",
+        webservice_name="WS",
+        operation_url_map={TicketOperation.SEARCH: "search", TicketOperation.GET: "get"},
+    )
+    client = GenericInterfaceClient(config, client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), **kwargs)
+    client.login(BasicAuth(user_login="agent", password="pw"))
+    return client
+
+
+async def test_hooks_receive_phase_timings_and_sizes() -> None:
+    hook = RecordingHook()
+    client = make_client(hooks=[hook])
+
+    tickets = await client.search_and_get(TicketSearch())
+
+    assert [t.id for t in tickets] == [1, 2, 3]
+    completed = [event for name, event in hook.calls if name == "after_response"]
+    assert len(completed) == 4
+    assert len({event.request_id for event in completed}) == 4
+    get_event = next(e for e in completed if e.operation == TicketOperation.GET)
+    assert get_event.status_code == 200
+    assert get_event.url.endswith("/Webservice/WS/get")
+    assert get_event.request_bytes > 0 and get_event.response_bytes > 100
+    timings = get_event.timings
+    assert min(timings.serialize, timings.network, timings.decode, timings.validate, timings.map) > 0
+    assert timings.total >= timings.network
+    assert [name for name, e in hook.calls if e is get_event] == ["before_send", "after_response"]
+
+
+async def test_on_error_receives_failed_request_and_broken_hooks_are_ignored() -> None:
+    class BrokenHook(RequestHook):
+        def before_send(self, event: RequestEvent) -> None:
+            raise ValueError("hook bug")
+
+    hook = RecordingHook()
+    client = make_client(hooks=[BrokenHook()])
+    client.add_hook(hook)
+
+    with pytest.raises(GenericInterfaceError):
+        await client.get_ticket(13)
+
+    (name, event), = [(n, e) for n, e in hook.calls if n != "before_send"]
+    assert name == "on_error"
+    assert isinstance(event.error, GenericInterfaceError)
+    assert event.timings.decode > 0 and event.timings.map == 0
+
+
+async def test_on_error_times_a_timeout_up_to_the_failure() -> None:
+    hook = RecordingHook()
+    client = make_client(hooks=[hook])
+
+    with pytest.raises(httpx.ReadTimeout):
+        await client.get_ticket(14)
+
+    (name, event), = [(n, e) for n, e in hook.calls if n != "before_send"]
+    assert name == "on_error"
+    assert event.timings.network >= 0.05
+    assert event.timings.total >= event.timings.network and event.timings.decode == 0
+
+
+async def test_no_events_are_built_without_hooks(monkeypatch) -> None:
+    def fail(*args, **kwargs):
+        raise AssertionError("RequestEvent created without hooks")
+
+    monkeypatch.setattr(generic_interface_client, "RequestEvent", fail)
+    client = make_client()
+
+    assert len(await client.search_and_get(TicketSearch())) == 3
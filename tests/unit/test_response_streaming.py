@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import json
+import random
+import time
+
+import httpx
+import pytest
+
+from otrs_gi_core.clients.generic_interface_client import GenericInterfaceClient
+from otrs_gi_core.clients.hooks import RequestEvent, RequestHook
+from otrs_gi_core.clients.memory_profiling import MemoryProfiler
+from otrs_gi_core.clients.tracing import Span, Tracer
+from otrs_gi_core.domain_models.basic_auth_model import BasicAuth
+from otrs_gi_core.domain_models.client_config import ClientConfig
+from otrs_gi_core.domain_models.ticket_operation import TicketOperation
+from otrs_gi_core.testing import FakeGenericInterface
+from otrs_gi_core.testing.dataset import DatasetConfig, generate_raw_tickets
+from otrs_gi_core.testing.fake_server import DEFAULT_OPERATION_URL_MAP
+from otrs_gi_core.util.errors import GenericInterfaceError, ResponseTooLargeError
+from otrs_gi_core.util.json_stream import JsonArrayItemSplitter
+
+pytestmark = pytest.mark.unit
+
+TICKET = {"TicketID": 1, "Title": 'quote " and ] }, \\ backslash', "Article": [{"ArticleID": 1, "Body": "[{,:}]"}]}
+
+
+def split_in_chunks(document: dict, chunk_size: int, **kwargs) -> tuple[list[dict], dict]:
+    raw = json.dumps(document, **kwargs).encode()
+    splitter = JsonArrayItemSplitter("Ticket")
+    items = []
+    for start in range(0, len(raw), chunk_size):
+        items += splitter.feed(raw[start:start + chunk_size])
+    splitter.close()
+    return [json.loads(item) for item in items], splitter.members
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 4096])
+def test_splitter_yields_items_across_chunk_boundaries(chunk_size: int) -> None:
+    document = {"Meta": {"a": [1, {"b": None}]}, "Ticket": [TICKET, {"TicketID": 2}, [3], "é"], "Tail": 1.5}
+
+    items, members = split_in_chunks(document, chunk_size, indent=random.Random(chunk_size).choice([None, 2]))
+
+    assert items == document["Ticket"]
+    assert members == {"Meta": document["Meta"], "Tail": 1.5}
+
+
+def test_splitter_collects_errors_and_rejects_truncated_or_oversized_input() -> None:
+    assert split_in_chunks({"Error": {"ErrorCode": "TicketGet.AccessDenied"}}, 3) == (
+        [], {"Error": {"ErrorCode": "TicketGet.AccessDenied"}}
+    )
+    with pytest.raises(ValueError, match="truncated"):
+        JsonArrayItemSplitter("Ticket").close()
+    splitter = JsonArrayItemSplitter("Ticket", max_item_bytes=50)
+    splitter.feed(b'{"Ticket": [{"TicketID": 1}, {"Title": "')
+    with pytest.raises(ResponseTooLargeError):
+        splitter.feed(b"x" * 60)
+
+
+def make_client(transport: httpx.AsyncBaseTransport, **kwargs) -> GenericInterfaceClient:
+    config = ClientConfig(
+        base_url="https://example.org/otrs",
+        webservice_name="FakeWebservice",
+        operation_url_map=DEFAULT_OPERATION_URL_MAP,
+    )
+    client = GenericInterfaceClient(config, client=httpx.AsyncClient(transport=transport), **kwargs)
+    client.login(BasicAuth(user_login="agent", password="pw"))
+    return client
+
+
+async def test_size_limit_aborts_while_reading_and_on_content_length() -> None:
+    body = json.dumps({"Ticket": [TICKET]}).encode()
+    sent_chunks = []
+
+    async def chunks():
+        for start in range(0, len(body), 16):
+            sent_chunks.append(start)
+            yield body[start:start + 16]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("X-Declared"):
+            return httpx.Response(200, headers={"Content-Length": "999999"}, content=chunks())
+        return httpx.Response(200, content=chunks())
+
+    limited = make_client(httpx.MockTransport(handler), max_response_bytes=40)
+    with pytest.raises(ResponseTooLargeError) as streamed:
+        await limited.get_ticket(1)
+    assert streamed.value.size > 40 and len(sent_chunks) == 3
+
+    sent_chunks.clear()
+    with pytest.raises(ResponseTooLargeError) as declared:
+        await limited._request_limited("POST", "https://example.org/", {}, {"X-Declared": "1"}, "id")
+    assert declared.value.size == 999999 and sent_chunks == []
+
+    ticket = await make_client(httpx.MockTransport(handler), max_response_bytes=len(body)).get_ticket(1)
+    assert ticket.title == TICKET["Title"]
+
+
+class RecordingHook(RequestHook):
+    def __init__(self) -> None:
+        self.events: list[tuple[str, RequestEvent]] = []
+
+    def after_response(self, event: RequestEvent) -> None:
+        self.events.append(("after_response", event))
+
+    def on_error(self, event: RequestEvent) -> None:
+        self.events.append(("on_error", event))
+
+
+async def test_iter_tickets_streams_a_multi_ticket_get() -> None:
+    server = FakeGenericInterface()
+    server.store.insert_many(generate_raw_tickets(DatasetConfig(tickets=6, seed=11)))
+    hook = RecordingHook()
+    client = make_client(server.mock_transport(), hooks=[hook], max_response_bytes=1_000_000)
+
+    streamed = [ticket async for ticket in client.iter_tickets([3, "1", 5])]
+    with pytest.raises(GenericInterfaceError, match="AccessDenied"):
+        [ticket async for ticket in client.iter_tickets([1, 99])]
+
+    assert [t.id for t in streamed] == [3, 1, 5]
+    assert streamed[1] == await client.get_ticket(1)
+    assert server.request_counts[TicketOperation.GET.value] == 3
+    (kind, event), (error_kind, _) = hook.events[:2]
+    assert kind == "after_response" and event.status_code == 200 and event.response_bytes > 0
+    assert error_kind == "on_error"
+
+
+async def test_iter_tickets_limits_each_ticket() -> None:
+    server = FakeGenericInterface()
+    server.store.insert_many(generate_raw_tickets(DatasetConfig(tickets=2, seed=11)))
+    client = make_client(server.mock_transport(), max_response_bytes=100)
+
+    with pytest.raises(ResponseTooLargeError):
+        [ticket async for ticket in client.iter_tickets([1, 2])]
+
+
+class ListExporter:
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def close(self) -> None:
+        pass
+
+
+class HeaderRecordingTransport(httpx.AsyncBaseTransport):
+    def __init__(self, inner: httpx.AsyncBaseTransport) -> None:
+        self.inner = inner
+        self.headers: list[httpx.Headers] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.headers.append(request.headers)
+        return await self.inner.handle_async_request(request)
+
+
+async def test_iter_tickets_is_instrumented_like_other_calls() -> None:
+    server = FakeGenericInterface()
+    server.store.insert_many(generate_raw_tickets(DatasetConfig(tickets=3, seed=11)))
+    transport = HeaderRecordingTransport(server.mock_transport())
+    exporter = ListExporter()
+    tracer = Tracer(exporter)
+    hook, profiler = RecordingHook(), MemoryProfiler()
+    client = make_client(transport, hooks=[hook, profiler], tracer=tracer)
+
+    with profiler:
+        async for _ in client.iter_tickets([1, 2, 3]):
+            with tracer.start_span("caller"):
+                pass
+
+    [(kind, event)] = hook.events
+    assert kind == "after_response" and event.status_code == 200
+    timings = event.timings
+    assert timings.network > 0 and timings.decode > 0 and timings.validate > 0 and timings.map > 0
+    assert event.memory is not None and event.memory.ws_models > 0 and event.memory.articles > 0
+    assert profiler.report().operations["TicketGet"].calls == 1
+    stream_span = exporter.spans[-1]
+    assert [span.parent_id for span in exporter.spans[:-1]] == [None] * 3
+    assert stream_span.attributes["http.status_code"] == 200 and stream_span.attributes["otrs_gi.tickets"] == 3
+    assert transport.headers[0]["traceparent"] == stream_span.traceparent
+    assert transport.headers[0]["x-request-id"] == event.request_id == stream_span.attributes["otrs_gi.request_id"]
+
+
+async def test_iter_tickets_prefers_the_error_payload_over_the_http_status() -> None:
+    exporter = ListExporter()
+    hook = RecordingHook()
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(500, json={"Error": {"ErrorCode": "TicketGet.AuthFail", "ErrorMessage": "x"}})
+    )
+    client = make_client(transport, hooks=[hook], tracer=Tracer(exporter))
+
+    with pytest.raises(GenericInterfaceError, match="AuthFail"):
+        [ticket async for ticket in client.iter_tickets([1])]
+
+    assert [kind for kind, _ in hook.events] == ["on_error"]
+    assert exporter.spans[0].error is not None and "AuthFail" in exporter.spans[0].error
+
+
+async def test_iter_tickets_times_a_failed_send() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        time.sleep(0.05)
+        raise httpx.ConnectError("unreachable", request=request)
+
+    hook = RecordingHook()
+    client = make_client(httpx.MockTransport(handler), hooks=[hook])
+
+    with pytest.raises(httpx.ConnectError):
+        [ticket async for ticket in client.iter_tickets([1])]
+
+    [(kind, event)] = hook.events
+    assert kind == "on_error" and event.timings.network >= 0.05
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from otrs_gi_core.cli.app_factory import create_cli_app
+from otrs_gi_core.domain_models.ticket_models import IdName, Ticket, TicketCreate
+from otrs_gi_core.ticket_import import (
+    completed_rows,
+    csv_row_to_ticket_create,
+    detect_format,
+    import_tickets,
+    iter_rows,
+)
+
+pytestmark = pytest.mark.unit
+
+CSV_DATA = (
+    "title,queue,queue_id,state,article_subject,article_body,df_Effort\n"
+    "First,Raw,,new,Hello,Body one,3\n"
+    "Second,,5,open,,,\n"
+)
+
+
+class FakeClient:
+    def __init__(self, *args, fail_titles=(), **kwargs) -> None:
+        self.fail_titles = set(fail_titles)
+        self.created: list[TicketCreate] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def login(self, auth) -> None:
+        pass
+
+    async def __aenter__(self) -> FakeClient:
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    async def create_ticket(self, ticket: TicketCreate) -> Ticket:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        if ticket.title in self.fail_titles:
+            raise RuntimeError("rejected")
+        self.created.append(ticket)
+        ticket_id = 100 + len(self.created)
+        return Ticket(id=ticket_id, number=f"N{ticket_id}", title=ticket.title)
+
+
+def test_csv_row_mapping() -> None:
+    rows = list(iter_rows(io.StringIO(CSV_DATA), "csv"))
+    first = csv_row_to_ticket_create(rows[0][1])
+    second = csv_row_to_ticket_create(rows[1][1])
+
+    assert first.queue == IdName(name="Raw")
+    assert first.article is not None and first.article.subject == "Hello"
+    assert first.dynamic_fields == {"Effort": "3"}
+    assert second.queue == IdName(id=5)
+    assert second.article is None
+    assert detect_format("x.jsonl") == "ndjson"
+
+
+async def test_import_records_results_and_bounds_concurrency() -> None:
+    client = FakeClient(fail_titles={"T3"})
+    source = io.StringIO("".join(json.dumps({"title": f"T{i}"}) + "\n" for i in range(1, 11)) + "{broken\n")
+    results = io.StringIO()
+
+    created, failed = await import_tickets(client, iter_rows(source, "ndjson"), "ndjson", results, concurrency=2)
+
+    entries = {e["row"]: e for e in map(json.loads, results.getvalue().splitlines())}
+    assert (created, failed) == (9, 2)
+    assert client.max_in_flight <= 2
+    assert entries[3]["error"] == "rejected"
+    assert entries[11]["error"].startswith("invalid row")
+    assert entries[1]["ticket_id"] >= 101
+
+
+def test_import_tickets_command_resumes(tmp_path, monkeypatch) -> None:
+    clients: list[FakeClient] = []
+
+    def make_client(*args, **kwargs) -> FakeClient:
+        clients.append(FakeClient())
+        return clients[-1]
+
+    monkeypatch.setattr("otrs_gi_core.clients.generic_interface_client.GenericInterfaceClient", make_client)
+    app = create_cli_app(product_label="Znuny", detect_environment=lambda: None)
+    source = tmp_path / "tickets.csv"
+    source.write_text(CSV_DATA, encoding="utf-8")
+    results = tmp_path / "results.ndjson"
+    results.write_text('{"row": 1, "ticket_id": 7}\n{"row": 2, "err', encoding="utf-8")
+
+    outcome = CliRunner().invoke(
+        app,
+        [
+            "import-tickets", str(source), "--results", str(results), "--resume",
+            "--base-url", "https://example.org", "--webservice", "WS", "--user", "agent", "--password", "pw",
+        ],
+    )
+
+    assert outcome.exit_code == 0, outcome.output
+    assert [t.title for t in clients[0].created] == ["Second"]
+    assert completed_rows(results) == {1, 2}
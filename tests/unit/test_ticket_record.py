@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from otrs_gi_core.clients.generic_interface_client import GenericInterfaceClient
+from otrs_gi_core.domain_models.basic_auth_model import BasicAuth
+from otrs_gi_core.domain_models.client_config import ClientConfig
+from otrs_gi_core.domain_models.ticket_models import IdName, TicketSearch
+from otrs_gi_core.domain_models.ticket_operation import TicketOperation
+from otrs_gi_core.domain_models.ticket_record import TicketRecord
+from otrs_gi_core.mappers import from_ws_ticket_detail, from_ws_ticket_record
+from otrs_gi_core.models.response_models import WsTicketGetResponse, WsTicketSearchResponse
+from otrs_gi_core.models.ticket_models import WsArticleDetail, WsTicketOutput
+
+pytestmark = pytest.mark.unit
+
+
+def make_wire(ticket_id: int) -> WsTicketOutput:
+    return WsTicketOutput(
+        TicketID=ticket_id,
+        TicketNumber=f"N{ticket_id}",
+        Title="Title",
+        QueueID=2,
+        Queue="".join(["Ra", "w"]),
+        State="".join(["ne", "w"]),
+        PriorityID=3,
+        Priority="3 normal",
+        Created="2025-01-02 03:04:05",
+        Article=[WsArticleDetail(ArticleID=1, Subject="S")],
+    )
+
+
+def test_record_is_tuple_backed_without_instance_dict() -> None:
+    record = from_ws_ticket_record(make_wire(1))
+    assert isinstance(record, tuple)
+    assert not hasattr(record, "__dict__")
+    assert record.articles is None
+
+
+def test_record_without_ticket_id_is_rejected() -> None:
+    with pytest.raises(ValueError, match="TicketID"):
+        from_ws_ticket_record(WsTicketOutput(Title="no id"))
+    with pytest.raises(ValueError):
+        from_ws_ticket_detail(WsTicketOutput(Title="no id"))
+
+
+def test_record_names_are_interned() -> None:
+    first = from_ws_ticket_record(make_wire(1))
+    second = from_ws_ticket_record(make_wire(2))
+    assert first.queue == "Raw"
+    assert first.queue is second.queue
+    assert first.state is second.state
+
+
+def test_record_converts_to_full_ticket() -> None:
+    wire = make_wire(5)
+    record = from_ws_ticket_record(wire, include_articles=True)
+
+    ticket = record.to_ticket()
+
+    assert ticket == from_ws_ticket_detail(wire)
+    assert ticket.queue == IdName(id=2, name="Raw")
+    assert TicketRecord.from_ticket(ticket) == record
+
+
+async def test_search_and_get_records_skips_articles() -> None:
+    client = GenericInterfaceClient(
+        ClientConfig(
+            base_url="https://example.org",
+            webservice_name="Service",
+            operation_url_map={TicketOperation.GET: "ticket-get", TicketOperation.SEARCH: "ticket-search"},
+        ),
+        client=AsyncMock(),
+    )
+    client.login(BasicAuth(user_login="user", password="pass"))
+    sent: list[dict[str, Any]] = []
+
+    async def fake_send(method, operation, response_model, data=None):  # type: ignore[no-untyped-def]
+        sent.append(data)
+        if operation == TicketOperation.SEARCH:
+            return WsTicketSearchResponse(TicketID=[1, 2])
+        return WsTicketGetResponse(Ticket=[make_wire(data["TicketID"])])
+
+    client._send = fake_send  # type: ignore[method-assign]
+
+    records = await client.search_and_get_records(TicketSearch())
+
+    assert [r.id for r in records] == [1, 2]
+    assert all(r.articles is None for r in records)
+    assert all(d["AllArticles"] == 0 for d in sent[1:])
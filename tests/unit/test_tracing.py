@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from otrs_gi_core.clients.generic_interface_client import GenericInterfaceClient
+from otrs_gi_core.clients.tracing import (
+    JsonLinesSpanExporter,
+    Span,
+    SpanExporter,
+    Tracer,
+    parse_traceparent,
+)
+from otrs_gi_core.domain_models.basic_auth_model import BasicAuth
+from otrs_gi_core.domain_models.client_config import ClientConfig
+from otrs_gi_core.domain_models.ticket_models import TicketSearch
+from otrs_gi_core.domain_models.ticket_operation import TicketOperation
+from otrs_gi_core.util.errors import GenericInterfaceError
+
+pytestmark = pytest.mark.unit
+
+
+class ListExporter:
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def close(self) -> None:
+        pass
+
+
+def make_client(tracer: Tracer, seen_headers: list[httpx.Headers]) -> GenericInterfaceClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers)
+        body = json.loads(request.content)
+        if request.url.path.endswith("search"):
+            return httpx.Response(200, json={"TicketID": [1, 2]})
+        if body["TicketID"] == 13:
+            return httpx.Response(200, json={"Error": {"ErrorCode": "TicketGet.NotFound", "ErrorMessage": "no"}})
+        return httpx.Response(200, json={"Ticket": [{"TicketID": body["TicketID"]}]})
+
+    config = ClientConfig(
+        base_url="https://example.org/otrs",
+        webservice_name="WS",
+        operation_url_map={TicketOperation.SEARCH: "search", TicketOperation.GET: "get"},
+    )
+    client = GenericInterfaceClient(
+        config, client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), tracer=tracer
+    )
+    client.login(BasicAuth(user_login="agent", password="pw"))
+    return client
+
+
+async def test_search_and_get_spans_share_a_trace_and_propagate_traceparent() -> None:
+    exporter = ListExporter()
+    headers: list[httpx.Headers] = []
+    client = make_client(Tracer(exporter), headers)
+
+    await client.search_and_get(TicketSearch())
+
+    root = exporter.spans[-1]
+    children = exporter.spans[:-1]
+    assert root.name == "search_and_get" and root.parent_id is None
+    assert root.attributes["otrs_gi.ticket_count"] == 2
+    assert sorted(s.name for s in children) == ["WS GET", "WS GET", "WS SEARCH"]
+    assert {s.trace_id for s in children} == {root.trace_id}
+    assert {s.parent_id for s in children} == {root.span_id}
+    sent = {h["traceparent"]: h["x-request-id"] for h in headers}
+    assert {s.traceparent: s.attributes["otrs_gi.request_id"] for s in children} == sent
+    assert all(s.attributes["http.status_code"] == 200 and s.end_ns >= s.start_ns for s in children)
+
+
+async def test_failed_request_marks_span_as_error() -> None:
+    exporter = ListExporter()
+    client = make_client(Tracer(exporter), [])
+
+    with pytest.raises(GenericInterfaceError):
+        await client.get_ticket(13)
+
+    assert exporter.spans[0].error == "GenericInterfaceError: TicketGet.NotFound: no"
+
+
+async def test_client_without_tracer_sends_no_trace_headers() -> None:
+    headers: list[httpx.Headers] = []
+    client = make_client(Tracer(ListExporter()), headers)
+    client.tracer = None
+
+    await client.get_ticket(1)
+
+    assert "traceparent" not in headers[0] and "x-request-id" not in headers[0]
+
+
+def test_json_lines_exporter_appends_one_span_per_line(tmp_path: Path) -> None:
+    path = tmp_path / "traces" / "spans.jsonl"
+    exporter = JsonLinesSpanExporter(path)
+    assert isinstance(exporter, SpanExporter) and isinstance(ListExporter(), SpanExporter)
+    tracer = Tracer(exporter)
+    upstream = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+
+    with tracer.start_span("outer", traceparent=upstream):
+        with tracer.start_span("inner", {"k": "v"}):
+            pass
+    tracer.close()
+
+    inner, outer = [json.loads(line) for line in path.read_text().splitlines()]
+    assert outer["trace_id"] == inner["trace_id"] == "4bf92f3577b34da6a3ce929d0e0e4736"
+    assert outer["parent_id"] == "00f067aa0ba902b7"
+    assert inner["parent_id"] == outer["span_id"]
+    assert inner["attributes"] == {"k": "v"} and inner["status"] == "ok"
+
+
+@pytest.mark.parametrize(
+    "header",
+    ["", "01-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01", "00-xyz-00f067aa0ba902b7-01",
+     "00-00000000000000000000000000000000-00f067aa0ba902b7-01"],
+)
+def test_parse_traceparent_rejects_invalid_headers(header: str) -> None:
+    assert parse_traceparent(header) is None
+
+
+def test_opentelemetry_exporter_keeps_span_ids() -> None:
+    pytest.importorskip("opentelemetry.sdk")
+    from otrs_gi_core.clients.tracing import OpenTelemetrySpanExporter
+
+    class Processor:
+        def __init__(self) -> None:
+            self.ended = []
+
+        def on_end(self, span) -> None:
+            self.ended.append(span)
+
+        def shutdown(self) -> None:
+            pass
+
+    processor = Processor()
+    tracer = Tracer(OpenTelemetrySpanExporter(processor))
+    with tracer.start_span("outer") as outer:
+        pass
+
+    assert format(processor.ended[0].context.span_id, "016x") == outer.span_id